@@ -17,9 +17,9 @@ This fixes:
 """
 
 import asyncio
+import functools
 import json
 import queue
-import re
 import threading
 import time
 import traceback
@@ -29,9 +29,9 @@ from pathlib import Path
 # ── Light imports only at module level ───────────────────────────────────────
 from scraperUtils import (
     OUTPUT_DIR,
-    BACKEND_URL,
     check_robots_txt,
     resolve_source_name,
+    safe_filename,
 )
 
 # ── Sequential pacing ────────────────────────────────────────────────────────
@@ -68,72 +68,14 @@ def _get_extractors():
     global _extractors
     if _extractors is None:
         from scraperExtractors import (
-            extract_eventcalendarapp,
-            extract_timely,
-            extract_bok_center,
-            extract_circle_cinema_events,
-            extract_expo_square_events,
-            extract_eventbrite_api_events,
-            extract_simpleview_events,
-            extract_sitewrench_events,
-            extract_recdesk_events,
-            extract_ticketleap_events,
-            extract_libnet_events,
-            extract_philbrook_events,
-            extract_tulsapac_events,
-            extract_roosterdays_events,
-            extract_tulsabrunchfest_events,
-            extract_okeq_events,
-            extract_flywheel_events,
-            extract_arvest_events,
-            extract_tulsatough_events,
-            extract_gradient_events,
-            extract_tulsafarmersmarket_events,
-            extract_okcastle_events,
-            extract_broken_arrow_events,
-            extract_tulsazoo_events,
-            extract_hardrock_tulsa_events,
-            extract_gypsy_events,
-            extract_badass_renees_events,
-            extract_rocklahoma_events,
-            extract_tulsa_oktoberfest_events,
-            extract_events_universal,
+            run_site_extractors,
+            extract_events_universal_async,
             fetch_with_httpx,
             fetch_with_playwright,
         )
         _extractors = {
-            'chain': [
-                (extract_eventcalendarapp,          "EventCalendarApp API"),
-                (extract_timely,                    "Timely API"),
-                (extract_bok_center,                "BOK Center API"),
-                (extract_circle_cinema_events,      "Circle Cinema"),
-                (extract_expo_square_events,        "Expo Square API"),
-                (extract_eventbrite_api_events,     "Eventbrite API"),
-                (extract_simpleview_events,         "Simpleview API"),
-                (extract_sitewrench_events,         "SiteWrench API"),
-                (extract_recdesk_events,            "RecDesk API"),
-                (extract_ticketleap_events,         "TicketLeap"),
-                (extract_libnet_events,             "LibNet API"),
-                (extract_philbrook_events,          "Philbrook AJAX"),
-                (extract_tulsapac_events,           "TulsaPAC API"),
-                (extract_roosterdays_events,        "RoosterDays"),
-                (extract_tulsabrunchfest_events,    "TulsaBrunchFest"),
-                (extract_okeq_events,               "OKEQ"),
-                (extract_flywheel_events,           "Flywheel"),
-                (extract_arvest_events,             "Arvest"),
-                (extract_tulsatough_events,         "TulsaTough"),
-                (extract_gradient_events,           "Gradient"),
-                (extract_tulsafarmersmarket_events, "TFM"),
-                (extract_okcastle_events,           "OKCastle"),
-                (extract_broken_arrow_events,       "BrokenArrow"),
-                (extract_tulsazoo_events,           "TulsaZoo"),
-                (extract_hardrock_tulsa_events,     "HardRockTulsa"),
-                (extract_gypsy_events,              "Gypsy"),
-                (extract_badass_renees_events,      "BadAssRenees"),
-                (extract_rocklahoma_events,         "Rocklahoma"),
-                (extract_tulsa_oktoberfest_events,  "TulsaOktoberfest"),
-            ],
-            'universal':       extract_events_universal,
+            'site':            run_site_extractors,
+            'universal':       extract_events_universal_async,
             'fetch_httpx':     fetch_with_httpx,
             'fetch_playwright': fetch_with_playwright,
         }
@@ -181,25 +123,26 @@ def _apply_future_filter(events: list) -> list:
 # ── Core extraction chain ─────────────────────────────────────────────────────
 
 async def run_extraction_chain(html: str, name: str, url: str,
-                               future_only: bool = True) -> tuple:
+                               future_only: bool = True,
+                               site_result: tuple = None) -> tuple:
+    """
+    Site extractors first, universal extractor as fallback. Pass site_result
+    when the site extractors have already been run on this page.
+    """
     ext = _get_extractors()
     events: list = []
     methods: list = []
 
-    for fn, label in ext['chain']:
-        if events:
-            break
-        try:
-            evs, detected = await fn(html, name, url, future_only)
-            if detected and evs:
-                events = evs
-                methods.append(f"{label} ({len(evs)})")
-                print(f"[{label}] {name}: {len(evs)} events")
-        except Exception as e:
-            print(f"[{label}] {name}: {e}")
+    if site_result is None:
+        site_result = await ext['site'](html, name, url, future_only)
+    evs, label = site_result
+    if evs:
+        events = evs
+        methods.append(f"{label} ({len(evs)})")
+        print(f"[{label}] {name}: {len(evs)} events")
 
     if not events:
-        univ = ext['universal'](html, url, name)
+        univ = await ext['universal'](html, url, name)
         if univ:
             if '_extraction_methods' in univ[0]:
                 methods = univ[0]['_extraction_methods']
@@ -213,6 +156,31 @@ async def run_extraction_chain(html: str, name: str, url: str,
     return events, methods
 
 
+async def _probe_static(url: str, name: str,
+                        sem_http: asyncio.Semaphore = None) -> tuple | None:
+    """
+    Try a source marked use_playwright without the browser first. Most site
+    extractors key off the domain or server-rendered markup and pull from an
+    API, so plain HTTP is enough for them. Returns (html, site_result) when a
+    site extractor recognises the static page, or None to escalate.
+    """
+    ext = _get_extractors()
+    try:
+        if sem_http:
+            async with sem_http:
+                html = await ext['fetch_httpx'](url)
+        else:
+            html = await ext['fetch_httpx'](url)
+    except Exception:
+        return None
+
+    evs, label = await ext['site'](html, name, url)
+    if not evs:
+        return None
+    print(f"[Static] {name}: {label} matched without a browser")
+    return html, (evs, label)
+
+
 # ── DB pipeline (single venue) ───────────────────────────────────────────────
 
 def _post_events_to_db(events: list, url: str, name: str,
@@ -221,9 +189,8 @@ def _post_events_to_db(events: list, url: str, name: str,
     Normalize then post events for ONE venue. Returns (db_saved, norm_ok).
     Sequential design means Gemini only handles one venue at a time.
     """
-    import httpx as _httpx
     try:
-        from scraperRoutes import normalize_batch, transform_event_for_backend
+        from scraperRoutes import normalize_batch, post_events_to_backend
     except ImportError as e:
         print(f"[DB] Import error: {e}")
         return 0, False
@@ -238,31 +205,10 @@ def _post_events_to_db(events: list, url: str, name: str,
         print(f"[DB] ⚠ Normalization failed for {name}, using raw fallback")
 
     to_post = normalized if normalized else events
-    saved = 0
-    errors = 0
-    for ev in to_post:
-        try:
-            xf = transform_event_for_backend(ev, source_priority=source_priority)
-            # Synthetic unique source_url — prevents all events collapsing onto
-            # one row when the extractor (e.g. Timely) returns no per-event URL.
-            if not xf.get('source_url'):
-                import hashlib as _hl
-                slug = f"{url}|{xf.get('title','').lower().strip()}|{xf.get('start_time','')}"
-                uid  = _hl.md5(slug.encode()).hexdigest()[:8]
-                xf['source_url'] = f"{url.rstrip('/')}#event-{uid}"
-            if not xf.get('source_name'):
-                xf['source_name'] = name
-            # Always use the admin-approved saved_urls name as canonical venue.
-            xf['venue'] = name
-            resp = _httpx.post(f"{BACKEND_URL}/api/events", json=xf, timeout=10)
-            if resp.status_code in [200, 201]:
-                saved += 1
-            else:
-                errors += 1
-        except Exception as e:
-            errors += 1
-            print(f"[DB] {name}: {e}")
-
+    # Posts go out concurrently over one pooled client; only the Gemini
+    # normalization step above needs to stay one-venue-at-a-time.
+    saved = post_events_to_backend(to_post, url, name, tag="DB", source_priority=source_priority)
+    errors = len(to_post) - saved
     print(f"[DB] {name}: {saved}/{len(to_post)} saved to DB ({errors} errors)")
     return saved, normalization_succeeded
 
@@ -302,7 +248,11 @@ async def scrape_one(entry: dict,
         ext = _get_extractors()
 
         # Use semaphore if provided (GUI mode), otherwise just fetch
-        if use_pw:
+        site_result = None
+        probe = await _probe_static(url, name, sem_http) if use_pw else None
+        if probe:
+            html, site_result = probe
+        elif use_pw:
             if sem_pw:
                 async with sem_pw:
                     html = await ext['fetch_playwright'](url)
@@ -315,7 +265,8 @@ async def scrape_one(entry: dict,
             else:
                 html = await ext['fetch_httpx'](url)
 
-        events, methods = await run_extraction_chain(html, name, url)
+        events, methods = await run_extraction_chain(html, name, url,
+                                                     site_result=site_result)
         result.update({
             'events':      events,
             'methods':     methods,
@@ -326,7 +277,7 @@ async def scrape_one(entry: dict,
         if events:
             # Save JSON backup
             ts   = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe = re.sub(r'[^\w\-]', '_', name)
+            safe = safe_filename(name)
             (OUTPUT_DIR / f"{safe}_{ts}.json").write_text(
                 json.dumps(events, indent=2), encoding='utf-8'
             )
@@ -344,7 +295,7 @@ async def scrape_one(entry: dict,
         result['error'] = str(exc)
         try:
             ts   = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe = re.sub(r'[^\w\-]', '_', name)
+            safe = safe_filename(name)
             rname = f"error_{safe}_{ts}.json"
             (OUTPUT_DIR / rname).write_text(json.dumps({
                 'url':       url,
@@ -516,8 +467,7 @@ async def scrape_all_sequential(saved: list, q: queue.Queue = None) -> dict:
         await asyncio.sleep(30)
 
         try:
-            from scraperRoutes import normalize_batch, transform_event_for_backend
-            import httpx as _httpx
+            from scraperRoutes import normalize_batch, post_events_to_backend
 
             for vr in retry_venues:
                 url  = vr['url']
@@ -527,7 +477,7 @@ async def scrape_all_sequential(saved: list, q: queue.Queue = None) -> dict:
                 events = sdata.get('events', [])
                 if not events:
                     # Try to find the most recent JSON file for this venue
-                    safe = re.sub(r'[^\w\-]', '_', name)
+                    safe = safe_filename(name)
                     json_files = sorted(OUTPUT_DIR.glob(f"{safe}_*.json"), reverse=True)
                     if json_files:
                         try:
@@ -546,25 +496,15 @@ async def scrape_all_sequential(saved: list, q: queue.Queue = None) -> dict:
                 )
 
                 print(f"[NormRetry] Retrying: {name} ({len(events)} events)")
-                normalized = normalize_batch(events, source_url=url, source_name=name)
+                normalized = await asyncio.get_event_loop().run_in_executor(
+                    None, functools.partial(normalize_batch, events, source_url=url, source_name=name)
+                )
                 if normalized:
-                    retry_saved = 0
-                    for ev in normalized:
-                        try:
-                            xf = transform_event_for_backend(ev, source_priority=prio)
-                            if not xf.get('source_url'):
-                                import hashlib as _hl
-                                slug = f"{url}|{xf.get('title','').lower().strip()}|{xf.get('start_time','')}"
-                                uid  = _hl.md5(slug.encode()).hexdigest()[:8]
-                                xf['source_url'] = f"{url.rstrip('/')}#event-{uid}"
-                            if not xf.get('source_name'): xf['source_name'] = name
-                            xf['venue'] = name
-                            resp = _httpx.post(f"{BACKEND_URL}/api/events", json=xf, timeout=10)
-                            if resp.status_code in [200, 201]:
-                                retry_saved += 1
-                                total_saved_db += 1
-                        except Exception as e:
-                            print(f"[NormRetry] {name}: {e}")
+                    retry_saved = await asyncio.get_event_loop().run_in_executor(
+                        None, functools.partial(post_events_to_backend, normalized, url, name,
+                                                tag="NormRetry", source_priority=prio)
+                    )
+                    total_saved_db += retry_saved
                     print(f"[NormRetry] {name}: {retry_saved}/{len(normalized)} saved")
                     _emit({'type': 'norm_retry_done', 'name': name, 'saved': retry_saved})
                 else:
@@ -8,21 +8,35 @@ Usage:
        SUPABASE_KEY=your-service-role-key
        GOOGLE_MAPS_API_KEY=your-google-api-key
 
-  2. pip install requests (should already be in your venv)
+  2. pip install httpx (should already be in your venv)
 
   3. python geocode_venues.py
 
 What it does:
-  - Fetches all venues that have an address but no lat/lng
-  - Geocodes each address via Google Maps Geocoding API
-  - Updates the venue row in Supabase with the coordinates
+  - Pages through venues that have an address but no lat/lng
+    (VENUE_PAGE_SIZE rows per request), starting work on each page as it
+    arrives
+  - Geocodes each address via Google Maps Geocoding API (GEOCODE_CONCURRENCY
+    lookups in flight at once, over one shared connection pool)
+  - Writes the coordinates back to Supabase in batched upserts
+  - Remembers every resolved address and venue name in a local SQLite cache
+    (GEOCODE_CACHE_PATH), so re-runs don't pay Google for them again
   - Prints a summary of what was updated vs. what failed
 """
 
+import asyncio
 import os
+import re
+import sqlite3
 import sys
 import time
-import requests
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 # Set these as environment variables or hardcode for quick testing
@@ -34,12 +48,56 @@ SUPABASE_URL = os.environ.get("SUPABASE_URL", "")
 SUPABASE_KEY = os.environ.get("SUPABASE_KEY", "")
 GOOGLE_MAPS_API_KEY = os.environ.get("GOOGLE_MAPS_API_KEY", "")
 
+# Supabase request pieces, built once rather than per call
+SUPABASE_HEADERS = {
+    "apikey": SUPABASE_KEY,
+    "Authorization": f"Bearer {SUPABASE_KEY}",
+    "Content-Type": "application/json",
+}
+VENUES_URL = f"{SUPABASE_URL}/rest/v1/venues"
+
+# PostgREST query: address is not null AND (latitude is null OR longitude is null)
+MISSING_COORDS_URL = (
+    f"{VENUES_URL}"
+    f"?address=not.is.null"
+    f"&or=(latitude.is.null,longitude.is.null)"
+    f"&select=id,name,address,city"
+    f"&order=name,id"
+)
+UPSERT_URL = f"{VENUES_URL}?on_conflict=id"
+UPSERT_HEADERS = {**SUPABASE_HEADERS, "Prefer": "resolution=merge-duplicates,return=minimal"}
+
 # Default city/state to append if not in the address already
 DEFAULT_SUFFIX = "Tulsa, OK"
 
 # Google Geocoding endpoint
 GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
+# Venues geocoded at once. Google's default quota is 50 QPS, so this stays
+# well clear of it without needing a per-request sleep.
+GEOCODE_CONCURRENCY = 10
+
+# A progress line is printed every this many venues; individual venues are
+# only printed when they fail
+PROGRESS_EVERY = 50
+
+# Venues fetched from Supabase per request (PostgREST Range paging)
+VENUE_PAGE_SIZE = 1000
+
+# Coordinates are written back to Supabase this many venues per request
+SAVE_BATCH_SIZE = 100
+
+# Resolved addresses are cached on disk, keyed by the normalized address
+GEOCODE_CACHE_PATH = os.environ.get(
+    "GEOCODE_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "geocode_cache.sqlite"),
+)
+# Normalized address -> Future for lookups currently waiting on Google
+_inflight = {}
+
+_ADDRESS_PUNCT_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def check_config():
     """Validate that all required config is set."""
@@ -60,32 +118,70 @@ def check_config():
         sys.exit(1)
 
 
-def fetch_venues_missing_coords():
-    """Fetch all venues that have an address but no coordinates."""
-    headers = {
-        "apikey": SUPABASE_KEY,
-        "Authorization": f"Bearer {SUPABASE_KEY}",
-        "Content-Type": "application/json",
-    }
+def open_geocode_cache(path=GEOCODE_CACHE_PATH):
+    """Open (creating if needed) the on-disk geocode cache."""
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE IF NOT EXISTS geo(addr TEXT PRIMARY KEY, lat REAL, lng REAL, ts INTEGER)")
+    db.execute("CREATE TABLE IF NOT EXISTS known_venues(name TEXT PRIMARY KEY, lat REAL, lng REAL, ts INTEGER)")
+    return db
+
+
+def lookup_known_venue(cache, name):
+    """Coordinates previously resolved for a venue of this name, or None."""
+    return cache.execute(
+        "SELECT lat, lng FROM known_venues WHERE name = ?", (name.strip().lower(),)
+    ).fetchone()
+
 
-    # PostgREST query: address is not null AND (latitude is null OR longitude is null)
-    url = (
-        f"{SUPABASE_URL}/rest/v1/venues"
-        f"?address=not.is.null"
-        f"&or=(latitude.is.null,longitude.is.null)"
-        f"&select=id,name,address,city"
-        f"&order=name"
+def remember_venue(cache, name, coords):
+    cache.execute(
+        "INSERT OR REPLACE INTO known_venues(name, lat, lng, ts) VALUES (?, ?, ?, ?)",
+        (name.strip().lower(), coords[0], coords[1], int(time.time())),
     )
 
-    resp = requests.get(url, headers=headers)
-    resp.raise_for_status()
-    return resp.json()
+
+def normalize_address(address):
+    """Cache key: lowercase, punctuation stripped, whitespace collapsed."""
+    return _WHITESPACE_RE.sub(" ", _ADDRESS_PUNCT_RE.sub(" ", address.lower())).strip()
 
 
-def geocode_address(address, city="Tulsa", state="OK"):
+async def iter_venues_missing_coords(client):
+    """
+    Yield (venues, total) one page at a time for venues that have an address
+    but no coordinates. total is the overall match count from the first
+    page's Content-Range, or None if PostgREST didn't report it.
+    """
+    headers = {**SUPABASE_HEADERS, "Range-Unit": "items", "Prefer": "count=exact"}
+
+    start = 0
+    total = None
+    while True:
+        headers["Range"] = f"{start}-{start + VENUE_PAGE_SIZE - 1}"
+        resp = await client.get(MISSING_COORDS_URL, headers=headers)
+        resp.raise_for_status()
+        page = resp.json()
+
+        if total is None:
+            # e.g. "0-999/1234", or "*/0" when nothing matches
+            count = resp.headers.get("content-range", "").rpartition("/")[2]
+            total = int(count) if count.isdigit() else None
+
+        if page:
+            yield page, total
+        if len(page) < VENUE_PAGE_SIZE:
+            return
+        start += VENUE_PAGE_SIZE
+        # No later page can help once the reported count is reached
+        if total is not None and start >= total:
+            return
+
+
+async def geocode_address(client, address, city="Tulsa", state="OK", cache=None):
     """
     Geocode a single address using Google Maps Geocoding API.
-    Returns (latitude, longitude) or None on failure.
+    Returns (latitude, longitude) or None on failure. When `cache` (from
+    open_geocode_cache) is given, hits skip the API call and successful
+    lookups are added to it; the caller commits.
     """
     # Build a full address string for better accuracy
     full_address = address.strip()
@@ -97,6 +193,30 @@ def geocode_address(address, city="Tulsa", state="OK"):
     elif "ok" not in lower:
         full_address = f"{full_address}, OK"
 
+    cache_key = normalize_address(full_address)
+    if cache is not None:
+        row = cache.execute("SELECT lat, lng FROM geo WHERE addr = ?", (cache_key,)).fetchone()
+        if row:
+            return row
+
+    # Venues sharing an address are geocoded concurrently; only the first
+    # one asks Google, the rest wait for its answer
+    pending = _inflight.get(cache_key)
+    if pending is not None:
+        return await pending
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
+    coords = None
+    try:
+        coords = await _geocode_with_google(client, full_address, cache_key, cache)
+    finally:
+        future.set_result(coords)
+        _inflight.pop(cache_key, None)
+    return coords
+
+
+async def _geocode_with_google(client, full_address, cache_key, cache):
     params = {
         "address": full_address,
         "key": GOOGLE_MAPS_API_KEY,
@@ -105,90 +225,127 @@ def geocode_address(address, city="Tulsa", state="OK"):
     }
 
     try:
-        resp = requests.get(GEOCODE_URL, params=params, timeout=10)
+        resp = await client.get(GEOCODE_URL, params=params)
         resp.raise_for_status()
         data = resp.json()
 
         if data["status"] == "OK" and data["results"]:
             loc = data["results"][0]["geometry"]["location"]
+            if cache is not None:
+                cache.execute(
+                    "INSERT OR REPLACE INTO geo(addr, lat, lng, ts) VALUES (?, ?, ?, ?)",
+                    (cache_key, loc["lat"], loc["lng"], int(time.time())),
+                )
             return (loc["lat"], loc["lng"])
         else:
-            print(f"  Geocoding returned status: {data['status']}")
+            print(f"  {full_address}: geocoding returned status {data['status']}")
             return None
 
     except Exception as e:
-        print(f"  Geocoding error: {e}")
+        print(f"  {full_address}: geocoding error: {e}")
         return None
 
 
-def update_venue_coords(venue_id, lat, lng):
-    """Update a venue's coordinates in Supabase."""
-    headers = {
-        "apikey": SUPABASE_KEY,
-        "Authorization": f"Bearer {SUPABASE_KEY}",
-        "Content-Type": "application/json",
-        "Prefer": "return=minimal",
-    }
-
-    url = f"{SUPABASE_URL}/rest/v1/venues?id=eq.{venue_id}"
-    payload = {"latitude": lat, "longitude": lng}
-
-    resp = requests.patch(url, json=payload, headers=headers)
+async def save_venue_coords(client, rows):
+    """
+    Write a batch of {id, name, latitude, longitude} rows to Supabase in one
+    request. PostgREST upserts on the primary key, so existing venues just
+    get their coordinates updated (name is included only to satisfy NOT NULL).
+    """
+    resp = await client.post(UPSERT_URL, json=rows, headers=UPSERT_HEADERS)
     resp.raise_for_status()
     return True
 
 
-def main():
+async def process_venue(client, cache, sem, i, total, venue):
+    """Geocode one venue. Returns (lat, lng) or None."""
+    name = venue["name"]
+    # Venues resolved on an earlier run (e.g. whose save failed, or that
+    # were re-created) are answered by name without touching Google
+    coords = lookup_known_venue(cache, name)
+    if coords:
+        return coords
+
+    async with sem:
+        coords = await geocode_address(client, venue["address"], venue.get("city", "Tulsa"), cache=cache)
+    if coords:
+        remember_venue(cache, name, coords)
+    else:
+        print(f"[{i}/{total}] ✗ {name}: could not geocode ({venue['address']})")
+    return coords
+
+
+async def run():
     check_config()
 
     print("=" * 60)
     print("Locate918 Venue Geocoder")
     print("=" * 60)
 
-    # Step 1: Fetch venues needing coordinates
-    print("\nFetching venues missing coordinates...")
-    venues = fetch_venues_missing_coords()
-
-    if not venues:
-        print("All venues already have coordinates! Nothing to do.")
-        return
-
-    print(f"Found {len(venues)} venues to geocode.\n")
-
-    # Step 2: Geocode each venue
-    success = 0
-    failed = []
-
-    for i, venue in enumerate(venues, 1):
-        name = venue["name"]
-        address = venue["address"]
-        city = venue.get("city", "Tulsa")
-
-        print(f"[{i}/{len(venues)}] {name}")
-        print(f"  Address: {address}")
-
-        coords = geocode_address(address, city)
-
-        if coords:
-            lat, lng = coords
-            print(f"  Coords:  ({lat}, {lng})")
-
+    # One client for Supabase and Google alike, so connections are reused
+    limits = httpx.Limits(max_connections=GEOCODE_CONCURRENCY * 2)
+    async with httpx.AsyncClient(timeout=10, limits=limits, http2=HTTP2_AVAILABLE) as client:
+        # Steps 1+2: Page through venues needing coordinates and geocode them
+        # concurrently, starting on each page while the next is fetched
+        print("\nFetching venues missing coordinates...")
+        sem = asyncio.Semaphore(GEOCODE_CONCURRENCY)
+        cache = open_geocode_cache()
+        venues = []
+        tasks = []
+        done = 0
+
+        def report_progress(_task):
+            nonlocal done
+            done += 1
+            if done % PROGRESS_EVERY == 0:
+                print(f"  ... {done}/{total or len(venues)} venues processed")
+
+        try:
+            async for page, total in iter_venues_missing_coords(client):
+                if not venues:
+                    print(f"Found {total if total is not None else 'some'} venues to geocode.\n")
+                for venue in page:
+                    venues.append(venue)
+                    task = asyncio.create_task(
+                        process_venue(client, cache, sem, len(venues), total or "?", venue)
+                    )
+                    task.add_done_callback(report_progress)
+                    tasks.append(task)
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave lookups running against a cache that's about to close
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            # All cache writes go out in one transaction
+            cache.commit()
+            cache.close()
+
+        if not venues:
+            print("All venues already have coordinates! Nothing to do.")
+            return
+
+        failed = [(venue["name"], "geocoding failed") for venue, coords in zip(venues, results) if not coords]
+        rows = [
+            {"id": venue["id"], "name": venue["name"], "latitude": coords[0], "longitude": coords[1]}
+            for venue, coords in zip(venues, results) if coords
+        ]
+
+        # Step 3: Save coordinates in batches. Geocodes are already cached,
+        # so a failed batch costs nothing from Google on the next run.
+        print(f"\nSaving {len(rows)} venues...")
+        for start in range(0, len(rows), SAVE_BATCH_SIZE):
+            batch = rows[start:start + SAVE_BATCH_SIZE]
             try:
-                update_venue_coords(venue["id"], lat, lng)
-                print(f"  ✓ Updated!")
-                success += 1
+                await save_venue_coords(client, batch)
             except Exception as e:
-                print(f"  ✗ Failed to save: {e}")
-                failed.append((name, "save error"))
-        else:
-            print(f"  ✗ Could not geocode")
-            failed.append((name, "geocoding failed"))
+                print(f"  ✗ Failed to save {len(batch)} venues: {e}")
+                failed.extend((row["name"], "save error") for row in batch)
 
-        # Small delay to respect API rate limits
-        if i < len(venues):
-            time.sleep(0.2)
+    success = len(venues) - len(failed)
 
-    # Step 3: Summary
+    # Step 4: Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
@@ -207,5 +364,9 @@ def main():
     print("\nDone! Your Leaflet map should now show accurate pins.")
 
 
+def main():
+    asyncio.run(run())
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
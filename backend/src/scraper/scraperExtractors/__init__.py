@@ -22,6 +22,7 @@ File layout:
                           AXS, Etix, GCal, Squarespace, etc.
   genericExtractors.py  — Repeating structure + date proximity fallbacks
   universal.py          — Orchestrator chaining all extractors
+  extractorRegistry.py  — Ordered site-extractor table + concurrent selector
   fetchers.py           — fetch_with_httpx, fetch_with_playwright
 """
 
@@ -85,7 +86,10 @@ from .venueExtractors import (
 )
 
 # Universal fallback
-from .universal import extract_events_universal
+from .universal import extract_events_universal, extract_events_universal_async
+
+# Site-specific extractor table shared by /scrape and Scrape All
+from .extractorRegistry import SITE_EXTRACTORS, run_site_extractors
 
 # Fetch helpers
 from .fetchers import fetch_with_httpx, fetch_with_playwright
@@ -113,5 +117,7 @@ __all__ = [
     'extract_magic_city_books_events', 'extract_spotlight_theater_events',
     'extract_tulsamayfest_events', 'extract_tulsa_oktoberfest_events',
     'extract_rocklahoma_events',
-    'extract_events_universal', 'fetch_with_httpx', 'fetch_with_playwright',
+    'extract_events_universal', 'extract_events_universal_async',
+    'SITE_EXTRACTORS', 'run_site_extractors',
+    'fetch_with_httpx', 'fetch_with_playwright',
 ]
\ No newline at end of file
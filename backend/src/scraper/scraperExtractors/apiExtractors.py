@@ -13,6 +13,7 @@ import re
 import json
 import asyncio
 from datetime import datetime, timezone as _tz
+from itertools import islice
 import pytz
 from urllib.parse import urlparse, urljoin
 import httpx
@@ -550,9 +551,13 @@ KNOWN_BOK_VENUES = {
     'www.bokcenter.com': True,
 }
 
+_BOK_MONTH_RE = re.compile(r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec')
+
 
 async def fetch_bok_center_events(max_pages: int = 20) -> list:
-    all_events = []
+    # Keyed on the detail URL: pages repeat featured events, and insertion
+    # order keeps the first sighting, same as extract_bok_center's dedup.
+    events_by_url: dict[str, dict] = {}
     offset = 0
     per_page = 6
 
@@ -579,33 +584,29 @@ async def fetch_bok_center_events(max_pages: int = 20) -> list:
                     break
 
                 for title_link in titles:
-                    title = title_link.get_text(strip=True)
                     href = title_link.get('href', '')
-                    if not title or not href or '/events/detail/' not in href:
+                    if not href or '/events/detail/' not in href:
+                        continue
+                    full_url = href if href.startswith('http') else f"https://www.bokcenter.com{href}"
+                    if full_url in events_by_url or not (title := title_link.get_text(strip=True)):
                         continue
 
-                    container = title_link.parent
                     date_str = ''
-                    for _ in range(8):
-                        if container is None:
+                    for container in islice(title_link.parents, 8):
+                        span_texts = [s.get_text(strip=True) for s in container.find_all('span', recursive=True)]
+                        joined = ' '.join(span_texts)
+                        if _BOK_MONTH_RE.search(joined):
+                            date_str = re.sub(r'\s+', ' ', joined).strip()
                             break
-                        spans = container.find_all('span', recursive=True)
-                        span_texts = [s.get_text(strip=True) for s in spans]
-                        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                        if any(m in ' '.join(span_texts) for m in months):
-                            date_str = re.sub(r'\s+', ' ', ' '.join(span_texts)).strip()
-                            break
-                        container = container.parent
 
-                    full_url = href if href.startswith('http') else f"https://www.bokcenter.com{href}"
-                    all_events.append({'title': title, 'date': date_str, 'source_url': full_url})
+                    events_by_url[full_url] = {'title': title, 'date': date_str, 'source_url': full_url}
 
                 offset += per_page
             except Exception as e:
                 print(f"BOK Center API error at offset {offset}: {e}")
                 break
 
-    return all_events
+    return list(events_by_url.values())
 
 
 def _parse_bok_multi_day_date(date_str: str) -> tuple:
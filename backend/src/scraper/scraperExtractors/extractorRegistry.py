@@ -0,0 +1,106 @@
+"""
+Locate918 Scraper - Site Extractor Registry
+============================================
+The ordered table of site-specific extractors shared by /scrape and the
+Scrape All pipeline, plus the selector that runs them.
+
+Every entry has the same signature:
+    async fn(html, source_name, url, future_only) -> (events, detected)
+and returns ([], False) quickly unless it recognises the page, so they are
+probed concurrently and the first hit in table order wins.
+"""
+
+import asyncio
+
+from .apiExtractors import (
+    extract_eventcalendarapp,
+    extract_timely,
+    extract_bok_center,
+)
+from .cmsApiExtractors import (
+    extract_expo_square_events,
+    extract_eventbrite_api_events,
+    extract_simpleview_events,
+    extract_sitewrench_events,
+    extract_recdesk_events,
+    extract_ticketleap_events,
+    extract_circle_cinema_events,
+    extract_libnet_events,
+    extract_philbrook_events,
+    extract_tulsapac_events,
+)
+from .festivalExtractors import (
+    extract_roosterdays_events,
+    extract_tulsabrunchfest_events,
+    extract_okeq_events,
+    extract_flywheel_events,
+    extract_arvest_events,
+    extract_tulsatough_events,
+    extract_gradient_events,
+    extract_tulsafarmersmarket_events,
+    extract_okcastle_events,
+    extract_broken_arrow_events,
+    extract_tulsazoo_events,
+    extract_hardrock_tulsa_events,
+    extract_gypsy_events,
+    extract_badass_renees_events,
+)
+from .venueExtractors import (
+    extract_tulsa_oktoberfest_events,
+    extract_rocklahoma_events,
+)
+
+
+# Priority order: when more than one extractor claims a page, the earlier
+# entry wins.
+SITE_EXTRACTORS = (
+    (extract_eventcalendarapp,          "EventCalendarApp API"),
+    (extract_timely,                    "Timely API"),
+    (extract_bok_center,                "BOK Center API"),
+    (extract_circle_cinema_events,      "Circle Cinema"),
+    (extract_expo_square_events,        "Expo Square API"),
+    (extract_eventbrite_api_events,     "Eventbrite API"),
+    (extract_simpleview_events,         "Simpleview API"),
+    (extract_sitewrench_events,         "SiteWrench API"),
+    (extract_recdesk_events,            "RecDesk API"),
+    (extract_ticketleap_events,         "TicketLeap"),
+    (extract_libnet_events,             "LibNet API"),
+    (extract_philbrook_events,          "Philbrook AJAX"),
+    (extract_tulsapac_events,           "TulsaPAC API"),
+    (extract_roosterdays_events,        "RoosterDays"),
+    (extract_tulsabrunchfest_events,    "TulsaBrunchFest"),
+    (extract_okeq_events,               "OKEQ"),
+    (extract_flywheel_events,           "Flywheel"),
+    (extract_arvest_events,             "Arvest"),
+    (extract_tulsatough_events,         "TulsaTough"),
+    (extract_gradient_events,           "Gradient"),
+    (extract_tulsafarmersmarket_events, "TFM"),
+    (extract_okcastle_events,           "OKCastle"),
+    (extract_broken_arrow_events,       "BrokenArrow"),
+    (extract_tulsazoo_events,           "TulsaZoo"),
+    (extract_hardrock_tulsa_events,     "HardRockTulsa"),
+    (extract_gypsy_events,              "Gypsy"),
+    (extract_badass_renees_events,      "BadAssRenees"),
+    (extract_rocklahoma_events,         "Rocklahoma"),
+    (extract_tulsa_oktoberfest_events,  "TulsaOktoberfest"),
+)
+
+
+async def run_site_extractors(html: str, source_name: str, url: str,
+                              future_only: bool = True) -> tuple[list, str | None]:
+    """
+    Probe every site-specific extractor concurrently.
+    Returns (events, label) for the highest-priority hit, or ([], None).
+    """
+    results = await asyncio.gather(
+        *(fn(html, source_name, url, future_only) for fn, _ in SITE_EXTRACTORS),
+        return_exceptions=True,
+    )
+    for (_, label), result in zip(SITE_EXTRACTORS, results):
+        if isinstance(result, Exception):
+            print(f"[{label}] {source_name}: {result}")
+            continue
+        events, detected = result
+        if detected and events:
+            return events, label
+    return [], None
@@ -9,10 +9,16 @@ now validates that the response is actually JSON before injecting it.
 Previously, non-TNEW sites returned HTML which caused JSON parse errors.
 """
 
+import asyncio
 import json
 import os
+import re
+import time
 import httpx
-from scraperUtils import HEADERS
+from bs4 import BeautifulSoup
+from scraperUtils import HEADERS, HTML_PARSER
+
+from .platformExtractors import extract_etix_events
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -47,6 +53,27 @@ _PROXY_VENUES: tuple = (
 )
 
 
+# ──────────────────────────────────────────────────────────────────────
+# Render-wait selectors
+# ──────────────────────────────────────────────────────────────────────
+# Shared by every page.wait_for_selector call so each platform always
+# waits on the same selector string.
+SEL_ETIX_CARD = (
+    '[class*="performance"], [class*="event-card"], [class*="MuiCard"], '
+    '[class*="event"], [class*="upcoming"], [class*="EventCard"], '
+    '[class*="listing"], a[href*="/ticket/p/"], h3, h4'
+)
+SEL_TICKETLEAP_CARD = 'button, a[href*="/tickets/"], [class*="event"]'
+SEL_TICKETTAILOR_CARD = (
+    '[class*="event"], [class*="listing"], [class*="card"], '
+    'a[href*="/events/"], a[href*="/tickets/"]'
+)
+SEL_EVENT_CARD = (
+    '[class*="event"], [class*="calendar"], [class*="timely"], '
+    'iframe[src*="calendar.google.com"]'
+)
+
+
 def _proxy_for_url(url: str) -> dict | None:
     """Return a Playwright `proxy=` config dict for URLs that need residential
     egress, or None to egress directly. Gated on RESIDENTIAL_PROXY_URL env var:
@@ -72,24 +99,169 @@ def _proxy_for_url(url: str) -> dict | None:
     return cfg
 
 
+# ──────────────────────────────────────────────────────────────────────
+# httpx transport tuning
+# ──────────────────────────────────────────────────────────────────────
+# HTTP/2 needs the `h2` package (httpx[http2]); brotli decoding needs
+# `brotli`. Both are in requirements.txt, but degrade gracefully so a bare
+# local install still works over HTTP/1.1 with gzip.
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+HTTPX_HEADERS = {'Accept-Encoding': _ACCEPT_ENCODING, **HEADERS}
+HTTPX_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0)
+
+
 async def fetch_with_httpx(url: str) -> str:
     """Fetch a page using httpx (no JavaScript rendering)."""
-    async with httpx.AsyncClient(headers=HEADERS, timeout=30, follow_redirects=True) as client:
+    async with httpx.AsyncClient(headers=HTTPX_HEADERS, timeout=30, follow_redirects=True,
+                                 http2=HTTP2_AVAILABLE, limits=HTTPX_LIMITS) as client:
         resp = await client.get(url)
         resp.raise_for_status()
         return resp.text
 
 
+# ──────────────────────────────────────────────────────────────────────
+# Etix direct API
+# ──────────────────────────────────────────────────────────────────────
+# The only reason Playwright is needed for Etix venue pages is to capture
+# the JSON the React app pulls from /ticket/api/online/. For venue URLs
+# (/ticket/v/{id}/...) those endpoints can be called directly, skipping
+# the browser launch and SPA render entirely.
+ETIX_API_BASE = 'https://www.etix.com/ticket/api/online'
+_ETIX_VENUE_ID_RE = re.compile(r'/ticket/v/(\d+)')
+
+
+async def fetch_etix_api(base_url: str) -> list:
+    """
+    Fetch venue + search JSON for an Etix venue URL concurrently.
+    Returns the raw JSON bodies that came back 2xx, or [] when the URL has
+    no venue id or nothing usable was returned (caller falls back to
+    Playwright).
+    """
+    m = _ETIX_VENUE_ID_RE.search(base_url)
+    if not m:
+        return []
+    venue_id = m.group(1)
+
+    headers = {**HTTPX_HEADERS, 'Accept': 'application/json'}
+    async with httpx.AsyncClient(headers=headers, timeout=20, follow_redirects=True,
+                                 http2=HTTP2_AVAILABLE) as client:
+        responses = await asyncio.gather(
+            client.get(f'{ETIX_API_BASE}/venues/{venue_id}'),
+            client.get(f'{ETIX_API_BASE}/search', params={'venue': venue_id}),
+            return_exceptions=True,
+        )
+
+    bodies = []
+    for resp in responses:
+        if isinstance(resp, Exception):
+            print(f"[Etix] Direct API error: {type(resp).__name__}: {resp}")
+            continue
+        if not resp.is_success:
+            print(f"[Etix] Direct API {resp.status_code} from {resp.url}")
+            continue
+        body = resp.text
+        if body.lstrip().startswith(('{', '[')):
+            bodies.append(body)
+    return bodies
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Page readiness
+# ──────────────────────────────────────────────────────────────────────
+# Fixed wait_for_timeout() sleeps cost their full duration on every page,
+# even when the widget finished loading long before. Instead, track the
+# page's in-flight requests and return as soon as the network has been
+# quiet for a moment, keeping the old sleep length only as the cap.
+# wait_for_load_state('networkidle') can't be used for this: it fires once
+# per navigation, so it returns immediately after a scroll or a late XHR.
+
+NETWORK_QUIET_MS = 500
+
+# None of the extractors look at pixels, so images, fonts and media are
+# dropped before they hit the wire, along with analytics/ad trackers whose
+# beacons would otherwise keep the network from going quiet. Stylesheets
+# still load: selector visibility waits and scroll-triggered lazy loading
+# depend on layout.
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+_TRACKER_RE = re.compile(
+    r'googletagmanager\.com|google-analytics\.com|doubleclick\.net|'
+    r'connect\.facebook\.net|hotjar\.com'
+)
+
+
+async def _block_heavy_resources(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _TRACKER_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _track_requests(page) -> dict:
+    """Count the page's in-flight requests for _wait_for_quiet."""
+    state = {'inflight': 0, 'last': time.monotonic()}
+
+    def _started(_request):
+        state['inflight'] += 1
+        state['last'] = time.monotonic()
+
+    def _ended(_request):
+        state['inflight'] = max(0, state['inflight'] - 1)
+        state['last'] = time.monotonic()
+
+    page.on('request', _started)
+    page.on('requestfinished', _ended)
+    page.on('requestfailed', _ended)
+    return state
+
+
+async def _wait_for_quiet(state: dict, timeout_ms: int) -> None:
+    """Wait until no request has been in flight for NETWORK_QUIET_MS, at most timeout_ms."""
+    deadline = time.monotonic() + timeout_ms / 1000
+    quiet = NETWORK_QUIET_MS / 1000
+    while time.monotonic() < deadline:
+        if state['inflight'] == 0 and time.monotonic() - state['last'] >= quiet:
+            return
+        await asyncio.sleep(0.1)
+
+
 async def fetch_with_playwright(url: str) -> str:
     """
     Fetch a page using Playwright (full JavaScript rendering).
 
     Handles platform-specific API interception:
-    - Etix: Captures /api/ responses during page load
+    - Etix: Calls the venue JSON API directly when possible, otherwise
+      captures /api/ responses during page load
     - RecDesk: Captures GetCalendarItems API, triggers manually if needed
     - TicketLeap: Waits for React to render event cards
     - Generic: Captures TNEW and Google Calendar API responses
     """
+    if 'etix.com' in url:
+        etix_bodies = await fetch_etix_api(url)
+        if etix_bodies:
+            html = "<html><head></head><body></body></html>\n<!-- ETIX_API_DATA -->\n"
+            for data in etix_bodies:
+                # Same </script> guard as the TPAC capture below.
+                safe = data.replace('</', '<\\/')
+                html += f"<script type='etix-api-data'>{safe}</script>\n"
+            # The venue metadata endpoint answers 2xx for any valid id, so only
+            # skip the browser when the bodies actually yield events.
+            if extract_etix_events(BeautifulSoup(html, HTML_PARSER), url, ''):
+                print(f"[Etix] Direct API returned {len(etix_bodies)} responses, skipping browser")
+                return html
+            print("[Etix] Direct API returned no events, falling back to browser")
+
     from playwright.async_api import async_playwright
 
     async with async_playwright() as p:
@@ -117,8 +289,10 @@ async def fetch_with_playwright(url: str) -> str:
             context_kwargs["proxy"] = proxy_cfg
 
         context = await browser.new_context(**context_kwargs)
+        await context.route('**/*', _block_heavy_resources)
         page = await context.new_page()
         await page.set_extra_http_headers(HEADERS)
+        net = _track_requests(page)
 
         is_etix = 'etix.com' in url
         is_recdesk = 'recdesk.com' in url
@@ -154,21 +328,16 @@ async def fetch_with_playwright(url: str) -> str:
                 await page.goto(url, timeout=60000)
 
             try:
-                await page.wait_for_selector(
-                    '[class*="performance"], [class*="event-card"], [class*="MuiCard"], '
-                    '[class*="event"], [class*="upcoming"], [class*="EventCard"], '
-                    '[class*="listing"], a[href*="/ticket/p/"], h3, h4',
-                    timeout=20000
-                )
+                await page.wait_for_selector(SEL_ETIX_CARD, timeout=20000)
             except:
                 pass
 
-            # Extra wait for React hydration + scroll to trigger lazy loading
-            await page.wait_for_timeout(5000)
+            # Let React hydration settle, then scroll to trigger lazy loading
+            await _wait_for_quiet(net, 5000)
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await page.wait_for_timeout(3000)
+            await _wait_for_quiet(net, 3000)
             await page.evaluate('window.scrollTo(0, 0)')
-            await page.wait_for_timeout(2000)
+            await _wait_for_quiet(net, 2000)
 
             html_size = len(await page.content())
             print(f"[Etix] Page rendered: {html_size/1024:.1f}KB, captured {len(etix_api_data)} API responses")
@@ -190,7 +359,13 @@ async def fetch_with_playwright(url: str) -> str:
             except:
                 await page.goto(url, timeout=45000)
 
-            await page.wait_for_timeout(3000)
+            if not recdesk_api_data:
+                try:
+                    await page.wait_for_event(
+                        'response', lambda r: 'GetCalendarItems' in r.url, timeout=3000)
+                    await _wait_for_quiet(net, 1000)
+                except Exception:
+                    pass
 
             if not recdesk_api_data:
                 print(f"[RecDesk] No auto API call detected, triggering manually...")
@@ -231,14 +406,11 @@ async def fetch_with_playwright(url: str) -> str:
                 await page.goto(url, timeout=30000)
 
             try:
-                await page.wait_for_selector(
-                    'button, a[href*="/tickets/"], [class*="event"]',
-                    timeout=10000
-                )
+                await page.wait_for_selector(SEL_TICKETLEAP_CARD, timeout=10000)
             except:
                 pass
 
-            await page.wait_for_timeout(3000)
+            await _wait_for_quiet(net, 3000)
             print(f"[TicketLeap] Page rendered: {len(await page.content())/1024:.1f}KB")
 
         elif is_tickettailor:
@@ -249,18 +421,14 @@ async def fetch_with_playwright(url: str) -> str:
 
             # TicketTailor renders event cards via JS — wait for them
             try:
-                await page.wait_for_selector(
-                    '[class*="event"], [class*="listing"], [class*="card"], '
-                    'a[href*="/events/"], a[href*="/tickets/"]',
-                    timeout=15000
-                )
+                await page.wait_for_selector(SEL_TICKETTAILOR_CARD, timeout=15000)
             except:
                 pass
 
-            await page.wait_for_timeout(3000)
+            await _wait_for_quiet(net, 3000)
             # Scroll to load any lazy content
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await page.wait_for_timeout(2000)
+            await _wait_for_quiet(net, 2000)
             print(f"[TicketTailor] Page rendered: {len(await page.content())/1024:.1f}KB")
 
         elif is_tpac:
@@ -376,16 +544,11 @@ async def fetch_with_playwright(url: str) -> str:
                 await page.goto(url, timeout=30000)
 
             # Wait for calendar/event widgets to load
-            await page.wait_for_timeout(5000)
-
             try:
-                await page.wait_for_selector(
-                    '[class*="event"], [class*="calendar"], [class*="timely"], '
-                    'iframe[src*="calendar.google.com"]',
-                    timeout=5000
-                )
+                await page.wait_for_selector(SEL_EVENT_CARD, timeout=5000)
             except:
                 pass
+            await _wait_for_quiet(net, 5000)
 
             # Check for Google Calendar iframe
             if not gcal_api_data:
@@ -393,7 +556,7 @@ async def fetch_with_playwright(url: str) -> str:
                     for frame in page.frames:
                         if 'calendar.google.com' in (frame.url or ''):
                             print(f"[GCal] Found Google Calendar iframe")
-                            await page.wait_for_timeout(3000)
+                            await _wait_for_quiet(net, 3000)
                             break
                 except:
                     pass
@@ -472,7 +635,7 @@ async def fetch_with_playwright(url: str) -> str:
                     await page.goto(next_url, wait_until="domcontentloaded", timeout=20000)
                 except:
                     await page.goto(next_url, timeout=20000)
-                await page.wait_for_timeout(2500)
+                await _wait_for_quiet(net, 2500)
                 current_html = await page.content()
                 all_html_parts.append(current_html)
             except Exception as _pe:
@@ -14,6 +14,7 @@ FIX: PAST EVENTS section stripping uses find_all_next() for robust removal.
 """
 
 import re
+from collections import Counter
 from urllib.parse import urljoin
 from bs4 import NavigableString
 
@@ -70,6 +71,11 @@ def _strip_past_events_section(soup):
             break
 
 
+# Deepest ancestor the proximity walk can reach: the date element's parent
+# plus the five container levels climbed in extract_by_date_proximity.
+_PROXIMITY_MAX_DEPTH = 7
+
+
 def extract_by_date_proximity(soup, base_url, source_name):
     """
     Find events by looking for date patterns and grabbing nearby title-like text.
@@ -80,12 +86,28 @@ def extract_by_date_proximity(soup, base_url, source_name):
 
     body = soup.find('body') or soup
 
+    # Single regex sweep over the page text: if nothing date-like exists
+    # anywhere there is no point walking individual text nodes.
+    if not COMBINED_DATE_PATTERN.search(body.get_text(' ')):
+        return events
+
+    # One pass over the text nodes. Besides collecting date-bearing elements,
+    # tally how many dated text nodes sit under each ancestor so the
+    # "container holds too many dates" check below is a dict lookup instead
+    # of a fresh subtree walk per candidate.
     date_elements = []
-    for element in body.find_all(text=True):
+    dates_under = Counter()
+    for element in body.find_all(string=True):
         if isinstance(element, NavigableString):
             text = str(element).strip()
             if text and text_has_date(text):
                 date_elements.append(element.parent)
+                ancestor = element.parent
+                for _ in range(_PROXIMITY_MAX_DEPTH):
+                    if ancestor is None:
+                        break
+                    dates_under[id(ancestor)] += 1
+                    ancestor = ancestor.parent
 
     for date_el in date_elements:
         container = date_el
@@ -94,8 +116,7 @@ def extract_by_date_proximity(soup, base_url, source_name):
             if not parent or parent.name in ['body', 'html', 'main', 'section']:
                 break
             container = parent
-            date_count = len([c for c in container.find_all(text=True) if text_has_date(str(c))])
-            if date_count > 3:
+            if dates_under[id(container)] > 3:
                 container = date_el.parent
                 break
 
@@ -19,6 +19,7 @@ import re
 import json
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from scraperUtils import (
@@ -62,20 +63,52 @@ def extract_schema_org(soup, base_url, source_name):
 # WORDPRESS EVENTS CALENDAR (TRIBE)
 # ============================================================================
 
+# Selectors compiled once at import; soupsieve otherwise re-parses each
+# string for every container on every page.
+_TRIBE_CONTAINER_SELS = tuple(sv.compile(sel) for sel in (
+    '.tribe-events-calendar-list__event',
+    '.tribe-events-calendar-list__event-row',
+    '.tribe_events', '.type-tribe_events', '.tribe-event-featured',
+    'article.tribe-events-calendar-list__event',
+))
+_TRIBE_LIST_SEL = sv.compile('.tribe-events-calendar-list')
+_TRIBE_TITLE_SELS = tuple(sv.compile(sel) for sel in (
+    '.tribe-events-calendar-list__event-title a',
+    '.tribe-events-calendar-list__event-title',
+    '.tribe-event-url',
+    'h2.tribe-events-list-event-title a',
+    'h3 a[href*="/event/"]',
+    'h2 a[href*="/event/"]',
+    'h3 a', 'h2 a',
+))
+_TRIBE_EVENT_LINK_SEL = sv.compile('a[href*="/event/"]')
+_TRIBE_DATE_SELS = tuple(sv.compile(sel) for sel in (
+    '.tribe-events-calendar-list__event-datetime',
+    '.tribe-event-date-start',
+    '.tribe-events-schedule',
+    '.tribe-event-schedule-details',
+    'time', '[datetime]',
+))
+_TRIBE_DESC_SEL = sv.compile('.tribe-events-calendar-list__event-description')
+
+
+def _first_match(container, compiled_sels):
+    """Return the first element matched by a priority-ordered selector list."""
+    for sel in compiled_sels:
+        el = sel.select_one(container)
+        if el:
+            return el
+    return None
+
+
 def extract_tribe_events(soup, base_url, source_name):
     events = []
-    selectors = [
-        '.tribe-events-calendar-list__event',
-        '.tribe-events-calendar-list__event-row',
-        '.tribe_events', '.type-tribe_events', '.tribe-event-featured',
-        'article.tribe-events-calendar-list__event',
-    ]
 
     containers = []
-    for sel in selectors:
-        containers.extend(soup.select(sel))
+    for sel in _TRIBE_CONTAINER_SELS:
+        containers.extend(sel.select(soup))
     if not containers:
-        for lst in soup.select('.tribe-events-calendar-list'):
+        for lst in _TRIBE_LIST_SEL.select(soup):
             for child in lst.find_all(['article', 'div', 'li'], recursive=False):
                 containers.append(child)
 
@@ -98,15 +131,7 @@ def extract_tribe_events(soup, base_url, source_name):
 
     seen = set()
     for container in containers:
-        title_el = (
-                container.select_one('.tribe-events-calendar-list__event-title a') or
-                container.select_one('.tribe-events-calendar-list__event-title') or
-                container.select_one('.tribe-event-url') or
-                container.select_one('h2.tribe-events-list-event-title a') or
-                container.select_one('h3 a[href*="/event/"]') or
-                container.select_one('h2 a[href*="/event/"]') or
-                container.select_one('h3 a') or container.select_one('h2 a')
-        )
+        title_el = _first_match(container, _TRIBE_TITLE_SELS)
         if not title_el:
             continue
         title = title_el.get_text(strip=True)
@@ -122,17 +147,11 @@ def extract_tribe_events(soup, base_url, source_name):
         if title_el.name == 'a':
             link = title_el.get('href', '')
         else:
-            le = title_el.find('a') or container.select_one('a[href*="/event/"]')
+            le = title_el.find('a') or _TRIBE_EVENT_LINK_SEL.select_one(container)
             if le:
                 link = le.get('href', '')
 
-        date_el = (
-                container.select_one('.tribe-events-calendar-list__event-datetime') or
-                container.select_one('.tribe-event-date-start') or
-                container.select_one('.tribe-events-schedule') or
-                container.select_one('.tribe-event-schedule-details') or
-                container.select_one('time') or container.select_one('[datetime]')
-        )
+        date_el = _first_match(container, _TRIBE_DATE_SELS)
         date_str = ''
         if date_el:
             date_str = date_el.get('datetime', '') or date_el.get_text(strip=True)
@@ -143,7 +162,7 @@ def extract_tribe_events(soup, base_url, source_name):
             if ts and date_str:
                 date_str = f"{date_str} @ {ts}"
 
-        desc_el = container.select_one('.tribe-events-calendar-list__event-description')
+        desc_el = _TRIBE_DESC_SEL.select_one(container)
         description = desc_el.get_text(strip=True)[:200] if desc_el else ''
 
         events.append({
@@ -293,6 +312,10 @@ def extract_stubwire_events(soup, base_url: str, source_name: str) -> list:
 # DICE.FM, BANDSINTOWN, SONGKICK, TICKETMASTER, AXS, ETIX, SEE TICKETS
 # ============================================================================
 
+_PLATFORM_HEADING_SEL = sv.compile('h1, h2, h3, h4, [class*="title"], [class*="name"]')
+_PLATFORM_DATE_SEL = sv.compile('time, [class*="date"], [datetime]')
+
+
 def _extract_ticket_platform(soup, base_url, source_name, link_selector, url_filter, label):
     """Generic ticket platform extractor."""
     events = []
@@ -309,7 +332,7 @@ def _extract_ticket_platform(soup, base_url, source_name, link_selector, url_fil
         if not title or len(title) < 3 or title.lower() in ['buy tickets', 'get tickets', 'buy now', 'book now']:
             parent = link.find_parent(['div', 'article', 'li'])
             if parent:
-                heading = parent.select_one('h1, h2, h3, h4, [class*="title"], [class*="name"]')
+                heading = _PLATFORM_HEADING_SEL.select_one(parent)
                 if heading:
                     title = heading.get_text(strip=True)
         if not title or len(title) < 3:
@@ -318,7 +341,7 @@ def _extract_ticket_platform(soup, base_url, source_name, link_selector, url_fil
         date_str = ''
         parent = link.find_parent(['div', 'article', 'li', 'tr'])
         if parent:
-            date_el = parent.select_one('time, [class*="date"], [datetime]')
+            date_el = _PLATFORM_DATE_SEL.select_one(parent)
             if date_el:
                 date_str = date_el.get('datetime', '') or date_el.get_text(strip=True)
 
@@ -349,7 +372,7 @@ def extract_dice_events(soup, base_url, source_name):
         date_str = ''
         parent = link.find_parent(['div', 'article', 'li'])
         if parent:
-            date_el = parent.select_one('time, [class*="date"], [datetime]')
+            date_el = _PLATFORM_DATE_SEL.select_one(parent)
             if date_el:
                 date_str = date_el.get('datetime', '') or date_el.get_text(strip=True)
         events.append({'title': title, 'date': date_str, 'source_url': href, 'tickets_url': href, 'source': source_name, 'venue': source_name})
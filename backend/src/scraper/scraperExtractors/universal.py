@@ -8,10 +8,15 @@ FIX: Garbage title filter now applies to ALL extraction methods universally,
      not just date proximity. Catches "click here for tickets", UI labels, etc.
 """
 
+import asyncio
 import html
 import re
+from itertools import chain
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
+from scraperUtils import HTML_PARSER
+
 from .platformExtractors import (
     extract_schema_org,
     extract_tribe_events,
@@ -105,29 +110,97 @@ def _is_garbage_title(title: str) -> bool:
     return False
 
 
+# ============================================================================
+# PLATFORM LADDER
+# ============================================================================
+
+# Once one of these sources has produced this many events, the rest of the
+# ladder is skipped: later providers only re-discover the same shows.
+HIGH_CONFIDENCE_THRESHOLD = 10
+HIGH_CONFIDENCE_METHODS = {'Schema.org', 'Etix', 'WordPress Events Calendar'}
+
+# Selectors reused on every page, compiled once at import.
+_JUNK_TAG_SEL = sv.compile('style, nav, footer, noscript')
+_JUNK_SCRIPT_SEL = sv.compile(
+    'script:not([type="tnew-api-data"]):not([type="gcal-api-data"])'
+    ':not([type="recdesk-api-data"]):not([type="etix-api-data"])'
+    ':not([type="tpac-api-data"])'
+)
+_TIMELY_MARKER_SEL = sv.compile(
+    '[class*="timely-"], [class*="tc-event"], [data-timely], [data-calendar-id]'
+)
+
+# (label, extractor, raw-HTML markers). An extractor only runs if at least
+# one marker substring appears in the lowercased page; an empty tuple means
+# always run. Order matches the historical priority of the ladder.
+_PLATFORM_LADDER = (
+    ('TNEW',                      extract_tnew_events,        ('tnew-api-data',)),
+    ('Google Calendar',           extract_gcal_events,        ('gcal-api-data',)),
+    ('WordPress Events Calendar', extract_tribe_events,       ('tribe',)),
+    ('Eventbrite',                extract_eventbrite_embed,   ('eventbrite', 'eb-event')),
+    ('Stubwire',                  extract_stubwire_events,    ('/event/',)),
+    ('Dice.fm',                   extract_dice_events,        ('dice.fm',)),
+    ('Bandsintown',               extract_bandsintown_events, ('bandsintown.com/e/',)),
+    ('Songkick',                  extract_songkick_events,    ('songkick.com',)),
+    ('Ticketmaster',              extract_ticketmaster_events, ('ticketmaster.com', 'livenation.com')),
+    ('AXS',                       extract_axs_events,         ('axs.com',)),
+    ('Etix',                      extract_etix_events,        ('etix',)),
+    ('See Tickets',               extract_seetickets_events,  ('seetickets',)),
+)
+
+
 # ============================================================================
 # UNIVERSAL EXTRACTION
 # ============================================================================
 
+def _iter_platform_events(soup, raw_html_lower: str, base_url: str, source_name: str):
+    """
+    Walk _PLATFORM_LADDER lazily, yielding (label, events) for each provider
+    that produced something. Providers whose marker never appears in the raw
+    HTML are skipped without a DOM walk.
+    """
+    for label, extractor, markers in _PLATFORM_LADDER:
+        if markers and not any(m in raw_html_lower for m in markers):
+            continue
+        found = extractor(soup, base_url, source_name)
+        if found:
+            yield label, found
+
+
 def extract_events_universal(html: str, base_url: str, source_name: str) -> list:
     """
     Universal event extraction - tries multiple strategies in priority order.
     Applies garbage filter and deduplication universally.
+
+    Each strategy's results are kept as a separate batch and streamed into
+    _finalize via itertools.chain, so no combined candidate list is built.
     """
-    soup = BeautifulSoup(html, 'html.parser')
-    all_events = []
+    soup = BeautifulSoup(html, HTML_PARSER)
+    raw_html_lower = html.lower()
+    batches = []
     methods_used = []
+    found_count = 0
+
+    def _add(label: str, found: list) -> None:
+        nonlocal found_count
+        batches.append(found)
+        found_count += len(found)
+        methods_used.append(f"{label} ({len(found)})")
+
+    def _done() -> list:
+        return _finalize(chain.from_iterable(batches), methods_used)
 
     # ── 1. Schema.org FIRST (before stripping <script>) ──
     schema_events = extract_schema_org(soup, base_url, source_name)
     if schema_events:
-        all_events.extend(schema_events)
-        methods_used.append(f"Schema.org ({len(schema_events)})")
+        _add('Schema.org', schema_events)
+        if found_count >= HIGH_CONFIDENCE_THRESHOLD:
+            return _done()
 
     # ── Strip junk tags (preserving <header> for Tribe) ──
-    for tag in soup.select('style, nav, footer, noscript'):
+    for tag in _JUNK_TAG_SEL.select(soup):
         tag.decompose()
-    for tag in soup.select('script:not([type="tnew-api-data"]):not([type="gcal-api-data"]):not([type="recdesk-api-data"]):not([type="etix-api-data"]):not([type="tpac-api-data"])'):
+    for tag in _JUNK_SCRIPT_SEL.select(soup):
         tag.decompose()
 
     # ── FIX: Strip PAST EVENTS sections ──
@@ -137,86 +210,28 @@ def extract_events_universal(html: str, base_url: str, source_name: str) -> list
     if 'etix.com' in base_url:
         etix_events = extract_etix_events(soup, base_url, source_name)
         if etix_events:
-            all_events.extend(etix_events)
-            methods_used.append(f"Etix ({len(etix_events)})")
-            return _finalize(all_events, methods_used)
+            _add('Etix', etix_events)
+            return _done()
 
     # ── 2b. TicketTailor pages (special early exit) ──
     if 'tickettailor.com' in base_url:
         tt_events, tt_detected = extract_tickettailor_events(soup, base_url, source_name)
         if tt_detected and tt_events:
-            all_events.extend(tt_events)
-            methods_used.append(f"TicketTailor ({len(tt_events)})")
-            return _finalize(all_events, methods_used)
-
-    # ── 3. TNEW/Tessitura API data ──
-    tnew_events = extract_tnew_events(soup, base_url, source_name)
-    if tnew_events:
-        all_events.extend(tnew_events)
-        methods_used.append(f"TNEW ({len(tnew_events)})")
-
-    # ── 4. Google Calendar API data ──
-    gcal_events = extract_gcal_events(soup, base_url, source_name)
-    if gcal_events:
-        all_events.extend(gcal_events)
-        methods_used.append(f"Google Calendar ({len(gcal_events)})")
-
-    # ── 5. Known plugin extractors ──
-    tribe_events = extract_tribe_events(soup, base_url, source_name)
-    if tribe_events:
-        all_events.extend(tribe_events)
-        methods_used.append(f"WordPress Events Calendar ({len(tribe_events)})")
-
-    eventbrite_events = extract_eventbrite_embed(soup, base_url, source_name)
-    if eventbrite_events:
-        all_events.extend(eventbrite_events)
-        methods_used.append(f"Eventbrite ({len(eventbrite_events)})")
-
-    stubwire_events = extract_stubwire_events(soup, base_url, source_name)
-    if stubwire_events:
-        all_events.extend(stubwire_events)
-        methods_used.append(f"Stubwire ({len(stubwire_events)})")
-
-    dice_events = extract_dice_events(soup, base_url, source_name)
-    if dice_events:
-        all_events.extend(dice_events)
-        methods_used.append(f"Dice.fm ({len(dice_events)})")
-
-    bit_events = extract_bandsintown_events(soup, base_url, source_name)
-    if bit_events:
-        all_events.extend(bit_events)
-        methods_used.append(f"Bandsintown ({len(bit_events)})")
-
-    sk_events = extract_songkick_events(soup, base_url, source_name)
-    if sk_events:
-        all_events.extend(sk_events)
-        methods_used.append(f"Songkick ({len(sk_events)})")
-
-    tm_events = extract_ticketmaster_events(soup, base_url, source_name)
-    if tm_events:
-        all_events.extend(tm_events)
-        methods_used.append(f"Ticketmaster ({len(tm_events)})")
-
-    axs_events = extract_axs_events(soup, base_url, source_name)
-    if axs_events:
-        all_events.extend(axs_events)
-        methods_used.append(f"AXS ({len(axs_events)})")
-
-    etix_events = extract_etix_events(soup, base_url, source_name)
-    if etix_events:
-        all_events.extend(etix_events)
-        methods_used.append(f"Etix ({len(etix_events)})")
-
-    st_events = extract_seetickets_events(soup, base_url, source_name)
-    if st_events:
-        all_events.extend(st_events)
-        methods_used.append(f"See Tickets ({len(st_events)})")
-
-    # ── 6. Squarespace ──
+            _add('TicketTailor', tt_events)
+            return _done()
+
+    # ── 3-5. Platform ladder (TNEW, GCal, plugins, ticketing embeds) ──
+    # A high-confidence source returning a full calendar ends the ladder
+    # early — the remaining providers would only yield duplicates.
+    for label, found in _iter_platform_events(soup, raw_html_lower, base_url, source_name):
+        _add(label, found)
+        if label in HIGH_CONFIDENCE_METHODS and found_count >= HIGH_CONFIDENCE_THRESHOLD:
+            return _done()
+
+    # ── 6. Squarespace (detects itself from raw HTML) ──
     sq_events = extract_squarespace_events(soup, html, base_url, source_name)
     if sq_events:
-        all_events.extend(sq_events)
-        methods_used.append(f"Squarespace ({len(sq_events)})")
+        _add('Squarespace', sq_events)
 
     # ── 7. Fallbacks ──
     # Timely HTML fallback: only run if the page actually shows Timely markers.
@@ -224,29 +239,33 @@ def extract_events_universal(html: str, base_url: str, source_name: str) -> list
     # extract_timely(), which internally falls back to extract_timely_from_html
     # when the API returns zero. Running it again here with no detection gate
     # produced false positives on SeatEngine sites (e.g. bricktowntulsa.com).
-    if not all_events:
-        has_timely_marker = bool(
-            soup.select_one('[class*="timely-"], [class*="tc-event"], [data-timely], [data-calendar-id]')
-        )
+    if not found_count:
+        has_timely_marker = bool(_TIMELY_MARKER_SEL.select_one(soup))
         if has_timely_marker:
             timely_html = extract_timely_from_html(soup, base_url, source_name)
             if timely_html:
-                all_events.extend(timely_html)
-                methods_used.append(f"Timely HTML ({len(timely_html)})")
+                _add('Timely HTML', timely_html)
 
-    if not all_events:
+    if not found_count:
         repeat_events = extract_repeating_structures(soup, base_url, source_name)
         if repeat_events:
-            all_events.extend(repeat_events)
-            methods_used.append(f"Repeating structures ({len(repeat_events)})")
+            _add('Repeating structures', repeat_events)
 
-    if not all_events:
+    if not found_count:
         proximity_events = extract_by_date_proximity(soup, base_url, source_name)
         if proximity_events:
-            all_events.extend(proximity_events)
-            methods_used.append(f"Date proximity ({len(proximity_events)})")
+            _add('Date proximity', proximity_events)
+
+    return _done()
 
-    return _finalize(all_events, methods_used)
+
+async def extract_events_universal_async(html: str, base_url: str, source_name: str) -> list:
+    """
+    Run extract_events_universal in a worker thread.
+    BS4 parsing is synchronous CPU work; off-loading it keeps the event loop
+    free to drive other venues' fetches while this page is being parsed.
+    """
+    return await asyncio.to_thread(extract_events_universal, html, base_url, source_name)
 
 
 def _clean_description(text: str) -> str:
@@ -274,34 +293,30 @@ def _clean_description(text: str) -> str:
     return text
 
 
-def _finalize(all_events: list, methods_used: list) -> list:
-    """Apply universal garbage filter, description cleaning, and deduplication."""
+def _finalize(all_events, methods_used: list) -> list:
+    """Apply universal garbage filter, deduplication, and description cleaning."""
 
-    # FIX: Universal garbage title filter (applies to ALL methods)
-    filtered = []
+    # FIX: Universal garbage title filter (applies to ALL methods),
+    # deduplicating by title in the same pass.
     garbage_count = 0
+    seen_titles = set()
+    unique_events = []
     for event in all_events:
         title = event.get('title', '')
         if _is_garbage_title(title):
             garbage_count += 1
             continue
-        # Clean HTML from descriptions
-        event['description'] = _clean_description(event.get('description', ''))
-        filtered.append(event)
+        key = title.lower().strip() if title else ''
+        if key and key not in seen_titles:
+            seen_titles.add(key)
+            unique_events.append(event)
 
     if garbage_count:
         print(f"[GarbageFilter] Removed {garbage_count} garbage titles")
 
-    # Deduplicate by title
-    seen_titles = set()
-    unique_events = []
-    for event in filtered:
-        title = event.get('title', '').lower().strip()
-        if title and title not in seen_titles:
-            seen_titles.add(title)
-            unique_events.append(event)
-
+    # Descriptions are cleaned only for the survivors, in place
     for event in unique_events:
+        event['description'] = _clean_description(event.get('description') or '')
         event['_extraction_methods'] = methods_used
 
-    return unique_events
\ No newline at end of file
+    return unique_events
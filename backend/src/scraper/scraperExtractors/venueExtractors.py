@@ -36,10 +36,12 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse, urljoin, quote
 import httpx
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
 from scraperUtils import (
     HEADERS,
+    HTML_PARSER,
     extract_date_from_text,
     extract_time_from_text,
     text_has_date,
@@ -607,6 +609,33 @@ _RHP_TIME_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Broad selector: catches .rhpSingleEvent on both the homepage widget
+# (modifier --widget) and the full /events/ page (modifier --list), plus
+# .rhpEventSeries multi-show cards. Cards without the required title/date
+# children are skipped silently inside the loop.
+_RHP_CARD_SEL    = sv.compile('.rhpSingleEvent, .rhpEventSeries')
+# Only the card subtrees are ever read, so the parser skips building the
+# rest of the page (nav, footer, inline scripts) altogether.
+_RHP_CARD_STRAINER = SoupStrainer(class_=re.compile(r'\b(?:rhpSingleEvent|rhpEventSeries)\b'))
+_RHP_TITLE_SEL   = sv.compile('.rhp-event__title--list, .rhp-event__title, h2.rhp-event__title--list, .eventTitleDiv h2, h2')
+# The date element carries multiple co-equal classes in the live DOM:
+#   <div class="rhp-event-series-date eventDateList rhp-event__date--list">
+# Legacy .singleEventDate kept as a fallback in case older widgets use it.
+_RHP_DATE_SEL    = sv.compile('.rhp-event-series-date, .eventDateList, .rhp-event__date--list, .singleEventDate')
+_RHP_TIMETXT_SEL = sv.compile('.rhp-event__time-text--list, .eventDoorStartDate')
+_RHP_TAGLINE_SEL = sv.compile('.rhp-event__tagline--list, .eventTagLine')
+_RHP_AGE_SEL     = sv.compile('.rhp-event__age-restriction--list, .eventAgeRestriction')
+_RHP_LINK_SEL    = sv.compile('a.url[href], a[href*="/event/"], a[href]')
+_RHP_IMG_SEL     = sv.compile('img')
+
+_RHP_MONTH_RE = re.compile(
+    r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|january|february|'
+    r'march|april|june|july|august|september|october|november|december)\b',
+    re.IGNORECASE,
+)
+_RHP_MONTH_NUM = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+                  'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12}
+
 _RHP_DATE_FORMATS = [
     '%a, %b %d',     # "Wed, Apr 08"
     '%a, %B %d',     # "Tue, June 02"
@@ -685,12 +714,10 @@ async def extract_rhp_events(
             print(f"[RHPEvents] Fetch error: {exc}")
             return [], False
 
-    soup  = BeautifulSoup(html, 'html.parser')
-    # Broad selector: catches .rhpSingleEvent on both the homepage widget
-    # (modifier --widget) and the full /events/ page (modifier --list), plus
-    # .rhpEventSeries multi-show cards. Cards without the required title/date
-    # children are skipped silently inside the loop.
-    cards = soup.select('.rhpSingleEvent, .rhpEventSeries')
+    # Parse off the event loop; the other site extractors are probing the
+    # same page concurrently.
+    soup  = await asyncio.to_thread(BeautifulSoup, html, HTML_PARSER, parse_only=_RHP_CARD_STRAINER)
+    cards = _RHP_CARD_SEL.select(soup)
     print(f"[RHPEvents/{venue_name}] Found {len(cards)} event cards")
 
     today      = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -700,16 +727,13 @@ async def extract_rhp_events(
     seen_keys  = set()
 
     for card in cards:
-        title_el   = card.select_one('.rhp-event__title--list, .rhp-event__title, h2.rhp-event__title--list, .eventTitleDiv h2, h2')
-        # The date element carries multiple co-equal classes in the live DOM:
-        #   <div class="rhp-event-series-date eventDateList rhp-event__date--list">
-        # Legacy .singleEventDate kept as a fallback in case older widgets use it.
-        date_el    = card.select_one('.rhp-event-series-date, .eventDateList, .rhp-event__date--list, .singleEventDate')
-        time_el    = card.select_one('.rhp-event__time-text--list, .eventDoorStartDate')
-        tagline_el = card.select_one('.rhp-event__tagline--list, .eventTagLine')
-        age_el     = card.select_one('.rhp-event__age-restriction--list, .eventAgeRestriction')
-        a_tag      = card.select_one('a.url[href], a[href*="/event/"], a[href]')
-        img        = card.select_one('img')
+        title_el   = _RHP_TITLE_SEL.select_one(card)
+        date_el    = _RHP_DATE_SEL.select_one(card)
+        time_el    = _RHP_TIMETXT_SEL.select_one(card)
+        tagline_el = _RHP_TAGLINE_SEL.select_one(card)
+        age_el     = _RHP_AGE_SEL.select_one(card)
+        a_tag      = _RHP_LINK_SEL.select_one(card)
+        img        = _RHP_IMG_SEL.select_one(card)
 
         if not title_el or not date_el:
             continue
@@ -723,15 +747,9 @@ async def extract_rhp_events(
         image_url = img['src'] if img and img.get('src') else ''
 
         # ── Year inference ────────────────────────────────────────────────────
-        month_match = re.search(
-            r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|january|february|'
-            r'march|april|june|july|august|september|october|november|december)\b',
-            date_text, re.IGNORECASE
-        )
+        month_match = _RHP_MONTH_RE.search(date_text)
         if month_match:
-            month_abbr = month_match.group(1).lower()[:3]
-            month_num  = {'jan':1,'feb':2,'mar':3,'apr':4,'may':5,'jun':6,
-                          'jul':7,'aug':8,'sep':9,'oct':10,'nov':11,'dec':12}[month_abbr]
+            month_num  = _RHP_MONTH_NUM[month_match.group(1).lower()[:3]]
             if prev_month > 0 and month_num < prev_month:
                 work_year += 1
             prev_month = month_num
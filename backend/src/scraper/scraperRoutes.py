@@ -9,11 +9,20 @@ import os
 import re
 import json
 import asyncio
+import atexit
 import functools
+import gzip
 import hashlib
-from datetime import datetime
-from flask import render_template_string, render_template, request, jsonify, send_file, Response
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from flask import request, jsonify, send_file, Response
+from flask.json.provider import DefaultJSONProvider
 import httpx
+import pytz
+from dateutil import parser as date_parser
 
 from scraperUtils import (
     OUTPUT_DIR,
@@ -30,668 +39,91 @@ from scraperUtils import (
     is_aggregator_url,
     get_source_priority,
     make_content_hash,
+    safe_filename,
 )
 
 from scraperExtractors import (
-    extract_eventcalendarapp,
-    extract_timely,
-    extract_bok_center,
-    extract_circle_cinema_events,
-    extract_expo_square_events,
-    extract_eventbrite_api_events,
-    extract_simpleview_events,
-    extract_sitewrench_events,
-    extract_recdesk_events,
-    extract_ticketleap_events,
-    extract_libnet_events,
-    extract_philbrook_events,
-    extract_tulsapac_events,
-    extract_roosterdays_events,
-    extract_tulsabrunchfest_events,
-    extract_okeq_events,
-    extract_flywheel_events,
-    extract_arvest_events,
-    extract_tulsatough_events,
-    extract_gradient_events,
-    extract_tulsafarmersmarket_events,
-    extract_okcastle_events,
-    extract_broken_arrow_events,
-    extract_tulsazoo_events,
-    extract_hardrock_tulsa_events,
-    extract_gypsy_events,
-    extract_badass_renees_events,
-    extract_rocklahoma_events,
-    extract_tulsa_oktoberfest_events,
+    run_site_extractors,
     extract_events_universal,
     fetch_with_httpx,
     fetch_with_playwright,
 )
+from scraperExtractors.fetchers import HTTP2_AVAILABLE
 
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
 
-# ============================================================================
-# HTML TEMPLATE
-# ============================================================================
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Locate918 Scraper</title>
-    <style>
-        * { box-sizing: border-box; margin: 0; padding: 0; }
-        body {
-            font-family: 'Segoe UI', sans-serif;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            min-height: 100vh;
-            padding: 30px 20px;
-            color: #fff;
-        }
-        .container { max-width: 900px; margin: 0 auto; }
-        h1 { text-align: center; color: #D4AF37; margin-bottom: 5px; }
-        .subtitle { text-align: center; color: #666; margin-bottom: 25px; font-size: 13px; }
-        .card {
-            background: rgba(255,255,255,0.05);
-            border: 1px solid rgba(255,255,255,0.1);
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 15px;
-        }
-        .form-row { display: flex; gap: 12px; margin-bottom: 12px; }
-        .form-row .form-group { flex: 1; }
-        label { display: block; margin-bottom: 5px; color: #D4AF37; font-size: 12px; font-weight: 600; }
-        input {
-            width: 100%;
-            padding: 10px 12px;
-            border: 1px solid rgba(255,255,255,0.15);
-            border-radius: 6px;
-            background: rgba(0,0,0,0.3);
-            color: #fff;
-            font-size: 14px;
-        }
-        input:focus { outline: none; border-color: #D4AF37; }
-        .checkbox-row { display: flex; align-items: center; gap: 8px; margin: 12px 0; }
-        .checkbox-row input[type="checkbox"] { width: 16px; height: 16px; }
-        .checkbox-row label { margin: 0; color: #aaa; font-size: 13px; }
-        .btn {
-            padding: 10px 20px;
-            border: none;
-            border-radius: 6px;
-            font-size: 13px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: background 0.15s;
-        }
-        .btn-primary { background: #D4AF37; color: #1a1a2e; }
-        .btn-primary:hover { background: #e5c04b; }
-        .btn-primary:disabled { background: #555; color: #888; cursor: not-allowed; }
-        .btn-secondary { background: #444; color: #fff; }
-        .btn-secondary:hover { background: #555; }
-        .btn-success { background: #28a745; color: #fff; }
-        .btn-success:hover { background: #2fbc4e; }
-        .btn-danger { background: #dc3545; color: #fff; }
-        .btn-group { display: flex; gap: 8px; flex-wrap: wrap; }
-        .status {
-            padding: 10px 12px; border-radius: 6px; margin-top: 12px; font-size: 13px;
-        }
-        .status.loading { background: rgba(212,175,55,0.2); border: 1px solid #D4AF37; }
-        .status.success { background: rgba(40,167,69,0.2); border: 1px solid #28a745; }
-        .status.error { background: rgba(220,53,69,0.2); border: 1px solid #dc3545; }
-        .spinner {
-            display: inline-block; width: 14px; height: 14px;
-            border: 2px solid rgba(255,255,255,0.3); border-radius: 50%;
-            border-top-color: #D4AF37; animation: spin 0.7s linear infinite;
-            margin-right: 8px; vertical-align: middle;
-        }
-        @keyframes spin { to { transform: rotate(360deg); } }
-        .hidden { display: none; }
-        h3 { color: #D4AF37; font-size: 15px; margin-bottom: 10px; }
-
-        /* Source chips */
-        .sources-grid { display: flex; flex-wrap: wrap; gap: 6px; margin: 12px 0; }
-        .source-chip {
-            display: inline-flex; align-items: center; gap: 5px;
-            background: rgba(255,255,255,0.06); border: 1px solid rgba(255,255,255,0.1);
-            border-radius: 20px; padding: 5px 12px 5px 14px; font-size: 12px;
-            cursor: pointer; transition: all 0.15s; user-select: none;
-        }
-        .source-chip:hover { background: rgba(212,175,55,0.12); border-color: rgba(212,175,55,0.4); }
-        .source-chip.active { background: rgba(212,175,55,0.2); border-color: #D4AF37; }
-        .source-chip .name { color: #ccc; }
-        .source-chip.active .name { color: #D4AF37; }
-        .source-chip .x {
-            color: #555; font-size: 13px; line-height: 1; padding: 1px 3px;
-            border-radius: 50%; transition: color 0.15s;
-        }
-        .source-chip .x:hover { color: #dc3545; }
-        .source-count { color: #555; font-size: 12px; margin-left: 4px; }
-
-        /* Results */
-        .stats { display: flex; gap: 20px; margin: 12px 0; }
-        .stat { text-align: center; }
-        .stat-val { font-size: 22px; font-weight: bold; color: #D4AF37; }
-        .stat-lbl { font-size: 10px; color: #666; text-transform: uppercase; }
-        .method-tag {
-            display: inline-block; background: #333; color: #aaa;
-            padding: 2px 8px; border-radius: 10px; font-size: 10px;
-            margin-right: 4px; margin-bottom: 6px;
-        }
-        .event-list { max-height: 400px; overflow-y: auto; }
-        .event-item {
-            background: rgba(0,0,0,0.25); border-radius: 6px;
-            padding: 10px; margin-bottom: 6px; font-size: 13px;
-        }
-        .event-item strong { color: #fff; }
-        .event-item p { color: #888; margin: 3px 0; font-size: 12px; }
-        .event-item a { color: #6cf; font-size: 11px; }
-
-        /* Log */
-        .log {
-            background: #0a0a0a; border-radius: 5px; padding: 10px;
-            margin-top: 10px; max-height: 150px; overflow-y: auto;
-            font-family: monospace; font-size: 11px; color: #0f0;
-        }
-        .log .e { color: #f66; }
-        .log .s { color: #6f6; }
-        .log .i { color: #6cf; }
-
-        /* Progress */
-        .progress-bar {
-            height: 8px; border-radius: 4px; background: rgba(255,255,255,0.1);
-            margin-top: 10px; overflow: hidden;
-        }
-        .progress-bar .fill {
-            height: 100%; background: #D4AF37;
-            transition: width 0.3s ease; width: 0%;
-        }
-        .scrape-all-log {
-            background: #0a0a0a; border-radius: 5px; padding: 10px;
-            margin-top: 10px; max-height: 250px; overflow-y: auto;
-            font-family: monospace; font-size: 11px; color: #0f0;
-        }
-        /* Source manager table */
-        #source-table tbody tr { border-bottom: 1px solid rgba(255,255,255,0.04); transition: background 0.1s; }
-        #source-table tbody tr:hover { background: rgba(255,255,255,0.03); }
-        #source-table td { padding: 8px 10px; vertical-align: middle; }
-        .src-name { color: #ddd; font-weight: 500; cursor: pointer; }
-        .src-name:hover { color: #D4AF37; }
-        .src-url { color: #555; font-size: 10px; margin-top: 1px; }
-        .p-tag { display:inline-block; padding:2px 7px; border-radius:10px; font-size:10px; font-weight:700; }
-        .p-tag-1 { background:rgba(212,175,55,0.18); color:#D4AF37; border:1px solid rgba(212,175,55,0.4); }
-        .p-tag-2 { background:rgba(40,167,69,0.15); color:#4caf70; border:1px solid rgba(40,167,69,0.3); }
-        .p-tag-3 { background:rgba(85,102,170,0.15); color:#7788cc; border:1px solid rgba(85,102,170,0.3); }
-        .status-badge { display:inline-block; padding:2px 8px; border-radius:10px; font-size:10px; font-weight:600; }
-        .sb-working { background:rgba(40,167,69,0.15); color:#4caf70; border:1px solid rgba(40,167,69,0.3); }
-        .sb-empty   { background:rgba(255,193,7,0.15); color:#ffc107; border:1px solid rgba(255,193,7,0.3); }
-        .sb-error   { background:rgba(220,53,69,0.15); color:#e05565; border:1px solid rgba(220,53,69,0.3); cursor:pointer; }
-        .sb-stale   { background:rgba(255,255,255,0.05); color:#666; border:1px solid rgba(255,255,255,0.1); }
-        .sb-running { background:rgba(212,175,55,0.1); color:#D4AF37; border:1px solid rgba(212,175,55,0.2); }
-        .method-pill { display:inline-block; background:#222; color:#888; padding:2px 7px; border-radius:8px; font-size:10px; max-width:160px; overflow:hidden; text-overflow:ellipsis; white-space:nowrap; }
-        .row-btn { padding:3px 10px; font-size:11px; border:none; border-radius:5px; cursor:pointer; font-weight:600; transition:background 0.15s; }
-        .row-scrape { background:#2a2a1a; color:#D4AF37; border:1px solid rgba(212,175,55,0.3); }
-        .row-scrape:hover { background:rgba(212,175,55,0.2); }
-        .row-scrape:disabled { opacity:0.4; cursor:not-allowed; }
-        .row-del { background:transparent; color:#555; border:1px solid rgba(255,255,255,0.08); margin-left:4px; }
-        .row-del:hover { color:#e05565; border-color:rgba(220,53,69,0.4); }
-        .footer { text-align: center; color: #333; margin-top: 25px; font-size: 11px; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Locate918</h1>
-        <p class="subtitle">Universal Event Scraper &bull; Smart Extraction &bull; LLM Normalized</p>
-
-        <!-- Scrape Form -->
-        <div class="card">
-            <h3>Scrape Events</h3>
-            <div class="form-row">
-                <div class="form-group">
-                    <label>URL</label>
-                    <input type="text" id="url" placeholder="https://venue-website.com/events">
-                </div>
-                <div class="form-group" style="max-width: 200px;">
-                    <label>Source Name</label>
-                    <input type="text" id="source" placeholder="Venue Name">
-                </div>
-                <div class="form-group" style="max-width: 140px;">
-                    <label>Venue Priority</label>
-                    <select id="venue-priority" style="width:100%;background:#1a1a1a;border:1px solid #333;color:#ccc;padding:8px 10px;border-radius:5px;font-size:13px;">
-                        <option value="1">P1 — Flagship</option>
-                        <option value="2" selected>P2 — Featured</option>
-                        <option value="3">P3 — Standard</option>
-                    </select>
-                </div>
-            </div>
-            <div class="checkbox-row">
-                <input type="checkbox" id="playwright" checked>
-                <label for="playwright">Playwright (JS)</label>
-                <input type="checkbox" id="future-only" checked style="margin-left: 16px;">
-                <label for="future-only">Future only</label>
-            </div>
-            <div class="btn-group">
-                <button class="btn btn-primary" id="scrape-btn" onclick="scrape()">Scrape</button>
-                <button class="btn btn-secondary" onclick="saveUrl()">Save Source</button>
-            </div>
-            <div id="status" class="status hidden"></div>
-            <div id="log-box" class="log hidden"></div>
-        </div>
+JSON_HEADERS = {"Content-Type": "application/json"}
 
-        <!-- Results -->
-        <div id="results" class="card hidden">
-            <h3>Results</h3>
-            <div class="stats">
-                <div class="stat"><div class="stat-val" id="stat-count">0</div><div class="stat-lbl">Events</div></div>
-                <div class="stat"><div class="stat-val" id="stat-html">0</div><div class="stat-lbl">HTML Size</div></div>
-            </div>
-            <div id="methods-used"></div>
-            <div class="btn-group" style="margin-bottom: 10px;">
-                <button class="btn btn-success" onclick="sendToDatabase()">Send to Database</button>
-                <button class="btn btn-secondary" onclick="saveJSON()">Save JSON</button>
-            </div>
-            <div id="event-list" class="event-list"></div>
-        </div>
-
-        <!-- Source Manager -->
-        <div class="card" id="source-manager">
-            <div style="display:flex;align-items:center;justify-content:space-between;margin-bottom:12px;">
-                <div style="display:flex;align-items:center;gap:12px;">
-                    <h3 style="margin:0;">Sources <span id="source-count" style="color:#555;font-size:12px;font-weight:400;"></span></h3>
-                    <div id="tier-badges" style="display:flex;gap:5px;"></div>
-                </div>
-                <button class="btn btn-primary" id="scrape-all-btn" onclick="scrapeAll()" style="padding:7px 16px;font-size:12px;">&#9889; Scrape All</button>
-            </div>
-            <div id="scrape-all-status" class="status hidden"></div>
-            <div class="progress-bar hidden" id="progress-bar"><div class="fill" id="progress-fill"></div></div>
-            <div id="scrape-all-counter" style="text-align:center;color:#888;font-size:11px;margin-top:4px;" class="hidden"></div>
-            <div style="overflow-x:auto;margin-top:8px;">
-                <table id="source-table" style="width:100%;border-collapse:collapse;font-size:12px;">
-                    <thead>
-                        <tr style="border-bottom:1px solid rgba(255,255,255,0.08);">
-                            <th style="text-align:left;padding:6px 10px;color:#555;font-weight:600;">Source</th>
-                            <th style="text-align:center;padding:6px 8px;color:#555;font-weight:600;">P</th>
-                            <th style="text-align:left;padding:6px 10px;color:#555;font-weight:600;white-space:nowrap;">Last Run</th>
-                            <th style="text-align:center;padding:6px 8px;color:#555;font-weight:600;">Status</th>
-                            <th style="text-align:center;padding:6px 6px;color:#555;font-weight:600;">Events</th>
-                            <th style="text-align:left;padding:6px 10px;color:#555;font-weight:600;">Method</th>
-                            <th style="text-align:center;padding:6px 8px;color:#555;font-weight:600;"></th>
-                        </tr>
-                    </thead>
-                    <tbody id="source-tbody">
-                        <tr><td colspan="7" style="text-align:center;padding:20px;color:#555;">Loading...</td></tr>
-                    </tbody>
-                </table>
-            </div>
-        </div>
 
-        <div class="footer">Locate918 &bull; Senior Capstone 2026</div>
-    </div>
-
-    <script>
-var events = [];
-var savedUrls = [];
-var scrapeStatus = {};
-var runningUrls  = new Set();
-
-function log(msg, cls) {
-    var b = document.getElementById("log-box");
-    b.classList.remove("hidden");
-    b.innerHTML += "<div" + (cls ? " class=\"" + cls + "\"" : "") + ">" + msg + "</div>";
-    b.scrollTop = b.scrollHeight;
-}
-function status(msg, type) {
-    type = type || "loading";
-    var el = document.getElementById("status");
-    el.className = "status " + type;
-    el.innerHTML = type === "loading" ? "<span class=\"spinner\"></span>" + msg : msg;
-    el.classList.remove("hidden");
-}
-function esc(s) {
-    return String(s || "").replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&#39;");
-}
-function escJs(s) {
-    return String(s || "").replace(/'/g, String.fromCharCode(92) + "'");
-}
-function relTime(iso) {
-    if (!iso) return "never";
-    var d = new Date(iso), now = Date.now(), diff = Math.floor((now - d) / 1000);
-    if (diff < 60)    return diff + "s ago";
-    if (diff < 3600)  return Math.floor(diff/60) + "m ago";
-    if (diff < 86400) return Math.floor(diff/3600) + "h ago";
-    return Math.floor(diff/86400) + "d ago";
-}
-function statusBadge(st, errReport) {
-    var map = {working:"sb-working", empty:"sb-empty", error:"sb-error", stale:"sb-stale"};
-    var cls = map[st] || "sb-stale";
-    var label = st || "stale";
-    if (st === "error" && errReport) {
-        return "<a href=\"/download/" + esc(errReport) + "\" class=\"status-badge " + cls + "\" title=\"Download error report\" download>&#9888; " + label + "</a>";
-    }
-    return "<span class=\"status-badge " + cls + "\">" + label + "</span>";
-}
-function pTag(p) {
-    p = parseInt(p) || 3;
-    return "<span class=\"p-tag p-tag-" + p + "\">P" + p + "</span>";
-}
-
-async function loadSourceTable() {
-    try {
-        var [urlsR, statusR] = await Promise.all([
-            fetch("/saved-urls"),
-            fetch("/scrape-status")
-        ]);
-        savedUrls    = await urlsR.json();
-        scrapeStatus = await statusR.json();
-    } catch(e) {
-        savedUrls    = [];
-        scrapeStatus = {};
-    }
-    renderSourceTable();
-}
-
-function renderSourceTable() {
-    var tbody   = document.getElementById("source-tbody");
-    var countEl = document.getElementById("source-count");
-    if (!savedUrls.length) {
-        tbody.innerHTML = "<tr><td colspan=\"7\" style=\"text-align:center;padding:20px;color:#555;\">No saved sources yet. Scrape a URL above to add one.</td></tr>";
-        countEl.textContent = "";
-        return;
-    }
-    countEl.textContent = "(" + savedUrls.length + ")";
-
-    var t = {1:0,2:0,3:0};
-    savedUrls.forEach(function(u) { t[parseInt(u.venue_priority||u.priority||3)]++; });
-    var tb = document.getElementById("tier-badges");
-    if (tb) tb.innerHTML =
-        (t[1] ? "<span class=\"p-tag p-tag-1\" style=\"font-size:10px;\">P1 &times;" + t[1] + "</span>" : "") +
-        (t[2] ? "<span class=\"p-tag p-tag-2\" style=\"font-size:10px;margin-left:4px;\">P2 &times;" + t[2] + "</span>" : "") +
-        (t[3] ? "<span class=\"p-tag p-tag-3\" style=\"font-size:10px;margin-left:4px;\">P3 &times;" + t[3] + "</span>" : "");
-
-    var sorted = savedUrls.slice().sort(function(a,b) {
-        var pa = parseInt(a.venue_priority||a.priority||3);
-        var pb = parseInt(b.venue_priority||b.priority||3);
-        if (pa !== pb) return pa - pb;
-        return (a.name||"").localeCompare(b.name||"");
-    });
-
-    tbody.innerHTML = sorted.map(function(u) {
-        var url = u.url;
-        var st  = scrapeStatus[url] || {};
-        var p   = parseInt(u.venue_priority || u.priority || 3);
-        var isRunning = runningUrls.has(url);
-
-        var statusCell = isRunning
-            ? "<span class=\"status-badge sb-running\"><span class=\"spinner\" style=\"width:10px;height:10px;\"></span> running</span>"
-            : statusBadge(st.status, st.error_report);
-
-        var methods = (st.methods || []);
-        var methodCell = methods.length
-            ? "<span class=\"method-pill\" title=\"" + esc(methods.join(", ")) + "\">" + esc(methods[0].replace(/ \(\d+\)/, "")) + "</span>"
-            : "<span style=\"color:#444;\">—</span>";
-
-        var evCount = (st.event_count != null)
-            ? "<span style=\"color:" + (st.event_count > 0 ? "#4caf70" : "#666") + ";font-weight:600;\">" + st.event_count + "</span>"
-            : "<span style=\"color:#444;\">—</span>";
-
-        var rowId = "row-" + btoa(url).replace(/[^a-zA-Z0-9]/g,"").slice(0,12);
-
-        return "<tr id=\"" + rowId + "\">" +
-            "<td>" +
-              "<div class=\"src-name\" onclick=\"selectSource('" + escJs(url) + "','" + escJs(u.name) + "'," + (u.playwright !== false) + "," + p + ")\">" + esc(u.name) + "</div>" +
-              "<div class=\"src-url\">" + esc(url.replace(/^https?:\/\//, "").split("/")[0]) + "</div>" +
-            "</td>" +
-            "<td style=\"text-align:center;\">" + pTag(p) + "</td>" +
-            "<td style=\"color:#555;white-space:nowrap;\">" + esc(relTime(st.last_scraped)) + "</td>" +
-            "<td style=\"text-align:center;\">" + statusCell + "</td>" +
-            "<td style=\"text-align:center;\">" + evCount + "</td>" +
-            "<td>" + methodCell + "</td>" +
-            "<td style=\"text-align:center;white-space:nowrap;\">" +
-              "<button class=\"row-btn row-scrape\" id=\"btn-" + rowId + "\"" +
-                (isRunning ? " disabled" : "") +
-                " onclick=\"scrapeSource('" + escJs(url) + "','" + escJs(u.name) + "'," + (u.playwright !== false) + "," + p + ")\"" +
-              ">&#9654;</button>" +
-              "<button class=\"row-btn row-del\" onclick=\"deleteUrl('" + escJs(url) + "')\">&#215;</button>" +
-            "</td>" +
-        "</tr>";
-    }).join("");
-}
-
-function selectSource(url, name, pw, vp) {
-    document.getElementById("url").value    = url;
-    document.getElementById("source").value = name;
-    document.getElementById("playwright").checked = pw;
-    document.getElementById("venue-priority").value = vp || 2;
-}
-
-async function deleteUrl(url) {
-    await fetch("/saved-urls", {
-        method: "DELETE",
-        headers: {"Content-Type": "application/json"},
-        body: JSON.stringify({url: url})
-    });
-    loadSourceTable();
-}
-
-async function saveUrl() {
-    var url = document.getElementById("url").value.trim();
-    var name = document.getElementById("source").value.trim();
-    var pw = document.getElementById("playwright").checked;
-    var vp = parseInt(document.getElementById("venue-priority").value);
-    if (!url || !name) { status("Enter a URL and source name", "error"); return; }
-    try {
-        await fetch("/saved-urls", {
-            method: "POST",
-            headers: {"Content-Type": "application/json"},
-            body: JSON.stringify({url: url, name: name, playwright: pw, venue_priority: vp})
-        });
-        status("Saved " + name + " (P" + vp + ")", "success");
-        loadSourceTable();
-    } catch(e) { status("Save error: " + e.message, "error"); }
-}
-
-async function scrapeSource(url, name, usePw, vp) {
-    if (runningUrls.has(url)) return;
-    runningUrls.add(url);
-    renderSourceTable();
-    try {
-        var r = await fetch("/scrape-source", {
-            method: "POST",
-            headers: {"Content-Type": "application/json"},
-            body: JSON.stringify({url: url, name: name, use_playwright: usePw, venue_priority: vp})
-        });
-        var d = await r.json();
-        if (d.error && !d.status) {
-            scrapeStatus[url] = { status: "error", error: d.error, last_scraped: new Date().toISOString(), event_count: 0, methods: [] };
-        } else {
-            scrapeStatus[url] = {
-                status:       d.status,
-                event_count:  d.event_count,
-                methods:      d.methods,
-                last_scraped: d.last_scraped,
-                error:        d.error,
-                error_report: d.error_report,
-            };
-        }
-    } catch(e) {
-        scrapeStatus[url] = { status: "error", error: e.message, last_scraped: new Date().toISOString(), event_count: 0, methods: [] };
-    } finally {
-        runningUrls.delete(url);
-        renderSourceTable();
-    }
-}
-
-async function scrapeAll() {
-    var statusEl = document.getElementById("scrape-all-status");
-    var bar      = document.getElementById("progress-fill");
-    var barC     = document.getElementById("progress-bar");
-    var counter  = document.getElementById("scrape-all-counter");
-    var btn      = document.getElementById("scrape-all-btn");
-
-    btn.disabled = true;
-    statusEl.className = "status loading";
-    statusEl.innerHTML = "<span class=\"spinner\"></span>Starting priority run...";
-    statusEl.classList.remove("hidden");
-    barC.classList.remove("hidden");
-    counter.classList.remove("hidden");
-    bar.style.width = "0%";
-    counter.textContent = "";
-
-    try {
-        var response = await fetch("/scrape-all", { method: "POST" });
-        var reader   = response.body.getReader();
-        var decoder  = new TextDecoder();
-        var buffer   = "";
-        var total    = 0;
-
-        while (true) {
-            var chunk = await reader.read();
-            if (chunk.done) break;
-            buffer += decoder.decode(chunk.value, { stream: true });
-            var lines = buffer.split("\n");
-            buffer = lines.pop();
-
-            for (var i = 0; i < lines.length; i++) {
-                if (lines[i].indexOf("data: ") !== 0) continue;
-                try {
-                    var d = JSON.parse(lines[i].slice(6));
-                    if (d.type === "start") {
-                        total = d.total_sources;
-                        counter.textContent = "0 / " + total;
-                        statusEl.innerHTML = "<span class=\"spinner\"></span>Scraping P1 (" + d.p1 + ") \u2192 P2 (" + d.p2 + ") \u2192 P3 (" + d.p3 + ")";
-                    } else if (d.type === "tier_start") {
-                        statusEl.innerHTML = "<span class=\"spinner\"></span>Running P" + d.tier + " tier (" + d.count + " sources concurrently)";
-                    } else if (d.type === "source_start") {
-                        runningUrls.add(d.url);
-                        renderSourceTable();
-                    } else if (d.type === "source_done") {
-                        runningUrls.delete(d.url);
-                        scrapeStatus[d.url] = {
-                            status:       d.status,
-                            event_count:  d.event_count,
-                            methods:      d.methods,
-                            last_scraped: new Date().toISOString(),
-                            error:        d.error,
-                            error_report: d.error_report,
-                        };
-                        bar.style.width = Math.round((d.completed / d.total) * 100) + "%";
-                        counter.textContent = d.completed + " / " + d.total;
-                        renderSourceTable();
-                    } else if (d.type === "complete") {
-                        bar.style.width = "100%";
-                        statusEl.className = "status success";
-                        statusEl.textContent = "Done \u2014 " + d.total_events + " events found, " + d.total_saved + " saved to DB (" + d.sources_scraped + " sources)";
-                        counter.textContent = d.sources_scraped + " / " + total;
-                    }
-                } catch(pe) {}
-            }
-        }
-    } catch(e) {
-        statusEl.className = "status error";
-        statusEl.textContent = "Error: " + e.message;
-    } finally {
-        runningUrls.clear();
-        btn.disabled = false;
-        renderSourceTable();
-    }
-}
-
-async function scrape() {
-    var url       = document.getElementById("url").value.trim();
-    var src       = document.getElementById("source").value.trim() || "unknown";
-    var pw        = document.getElementById("playwright").checked;
-    var futureOnly = document.getElementById("future-only").checked;
-    if (!url) { status("Enter a URL", "error"); return; }
-
-    document.getElementById("log-box").innerHTML = "";
-    document.getElementById("scrape-btn").disabled = true;
-    document.getElementById("results").classList.add("hidden");
-    status("Scraping " + src + "...");
-    log("Fetching: " + url);
-    log("Method: " + (pw ? "Playwright" : "httpx") + " | Future only: " + futureOnly, "i");
-
-    try {
-        var r = await fetch("/scrape", {
-            method: "POST",
-            headers: {"Content-Type": "application/json"},
-            body: JSON.stringify({url: url, source_name: src, use_playwright: pw, future_only: futureOnly})
-        });
-        var d = await r.json();
-
-        if (d.robots_blocked) { log("BLOCKED by robots.txt", "e"); status(d.error, "error"); return; }
-        if (d.error) { log("ERROR: " + d.error, "e"); status("Error: " + d.error, "error"); return; }
-
-        events = d.events;
-        log("HTML: " + (d.html_size/1024).toFixed(1) + "KB | Found " + events.length + " events", "s");
-        if (d.methods && d.methods.length) log("Methods: " + d.methods.join(", "), "i");
-
-        document.getElementById("stat-count").textContent = events.length;
-        document.getElementById("stat-html").textContent  = (d.html_size/1024).toFixed(1) + "KB";
-
-        var md = document.getElementById("methods-used");
-        md.innerHTML = (d.methods||[]).map(function(m){ return "<span class=\"method-tag\">" + m + "</span>"; }).join("");
-
-        var list = document.getElementById("event-list");
-        if (!events.length) {
-            list.innerHTML = "<p style=\"color:#666;\">No events found.</p>";
-        } else {
-            list.innerHTML = events.map(function(e) {
-                return "<div class=\"event-item\"><strong>" + esc(e.title||"Untitled") + "</strong>" +
-                    (e.date ? "<p>" + esc(e.date) + "</p>" : e.start_time ? "<p>" + esc(e.start_time) + "</p>" : "") +
-                    (e.venue ? "<p>" + esc(e.venue) + "</p>" : "") +
-                    (e.source_url ? "<a href=\"" + esc(e.source_url) + "\" target=\"_blank\">View &#8594;</a>" : "") +
-                    "</div>";
-            }).join("");
-        }
-
-        document.getElementById("results").classList.remove("hidden");
-        status("Found " + events.length + " events", "success");
-        loadSourceTable();
-    } catch(e) {
-        log("Error: " + e.message, "e");
-        status("Error: " + e.message, "error");
-    } finally {
-        document.getElementById("scrape-btn").disabled = false;
-    }
-}
+def _json_body(obj) -> bytes:
+    """Compact JSON request body; orjson when installed, stdlib otherwise."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits
+    return json.dumps(obj, separators=(',', ':')).encode()
 
-async function saveJSON() {
-    if (!events.length) return;
-    var src = document.getElementById("source").value.trim() || "unknown";
-    try {
-        var r = await fetch("/save", {
-            method: "POST",
-            headers: {"Content-Type": "application/json"},
-            body: JSON.stringify({events: events, source: src})
-        });
-        var d = await r.json();
-        status("Saved " + d.count + " events to " + d.filename, "success");
-    } catch(e) { status("Save error: " + e.message, "error"); }
-}
 
-async function sendToDatabase() {
-    if (!events.length) return;
-    status("Normalizing & sending to database...");
-    try {
-        var r = await fetch("/to-database", {
-            method: "POST",
-            headers: {"Content-Type": "application/json"},
-            body: JSON.stringify({events: events})
-        });
-        var d = await r.json();
-        var msg = d.saved + "/" + d.total + " saved";
-        if (d.normalized)        msg += " (normalized)";
-        if (d.venues_registered) msg += " | " + d.venues_registered + " venues";
-        if (d.venues_enriched)   msg += " (" + d.venues_enriched + " enriched)";
-        status(msg, "success");
-    } catch(e) { status("DB error: " + e.message, "error"); }
-}
+# ============================================================================
+# PRECOMPRESSED INDEX PAGE
+# ============================================================================
+# templates/scraperUI.html has no Jinja placeholders, so encode + compress it
+# once at import instead of re-rendering and re-encoding it on every GET /.
+# Its stylesheet is served separately under a content-hash query string so
+# browsers can cache it indefinitely.
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+INDEX_HTML_PATH = os.path.join(_HERE, 'templates', 'scraperUI.html')
+INDEX_CSS_PATH = os.path.join(_HERE, 'static', 'scraperUI.css')
+INDEX_CSS_URL = '/static/scraperUI.css'
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+
+with open(INDEX_CSS_PATH, 'rb') as _f:
+    INDEX_CSS_BYTES = _f.read()
+INDEX_CSS_GZIP = gzip.compress(INDEX_CSS_BYTES, 9)
+INDEX_CSS_BR = brotli.compress(INDEX_CSS_BYTES, quality=11) if BROTLI_AVAILABLE else None
+INDEX_CSS_HASH = hashlib.md5(INDEX_CSS_BYTES).hexdigest()
+INDEX_CSS_ETAG = f'"{INDEX_CSS_HASH}"'
+
+with open(INDEX_HTML_PATH, 'rb') as _f:
+    INDEX_HTML_BYTES = _f.read().replace(
+        INDEX_CSS_URL.encode(), f"{INDEX_CSS_URL}?v={INDEX_CSS_HASH[:12]}".encode())
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML_BYTES, 9)
+INDEX_HTML_BR = brotli.compress(INDEX_HTML_BYTES, quality=11) if BROTLI_AVAILABLE else None
+INDEX_HTML_ETAG = '"' + hashlib.md5(INDEX_HTML_BYTES).hexdigest() + '"'
+
+
+def _precompressed_response(raw: bytes, gz: bytes, br: bytes, etag: str, mimetype: str = 'text/html',
+                            cache_control: str = 'no-cache'):
+    """Serve a precompressed static body, honoring Accept-Encoding and If-None-Match."""
+    headers = {'ETag': etag, 'Vary': 'Accept-Encoding', 'Cache-Control': cache_control}
+    if etag in request.headers.get('If-None-Match', ''):
+        return Response(status=304, headers=headers)
+
+    ae = request.headers.get('Accept-Encoding', '').lower()
+    if br is not None and 'br' in ae:
+        body, headers['Content-Encoding'] = br, 'br'
+    elif 'gzip' in ae:
+        body, headers['Content-Encoding'] = gz, 'gzip'
+    else:
+        body = raw
+    return Response(body, mimetype=mimetype, headers=headers)
 
-loadSourceTable();
-    </script>
-</body>
-</html>
-'''
 
+# ============================================================================
+# HTML TEMPLATE
+# ============================================================================
 
 VENUE_PRIORITY_HTML = '''
 <!DOCTYPE html>
@@ -754,7 +186,7 @@ VENUE_PRIORITY_HTML = '''
             <div class="legend-item"><div class="dot dot-3"></div> P3 Standard — libraries, restaurants, etc.</div>
         </div>
         <div class="toolbar">
-            <input type="text" id="search" placeholder="Search venues..." oninput="renderTable()">
+            <input type="text" id="search" placeholder="Search venues..." oninput="scheduleRenderTable()">
             <div class="filter-btns">
                 <button class="filter-btn active" onclick="setFilter('all', this)">All</button>
                 <button class="filter-btn" onclick="setFilter('1', this)">P1</button>
@@ -789,6 +221,14 @@ function setFilter(f, btn) {
     renderTable();
 }
 
+// Rebuilding the whole venue table per keystroke stalls typing on large
+// lists; wait for a short pause in input first.
+var renderTimer = null;
+function scheduleRenderTable() {
+    clearTimeout(renderTimer);
+    renderTimer = setTimeout(renderTable, 150);
+}
+
 function renderTable() {
     var q = document.getElementById('search').value.toLowerCase();
     var rows = allVenues.filter(function(v) {
@@ -811,15 +251,15 @@ function renderTable() {
 
     rows.forEach(function(v) {
         var p = v.venue_priority || 3;
-        html += '<tr id="row-' + v.id + '">' +
+        html += '<tr id="row-' + esc(v.id) + '" data-id="' + esc(v.id) + '">' +
             '<td><div class="venue-name">' + esc(v.name) + '</div></td>' +
             '<td><div class="venue-address">' + esc(v.address || '—') + '</div></td>' +
             '<td>' + (v.website ? '<a class="website-link" href="' + esc(v.website) + '" target="_blank">' + esc(v.website.replace(/https?:\\/\\//, '').split('/')[0]) + '</a>' : '<span style="color:#444">—</span>') + '</td>' +
             '<td><div class="priority-cell">' +
-                '<button class="p-btn ' + (p===1?'active-1':'') + '" onclick="setPriority(\'' + v.id + '\', 1, this)">P1</button>' +
-                '<button class="p-btn ' + (p===2?'active-2':'') + '" onclick="setPriority(\'' + v.id + '\', 2, this)">P2</button>' +
-                '<button class="p-btn ' + (p===3?'active-3':'') + '" onclick="setPriority(\'' + v.id + '\', 3, this)">P3</button>' +
-                '<span id="msg-' + v.id + '"></span>' +
+                '<button class="p-btn ' + (p===1?'active-1':'') + '" data-p="1">P1</button>' +
+                '<button class="p-btn ' + (p===2?'active-2':'') + '" data-p="2">P2</button>' +
+                '<button class="p-btn ' + (p===3?'active-3':'') + '" data-p="3">P3</button>' +
+                '<span id="msg-' + esc(v.id) + '"></span>' +
             '</div></td>' +
         '</tr>';
     });
@@ -828,6 +268,14 @@ function renderTable() {
     document.getElementById('table-wrap').innerHTML = html;
 }
 
+// Priority buttons are handled by one delegated listener reading data-id /
+// data-p, rather than inline onclick strings with quoted ids.
+document.getElementById('table-wrap').addEventListener('click', function(e) {
+    var btn = e.target.closest('.p-btn');
+    if (!btn) return;
+    setPriority(btn.closest('tr').dataset.id, parseInt(btn.dataset.p), btn);
+});
+
 async function setPriority(id, priority, btn) {
     var msg = document.getElementById('msg-' + id);
     msg.className = 'saving';
@@ -874,19 +322,86 @@ loadVenues();
 </html>
 '''
 
+# Static page with no template variables: skip Jinja and precompress once,
+# same as the index page.
+VENUE_PRIORITY_BYTES = VENUE_PRIORITY_HTML.encode('utf-8')
+VENUE_PRIORITY_GZIP = gzip.compress(VENUE_PRIORITY_BYTES, 9)
+VENUE_PRIORITY_BR = brotli.compress(VENUE_PRIORITY_BYTES, quality=11) if BROTLI_AVAILABLE else None
+VENUE_PRIORITY_ETAG = '"' + hashlib.md5(VENUE_PRIORITY_BYTES).hexdigest() + '"'
+
 
 # ============================================================================
 # EVENT TRANSFORMATION
 # ============================================================================
+# Called once per event on every DB upload, so imports, the timezone object
+# and the price-cleanup regex live at module scope.
+
+TULSA_TZ = pytz.timezone('America/Chicago')
+_PRICE_STRIP_RE = re.compile(r'[$,]')
+
+
+# Non-ISO shapes the extractors commonly emit ("Sat, Dec 5, 2026",
+# "December 5, 2026 7:30 PM", "12/05/2026"). Matched with one regex and
+# built directly — a chain of strptime attempts costs as much as dateutil.
+_MONTH_DATE_RE = re.compile(
+    r'(?:[A-Za-z]+,?\s+)?(?P<mon>[A-Za-z]{3,9})\.?\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{4})'
+    r'(?:,?\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<ampm>[AaPp][Mm]))?'
+)
+_NUMERIC_DATE_RE = re.compile(
+    r'(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4})'
+    r'(?:\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<ampm>[AaPp][Mm]))?'
+)
+_MONTH_NUMBERS = {
+    name: num
+    for num, names in enumerate((
+        ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'),
+        ('may',), ('jun', 'june'), ('jul', 'july'), ('aug', 'august'),
+        ('sep', 'sept', 'september'), ('oct', 'october'), ('nov', 'november'), ('dec', 'december'),
+    ), start=1)
+    for name in names
+}
+
+
+def _datetime_from_match(m, month: int) -> datetime:
+    hour = minute = 0
+    if m['hour']:
+        hour, minute = int(m['hour']) % 12, int(m['minute'])
+        if m['ampm'].lower() == 'pm':
+            hour += 12
+    return datetime(int(m['year']), month, int(m['day']), hour, minute)
+
+
+def _parse_event_datetime(value) -> datetime:
+    """
+    Parse a scraped date/time string. Most API extractors already hand us
+    ISO-8601, which fromisoformat handles far faster than a fuzzy dateutil
+    parse; a few other known shapes are matched directly, and anything else
+    still goes through dateutil. Raises on failure.
+    """
+    text = str(value).strip()
+    if len(text) >= 10 and text[4] == '-' and text[7] == '-':
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+    else:
+        try:
+            m = _MONTH_DATE_RE.fullmatch(text)
+            if m and m['mon'].lower() in _MONTH_NUMBERS:
+                return _datetime_from_match(m, _MONTH_NUMBERS[m['mon'].lower()])
+            m = _NUMERIC_DATE_RE.fullmatch(text)
+            if m:
+                return _datetime_from_match(m, int(m['month']))
+        except ValueError:
+            pass  # out-of-range day/month — let dateutil have a go
+    return date_parser.parse(text, fuzzy=True)
+
 
 def transform_event_for_backend(event: dict, source_priority: int = None) -> dict:
     """
     Transform scraped event to match Rust backend's CreateEvent schema.
     Used as primary transform after normalization, or as fallback if LLM is down.
     """
-    from dateutil import parser as date_parser
-    from datetime import timezone, datetime, timedelta
-
     transformed = {
         'title': event.get('title', 'Untitled Event'),
     }
@@ -922,24 +437,21 @@ def transform_event_for_backend(event: dict, source_priority: int = None) -> dic
     )
     if date_str:
         try:
-            import pytz as _pytz
-            tulsa_tz = _pytz.timezone('America/Chicago')
-            parsed_date = date_parser.parse(str(date_str), fuzzy=True)
+            parsed_date = _parse_event_datetime(date_str)
             if parsed_date.tzinfo is None:
                 # Naive datetime — assume Tulsa local time (CDT/CST) and convert to UTC
-                parsed_date = tulsa_tz.localize(parsed_date).astimezone(_pytz.utc)
+                parsed_date = TULSA_TZ.localize(parsed_date).astimezone(pytz.utc)
             else:
                 # Already has timezone info — just convert to UTC
-                parsed_date = parsed_date.astimezone(_pytz.utc)
+                parsed_date = parsed_date.astimezone(pytz.utc)
             transformed['start_time'] = parsed_date.isoformat()
         except Exception as e:
             print(f"[DB] Timezone parse error for '{date_str}': {e}")
             # Fallback: try basic parse and stamp as UTC
             try:
-                parsed_date = date_parser.parse(str(date_str), fuzzy=True)
-                from datetime import timezone as _tz
+                parsed_date = _parse_event_datetime(date_str)
                 if parsed_date.tzinfo is None:
-                    parsed_date = parsed_date.replace(tzinfo=_tz.utc)
+                    parsed_date = parsed_date.replace(tzinfo=timezone.utc)
                 transformed['start_time'] = parsed_date.isoformat()
             except:
                 fallback = datetime.now(timezone.utc) + timedelta(days=1)
@@ -957,20 +469,17 @@ def transform_event_for_backend(event: dict, source_priority: int = None) -> dic
     )
     if end_str:
         try:
-            import pytz as _pytz
-            tulsa_tz = _pytz.timezone('America/Chicago')
-            parsed_end = date_parser.parse(str(end_str), fuzzy=True)
+            parsed_end = _parse_event_datetime(end_str)
             if parsed_end.tzinfo is None:
-                parsed_end = tulsa_tz.localize(parsed_end).astimezone(_pytz.utc)
+                parsed_end = TULSA_TZ.localize(parsed_end).astimezone(pytz.utc)
             else:
-                parsed_end = parsed_end.astimezone(_pytz.utc)
+                parsed_end = parsed_end.astimezone(pytz.utc)
             transformed['end_time'] = parsed_end.isoformat()
         except Exception as e:
             try:
-                parsed_end = date_parser.parse(str(end_str), fuzzy=True)
-                from datetime import timezone as _tz
+                parsed_end = _parse_event_datetime(end_str)
                 if parsed_end.tzinfo is None:
-                    parsed_end = parsed_end.replace(tzinfo=_tz.utc)
+                    parsed_end = parsed_end.replace(tzinfo=timezone.utc)
                 transformed['end_time'] = parsed_end.isoformat()
             except:
                 pass
@@ -1017,7 +526,7 @@ def transform_event_for_backend(event: dict, source_priority: int = None) -> dic
             pass
 
     if price_min is None and event.get('price'):
-        price_str = str(event['price']).replace('$', '').replace(',', '').strip()
+        price_str = _PRICE_STRIP_RE.sub('', str(event['price'])).strip()
         if '-' in price_str:
             parts = price_str.split('-')
             try:
@@ -1070,107 +579,269 @@ def transform_event_for_backend(event: dict, source_priority: int = None) -> dic
     return transformed
 
 
+# ============================================================================
+# BACKEND EVENT POSTING
+# ============================================================================
+# One pooled AsyncClient per batch instead of a fresh httpx.post (new TCP
+# connection) per event from a 10-thread pool.
+
+DB_POST_CONCURRENCY = 32
+
+
+def _prepare_backend_event(event: dict, source_url: str, source_name: str,
+                           source_priority: int = None) -> dict:
+    """transform_event_for_backend plus the per-batch source fields."""
+    transformed = transform_event_for_backend(event, source_priority=source_priority)
+    # Synthetic unique source_url so events from venues without
+    # per-event permalinks don't all collapse onto one DB row.
+    if not transformed.get('source_url'):
+        slug = (
+            f"{source_url}|"
+            f"{transformed.get('title','').lower().strip()}|"
+            f"{transformed.get('start_time','')}"
+        )
+        uid = hashlib.md5(slug.encode()).hexdigest()[:8]
+        transformed['source_url'] = f"{source_url.rstrip('/')}#event-{uid}"
+    if not transformed.get('source_name'):
+        transformed['source_name'] = source_name
+    # Canonical venue name from the scrape source
+    if source_name:
+        transformed['venue'] = source_name
+    return transformed
+
+
+async def _post_events_async(events: list, source_url: str, source_name: str, tag: str,
+                             source_priority: int = None) -> list:
+    sem = asyncio.Semaphore(DB_POST_CONCURRENCY)
+    limits = httpx.Limits(max_connections=DB_POST_CONCURRENCY, max_keepalive_connections=DB_POST_CONCURRENCY)
+
+    # Failures are tallied per status code / exception type and reported
+    # once at the end — a backend outage would otherwise print one line per
+    # event from inside the fan-out.
+    failures = Counter()
+    samples = {}
+
+    def note_failure(key: str, detail: str):
+        failures[key] += 1
+        samples.setdefault(key, detail)
+
+    # Transform up front so a bad event fails here instead of holding a
+    # connection slot while dateutil grinds through it.
+    payloads = []
+    for event in events:
+        try:
+            payloads.append(_prepare_backend_event(event, source_url, source_name, source_priority))
+        except Exception as e:
+            note_failure(f"transform {type(e).__name__}", str(e))
+
+    async with httpx.AsyncClient(timeout=5, limits=limits, headers=JSON_HEADERS) as client:
+        async def post_event(transformed):
+            async with sem:
+                try:
+                    resp = await client.post(f"{BACKEND_URL}/api/events", content=_json_body(transformed))
+                    if resp.status_code not in [200, 201]:
+                        note_failure(f"HTTP {resp.status_code}", resp.text[:100])
+                    return resp.status_code in [200, 201]
+                except Exception as e:
+                    note_failure(type(e).__name__, str(e))
+                    return False
+
+        results = await asyncio.gather(*(post_event(p) for p in payloads))
+
+    for key, count in failures.most_common():
+        print(f"[{tag}] {count} event(s) not saved ({key}), e.g. {samples[key]}")
+    return results
+
+
+def post_events_to_backend(events: list, source_url: str, source_name: str, tag: str = "DB",
+                           source_priority: int = None) -> int:
+    """Transform and POST events to the Rust backend concurrently. Returns the saved count."""
+    if not events:
+        return 0
+    return sum(asyncio.run(_post_events_async(events, source_url, source_name, tag, source_priority)))
+
+
 # ============================================================================
 # LLM NORMALIZATION (Gemini via LLM Service on :8001)
 # ============================================================================
 
-def normalize_batch(events: list, source_url: str = "", source_name: str = "") -> list:
+NORMALIZE_CHUNK_SIZE = 10
+NORMALIZE_CONCURRENCY = 3          # chunks in flight at the LLM service
+NORMALIZE_START_INTERVAL = 1.0     # seconds between chunk starts
+NORMALIZE_MAX_RETRIES = 5
+NORMALIZE_MAX_CONSECUTIVE_FAILURES = 3  # Abort early if Gemini is completely down
+
+# Rescrapes resubmit mostly the same cards, and each chunk is a multi-second
+# Gemini call. Normalized chunks are remembered for an hour (keyed on today's
+# date too, since relative dates resolve against it) and persisted across
+# restarts like the Places cache.
+NORMALIZE_CACHE_FILE = OUTPUT_DIR / "normalize_cache.json"
+NORMALIZE_CACHE_TTL = 3600
+NORMALIZE_CACHE_MAX = 512
+_normalize_cache = None  # {sha256 hex: (events, expires_at)}, loaded lazily
+# Scrape requests run on separate Flask threads; guards load, evict/insert and save
+_normalize_cache_lock = threading.Lock()
+
+
+def _get_normalize_cache() -> dict:
+    global _normalize_cache
+    with _normalize_cache_lock:
+        if _normalize_cache is None:
+            _normalize_cache = {}
+            try:
+                now = time.time()
+                for key, (events, expires_at) in json.loads(NORMALIZE_CACHE_FILE.read_text()).items():
+                    if expires_at > now:
+                        _normalize_cache[key] = (events, expires_at)
+            except Exception:
+                pass
+    return _normalize_cache
+
+
+def _store_normalized_chunk(cache_key: str, events: list):
+    with _normalize_cache_lock:
+        if cache_key not in _normalize_cache and len(_normalize_cache) >= NORMALIZE_CACHE_MAX:
+            _normalize_cache.pop(next(iter(_normalize_cache)))
+        _normalize_cache[cache_key] = (events, time.time() + NORMALIZE_CACHE_TTL)
+
+
+@atexit.register
+def _save_normalize_cache():
+    with _normalize_cache_lock:
+        if not _normalize_cache:
+            return
+        try:
+            NORMALIZE_CACHE_FILE.write_text(json.dumps(_normalize_cache))
+        except Exception as e:
+            print(f"[Normalize] Failed to save cache: {e}")
+
+
+def _normalize_cache_key(source_url: str, body: bytes) -> str:
+    # Collapse whitespace so trivially reformatted cards still hit
+    content = " ".join(body.decode().split())
+    return hashlib.sha256(f"{datetime.now().date()}|{source_url}|{content}".encode()).hexdigest()
+
+
+async def _normalize_chunks_async(chunks: list, source_url: str) -> list | None:
     """
-    Send a batch of scraped events through the LLM normalization endpoint.
-    Retries on 503 (Gemini overload) with exponential backoff.
-    Chunks into groups of 10 to stay within token limits.
+    Normalize chunks concurrently over one pooled client. Chunk starts are
+    spaced NORMALIZE_START_INTERVAL apart so Gemini sees a steady trickle
+    rather than a burst. Returns per-chunk results in order (None for a
+    failed chunk), or None if the LLM service isn't reachable at all.
     """
-    import time
-
-    all_normalized = []
-    chunk_size = 10
-    failed_chunks = 0
-    consecutive_failures = 0
-    MAX_RETRIES = 5
-    MAX_CONSECUTIVE_FAILURES = 3  # Abort early if Gemini is completely down
-    total_chunks = (len(events) + chunk_size - 1) // chunk_size
-
-    for i in range(0, len(events), chunk_size):
-        chunk = events[i:i + chunk_size]
-        chunk_num = i // chunk_size + 1
-
-        # Abort early if Gemini has failed too many times in a row
-        if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-            remaining = total_chunks - chunk_num + 1
-            print(f"[Normalize] Aborting: {consecutive_failures} consecutive failures. "
-                  f"Skipping remaining {remaining} chunk(s).")
-            failed_chunks += remaining
-            break
-
-        # Strip blank start_time so Gemini infers from title/description
-        # rather than receiving an empty string that fails Pydantic validation
-        clean_chunk = []
-        for ev in chunk:
-            ev_copy = dict(ev)
-            if not ev_copy.get('start_time'):
-                ev_copy.pop('start_time', None)
-            clean_chunk.append(ev_copy)
-
-        payload = {
-            "raw_content": json.dumps(clean_chunk),
-            "source_url": source_url,
-            "content_type": "json"
-        }
+    sem = asyncio.Semaphore(NORMALIZE_CONCURRENCY)
+    limits = httpx.Limits(max_connections=NORMALIZE_CONCURRENCY,
+                          max_keepalive_connections=NORMALIZE_CONCURRENCY)
+    pacing = asyncio.Lock()
+    state = {'next_start': 0.0, 'consecutive_failures': 0, 'unreachable': False}
+    total_chunks = len(chunks)
+    cache = _get_normalize_cache()
+
+    async def wait_turn():
+        async with pacing:
+            delay = state['next_start'] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            state['next_start'] = time.monotonic() + NORMALIZE_START_INTERVAL
+
+    async with httpx.AsyncClient(timeout=120, limits=limits, headers=JSON_HEADERS) as client:
+        async def normalize_chunk(chunk_num: int, chunk: list) -> list | None:
+            async with sem:
+                if state['unreachable']:
+                    return None
+                # Abort early if Gemini has failed too many times in a row
+                if state['consecutive_failures'] >= NORMALIZE_MAX_CONSECUTIVE_FAILURES:
+                    print(f"[Normalize] Chunk {chunk_num}/{total_chunks}: skipped after "
+                          f"{state['consecutive_failures']} consecutive failures")
+                    return None
+
+                # Strip blank start_time so Gemini infers from title/description
+                # rather than receiving an empty string that fails Pydantic validation
+                clean_chunk = []
+                for ev in chunk:
+                    ev_copy = dict(ev)
+                    if not ev_copy.get('start_time'):
+                        ev_copy.pop('start_time', None)
+                    clean_chunk.append(ev_copy)
+
+                chunk_body = _json_body(clean_chunk)
+                cache_key = _normalize_cache_key(source_url, chunk_body)
+                cached = cache.get(cache_key)
+                if cached and cached[1] > time.time():
+                    print(f"[Normalize] Chunk {chunk_num}/{total_chunks}: ♻️ unchanged since last run, reusing {len(cached[0])} events")
+                    return cached[0]
+
+                payload = {
+                    "raw_content": chunk_body.decode(),
+                    "source_url": source_url,
+                    "content_type": "json"
+                }
+                body = _json_body(payload)
 
-        success = False
-        for attempt in range(MAX_RETRIES):
-            try:
-                resp = httpx.post(
-                    f"{LLM_SERVICE_URL}/api/normalize",
-                    json=payload,
-                    timeout=120
-                )
-
-                if resp.status_code == 200:
-                    data = resp.json()
-                    normalized = data.get("events", [])
-                    if normalized:
-                        print(f"[Normalize] Chunk {chunk_num}/{total_chunks}: {len(chunk)} raw → {len(normalized)} normalized")
-                        all_normalized.extend(normalized)
-                        consecutive_failures = 0  # Reset on success
-                    else:
+                for attempt in range(NORMALIZE_MAX_RETRIES):
+                    await wait_turn()
+                    try:
+                        resp = await client.post(f"{LLM_SERVICE_URL}/api/normalize", content=body)
+                    except httpx.ConnectError:
+                        state['unreachable'] = True
+                        return None
+                    except Exception as e:
+                        print(f"[Normalize] Error: {e}")
+                        return None
+
+                    if resp.status_code == 200:
+                        state['consecutive_failures'] = 0  # Reset on success
+                        normalized = resp.json().get("events", [])
+                        if normalized:
+                            print(f"[Normalize] Chunk {chunk_num}/{total_chunks}: {len(chunk)} raw → {len(normalized)} normalized")
+                            _store_normalized_chunk(cache_key, normalized)
+                            return normalized
                         print(f"[Normalize] Chunk {chunk_num}/{total_chunks}: Got empty result, skipping chunk")
-                        failed_chunks += 1
-                    success = True
-                    break
+                        return None
 
-                elif resp.status_code in [500, 503]:
-                    # Longer backoff: 10s, 20s, 40s, 80s, 160s
-                    wait = 10 * (2 ** attempt)
-                    print(f"[Normalize] Gemini overloaded (attempt {attempt + 1}/{MAX_RETRIES}), retrying in {wait}s...")
-                    time.sleep(wait)
+                    if resp.status_code in [429, 500, 503]:
+                        # Longer backoff: 10s, 20s, 40s, 80s, 160s
+                        wait = 10 * (2 ** attempt)
+                        print(f"[Normalize] Gemini overloaded (attempt {attempt + 1}/{NORMALIZE_MAX_RETRIES}), retrying in {wait}s...")
+                        await asyncio.sleep(wait)
+                        continue
 
-                else:
                     print(f"[Normalize] API returned {resp.status_code}: {resp.text[:200]}")
-                    failed_chunks += 1
-                    success = True
-                    break
+                    return None
 
-            except httpx.ConnectError:
-                print(f"[Normalize] ⚠ LLM service not running at {LLM_SERVICE_URL} — using fallback")
-                return []
-            except Exception as e:
-                print(f"[Normalize] Error: {e}")
-                failed_chunks += 1
-                success = True
-                break
-
-        if not success:
-            print(f"[Normalize] Chunk {chunk_num}/{total_chunks}: All {MAX_RETRIES} retries failed, skipping")
-            failed_chunks += 1
-            consecutive_failures += 1
-
-        # Longer delay between chunks to avoid hammering Gemini
-        # Increase delay after failures to give the API more recovery time
-        if consecutive_failures > 0:
-            time.sleep(8)
-        else:
-            time.sleep(4)
+                print(f"[Normalize] Chunk {chunk_num}/{total_chunks}: All {NORMALIZE_MAX_RETRIES} retries failed, skipping")
+                state['consecutive_failures'] += 1
+                return None
+
+        results = await asyncio.gather(
+            *(normalize_chunk(n, chunk) for n, chunk in enumerate(chunks, 1))
+        )
+
+    if state['unreachable']:
+        return None
+    return results
+
+
+def normalize_batch(events: list, source_url: str = "", source_name: str = "") -> list:
+    """
+    Send a batch of scraped events through the LLM normalization endpoint.
+    Chunks into groups of 10 to stay within token limits, keeps a few chunks
+    in flight at once, and retries 429/5xx (Gemini overload) with
+    exponential backoff.
+    """
+    if not events:
+        return []
+
+    chunks = [events[i:i + NORMALIZE_CHUNK_SIZE] for i in range(0, len(events), NORMALIZE_CHUNK_SIZE)]
+    total_chunks = len(chunks)
+
+    results = asyncio.run(_normalize_chunks_async(chunks, source_url))
+    if results is None:
+        print(f"[Normalize] ⚠ LLM service not running at {LLM_SERVICE_URL} — using fallback")
+        return []
+
+    all_normalized = [ev for chunk_events in results if chunk_events for ev in chunk_events]
+    failed_chunks = sum(1 for chunk_events in results if not chunk_events)
 
     if failed_chunks:
         print(f"[Normalize] {failed_chunks}/{total_chunks} chunk(s) failed — {len(all_normalized)} events normalized total")
@@ -1213,10 +884,79 @@ def _geocode_venue(venue_name: str, city: str = "Tulsa, OK") -> tuple:
 # VENUE MANAGER HELPERS
 # ============================================================================
 
-async def lookup_venue_google_places(venue_name: str, city: str = "Tulsa, OK") -> dict:
+# Places lookups cost two billed round-trips (text search + details), and the
+# same venues get looked up again on every /to-database run. Successful
+# results are cached for a week and persisted across restarts.
+PLACES_CACHE_FILE = OUTPUT_DIR / "places_cache.json"
+PLACES_CACHE_TTL = 7 * 86400
+PLACES_CACHE_MAX = 2048
+_places_cache = None  # {"name|city": (result, expires_at)}, loaded lazily
+_places_cache_lock = threading.Lock()
+
+
+def _get_places_cache() -> dict:
+    global _places_cache
+    with _places_cache_lock:
+        if _places_cache is None:
+            _places_cache = {}
+            try:
+                now = time.time()
+                for key, (result, expires_at) in json.loads(PLACES_CACHE_FILE.read_text()).items():
+                    if expires_at > now:
+                        _places_cache[key] = (result, expires_at)
+            except Exception:
+                pass
+    return _places_cache
+
+
+@atexit.register
+def _save_places_cache():
+    with _places_cache_lock:
+        if not _places_cache:
+            return
+        try:
+            PLACES_CACHE_FILE.write_text(json.dumps(_places_cache))
+        except Exception as e:
+            print(f"[Places] Failed to save cache: {e}")
+
+
+def places_client() -> httpx.AsyncClient:
+    """
+    Client for Places calls. Callers doing several lookups should open one
+    and pass it in, so the text-search and details requests share a
+    kept-alive (HTTP/2 where available) connection instead of a fresh TLS
+    handshake per call.
+    """
+    return httpx.AsyncClient(timeout=10, http2=HTTP2_AVAILABLE,
+                             limits=httpx.Limits(max_keepalive_connections=8))
+
+
+async def lookup_venue_google_places(venue_name: str, city: str = "Tulsa, OK",
+                                     client: httpx.AsyncClient = None) -> dict:
     """
     Look up venue details from Google Places API.
     """
+    cache = _get_places_cache()
+    cache_key = f"{venue_name.strip().lower()}|{city.strip().lower()}"
+    cached = cache.get(cache_key)
+    if cached and cached[1] > time.time():
+        return dict(cached[0])
+
+    if client is None:
+        async with places_client() as client:
+            result = await _fetch_venue_google_places(venue_name, city, client)
+    else:
+        result = await _fetch_venue_google_places(venue_name, city, client)
+    if 'error' not in result:
+        with _places_cache_lock:
+            if cache_key not in cache and len(cache) >= PLACES_CACHE_MAX:
+                cache.pop(next(iter(cache)))
+            cache[cache_key] = (result, time.time() + PLACES_CACHE_TTL)
+        result = dict(result)
+    return result
+
+
+async def _fetch_venue_google_places(venue_name: str, city: str, client: httpx.AsyncClient) -> dict:
     result = {
         "address": "",
         "website": "",
@@ -1230,109 +970,308 @@ async def lookup_venue_google_places(venue_name: str, city: str = "Tulsa, OK") -
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            search_query = f"{venue_name} {city}"
-            search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-            search_resp = await client.get(search_url, params={
-                "query": search_query,
+        search_query = f"{venue_name} {city}"
+        search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+        search_resp = await client.get(search_url, params={
+            "query": search_query,
+            "key": GOOGLE_PLACES_API_KEY,
+        })
+        search_data = search_resp.json()
+
+        if search_data.get("status") != "OK" or not search_data.get("results"):
+            return {"error": f"Place not found: {venue_name}"}
+
+        place = search_data["results"][0]
+        result["place_id"] = place.get("place_id", "")
+        result["address"] = place.get("formatted_address", "")
+        result["types"] = place.get("types", [])
+        result["rating"] = place.get("rating")
+
+        # Extract lat/lng from text search geometry
+        geometry = place.get("geometry", {})
+        location = geometry.get("location", {})
+        if location.get("lat") and location.get("lng"):
+            result["latitude"] = location["lat"]
+            result["longitude"] = location["lng"]
+
+        if result["place_id"]:
+            details_url = "https://maps.googleapis.com/maps/api/place/details/json"
+            details_resp = await client.get(details_url, params={
+                "place_id": result["place_id"],
+                "fields": "website,formatted_phone_number,wheelchair_accessible_entrance",
                 "key": GOOGLE_PLACES_API_KEY,
             })
-            search_data = search_resp.json()
-
-            if search_data.get("status") != "OK" or not search_data.get("results"):
-                return {"error": f"Place not found: {venue_name}"}
-
-            place = search_data["results"][0]
-            result["place_id"] = place.get("place_id", "")
-            result["address"] = place.get("formatted_address", "")
-            result["types"] = place.get("types", [])
-            result["rating"] = place.get("rating")
-
-            # Extract lat/lng from text search geometry
-            geometry = place.get("geometry", {})
-            location = geometry.get("location", {})
-            if location.get("lat") and location.get("lng"):
-                result["latitude"] = location["lat"]
-                result["longitude"] = location["lng"]
-
-            if result["place_id"]:
-                details_url = "https://maps.googleapis.com/maps/api/place/details/json"
-                details_resp = await client.get(details_url, params={
-                    "place_id": result["place_id"],
-                    "fields": "website,formatted_phone_number,wheelchair_accessible_entrance",
-                    "key": GOOGLE_PLACES_API_KEY,
-                })
-                details_data = details_resp.json()
+            details_data = details_resp.json()
 
-                if details_data.get("status") == "OK" and details_data.get("result"):
-                    details = details_data["result"]
-                    result["website"] = details.get("website", "")
-                    result["phone"] = details.get("formatted_phone_number", "")
-                    result["wheelchair_accessible"] = details.get("wheelchair_accessible_entrance")
+            if details_data.get("status") == "OK" and details_data.get("result"):
+                details = details_data["result"]
+                result["website"] = details.get("website", "")
+                result["phone"] = details.get("formatted_phone_number", "")
+                result["wheelchair_accessible"] = details.get("wheelchair_accessible_entrance")
 
-            return result
+        return result
 
     except Exception as e:
         return {"error": str(e)}
 
 
+_GOOGLE_TYPE_MAP = {
+    "bar": "Bar/Club",
+    "night_club": "Bar/Club",
+    "restaurant": "Restaurant",
+    "cafe": "Coffee Shop",
+    "museum": "Museum",
+    "art_gallery": "Gallery",
+    "movie_theater": "Theater",
+    "performing_arts_theater": "Theater",
+    "stadium": "Arena",
+    "church": "Church",
+    "park": "Park",
+    "library": "Library",
+    "university": "University",
+    "school": "University",
+    "casino": "Casino",
+    "lodging": "Hotel",
+    "bowling_alley": "Entertainment",
+    "amusement_park": "Entertainment",
+    "zoo": "Zoo/Aquarium",
+    "aquarium": "Zoo/Aquarium",
+}
+
+# Name keywords, checked as substrings in priority order: each branch is an
+# anchored lookahead, so the first keyword listed wins regardless of where
+# it appears in the name (e.g. "Brewery Park Museum" -> Museum).
+_NAME_TYPE_RE = re.compile(
+    r'^(?:(?=.*(?P<museum>museum))|(?=.*(?P<theater>theater|theatre))|(?=.*(?P<bar>bar|pub))'
+    r'|(?=.*(?P<church>church))|(?=.*(?P<park>park))|(?=.*(?P<concert>ballroom|center))'
+    r'|(?=.*(?P<brewery>brewery|brewing))|(?=.*(?P<coffee>coffee|cafe)))',
+    re.DOTALL,
+)
+_NAME_TYPE_LABELS = {
+    "museum": "Museum",
+    "theater": "Theater",
+    "bar": "Bar/Club",
+    "church": "Church",
+    "park": "Park",
+    "concert": "Concert Hall",
+    "brewery": "Brewery",
+    "coffee": "Coffee Shop",
+}
+
+
 def infer_venue_type_from_google(types: list, name: str) -> str:
     """Infer venue type from Google Places types."""
-    type_mapping = {
-        "bar": "Bar/Club",
-        "night_club": "Bar/Club",
-        "restaurant": "Restaurant",
-        "cafe": "Coffee Shop",
-        "museum": "Museum",
-        "art_gallery": "Gallery",
-        "movie_theater": "Theater",
-        "performing_arts_theater": "Theater",
-        "stadium": "Arena",
-        "church": "Church",
-        "park": "Park",
-        "library": "Library",
-        "university": "University",
-        "school": "University",
-        "casino": "Casino",
-        "lodging": "Hotel",
-        "bowling_alley": "Entertainment",
-        "amusement_park": "Entertainment",
-        "zoo": "Zoo/Aquarium",
-        "aquarium": "Zoo/Aquarium",
-    }
-
     for place_type in types:
-        if place_type in type_mapping:
-            return type_mapping[place_type]
-
-    name_lower = name.lower()
-    if "museum" in name_lower:
-        return "Museum"
-    elif "theater" in name_lower or "theatre" in name_lower:
-        return "Theater"
-    elif "bar" in name_lower or "pub" in name_lower:
-        return "Bar/Club"
-    elif "church" in name_lower:
-        return "Church"
-    elif "park" in name_lower:
-        return "Park"
-    elif "ballroom" in name_lower or "center" in name_lower:
-        return "Concert Hall"
-    elif "brewery" in name_lower or "brewing" in name_lower:
-        return "Brewery"
-    elif "coffee" in name_lower or "cafe" in name_lower:
-        return "Coffee Shop"
+        label = _GOOGLE_TYPE_MAP.get(place_type)
+        if label:
+            return label
+
+    m = _NAME_TYPE_RE.search(name.lower())
+    if m:
+        return _NAME_TYPE_LABELS[m.lastgroup]
 
     return "Venue"
 
 
+VENUE_POST_CONCURRENCY = 8
+
+
+async def _register_venues_async(venue_payloads: list) -> int:
+    """POST venues concurrently over one client, then fill gaps via Places."""
+    sem = asyncio.Semaphore(VENUE_POST_CONCURRENCY)
+
+    async with httpx.AsyncClient(timeout=5) as client, places_client() as places:
+        async def register(payload) -> bool:
+            async with sem:
+                try:
+                    # POST to backend (creates or returns existing)
+                    resp = await client.post(f"{BACKEND_URL}/api/venues", json=payload)
+                    if resp.status_code not in [200, 201]:
+                        return False
+                    existing = resp.json()
+                except Exception:
+                    return False
+
+                # Check if venue is missing data we can fill via Google Places
+                missing_address = not existing.get('address')
+                missing_website = not existing.get('website')
+                missing_coords = existing.get('latitude') is None
+                if not (missing_address or missing_website or missing_coords) or not GOOGLE_PLACES_API_KEY:
+                    return False
+
+                try:
+                    result = await lookup_venue_google_places(payload['name'], 'Tulsa, OK', places)
+                    if 'error' in result:
+                        return False
+                    patch_data = {}
+                    if missing_address and result.get('address'):
+                        patch_data['address'] = result['address']
+                    if missing_website and result.get('website'):
+                        patch_data['website'] = result['website']
+                    if missing_coords and result.get('latitude') and result.get('longitude'):
+                        patch_data['latitude'] = result['latitude']
+                        patch_data['longitude'] = result['longitude']
+                    if not patch_data:
+                        return False
+                    await client.patch(f"{BACKEND_URL}/api/venues/{existing.get('id')}", json=patch_data)
+                    return True
+                except Exception as e:
+                    print(f"[DB] Enrichment failed for '{payload['name']}': {e}")
+                    return False
+
+        return sum(await asyncio.gather(*(register(p) for p in venue_payloads)))
+
+
+def register_venues(venue_payloads: list) -> int:
+    """Register venues with the backend and auto-enrich them. Returns the enriched count."""
+    return asyncio.run(_register_venues_async(venue_payloads))
+
+
+# ============================================================================
+# SAVED EVENT FILES
+# ============================================================================
+# Scraped events are backed up to OUTPUT_DIR as JSON. orjson (optional) is a
+# few times faster than the stdlib at both ends for large event arrays.
+
+# Bookkeeping JSON that shares OUTPUT_DIR with the event backups
+EVENT_FILE_SKIP = {'venues.json', 'saved_urls.json', 'scrape_status.json',
+                   PLACES_CACHE_FILE.name, NORMALIZE_CACHE_FILE.name}
+EVENT_FILE_READERS = 8
+
+
+def write_events_file(path, events: list):
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(events, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(events, indent=2), encoding='utf-8')
+
+
+def _read_events_file(path):
+    raw = path.read_bytes()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def load_event_files(paths: list) -> tuple[list, list]:
+    """
+    Read saved event files in parallel.
+    Returns ([(name, events_or_None), ...] in input order, [error strings]).
+    """
+    def load(path):
+        try:
+            return path.name, _read_events_file(path), None
+        except Exception as e:
+            return path.name, None, f"{path.name}: {str(e)}"
+
+    with ThreadPoolExecutor(max_workers=EVENT_FILE_READERS) as pool:
+        results = list(pool.map(load, paths))
+    return [(name, events) for name, events, _ in results], [err for _, _, err in results if err]
+
+
+def dedupe_saved_events(events: list) -> list:
+    """
+    Drop events repeated across saved files. source_url alone isn't unique:
+    several extractors give every event on a page the venue's listing URL,
+    so the key also includes the title and start time.
+    """
+    seen = set()
+    unique = []
+    for e in events:
+        url = e.get('source_url') or e.get('url')
+        if url:
+            key = (url, (e.get('title') or '').lower().strip(),
+                   e.get('start_time') or e.get('date_start') or e.get('date') or '')
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(e)
+    return unique
+
+
+# ============================================================================
+# RAW HTML SNAPSHOTS
+# ============================================================================
+# /scrape keeps a copy of every fetched page for debugging extractors. Pages
+# can run to several MB, so compress them and write off the request thread —
+# the response never waits on disk.
+
+_html_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix='html-writer')
+
+
+def _write_html_snapshot(path, html: str):
+    try:
+        with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(html)
+    except Exception as e:
+        print(f"[Scrape] Failed to write {path.name}: {e}")
+
+
+def save_html_snapshot(html: str, safe_name: str, timestamp: str) -> str:
+    """Queue a gzipped copy of `html` for writing; returns the filename."""
+    filename = f"{safe_name}_{timestamp}.html.gz"
+    _html_writer.submit(_write_html_snapshot, OUTPUT_DIR / filename, html)
+    return filename
+
+
 # ============================================================================
 # ROUTE REGISTRATION
 # ============================================================================
 
+def _sse_response(q) -> Response:
+    """Stream dicts from a queue as SSE `data:` lines until a None sentinel."""
+    def generate():
+        while True:
+            try:
+                item = q.get(timeout=25)
+                if item is None:
+                    break
+                yield f"data: {json.dumps(item, default=str)}\n\n"
+            except Exception:
+                # Queue timed out — send SSE keepalive so proxy stays open
+                yield ": keepalive\n\n"
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+        'Connection': 'keep-alive',
+    })
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    jsonify() and request.get_json() backed by orjson. Datetimes are passed
+    through to Flask's default hook so they keep the same format as before;
+    anything orjson can't handle (NaN literals, >64-bit ints) falls back to
+    the stdlib provider.
+    """
+    _options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if ORJSON_AVAILABLE else 0
+
+    def dumps(self, obj, **kwargs) -> str:
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self._options)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 def register_routes(app):
     """Register all Flask routes on the given app instance."""
 
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+
     ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD", "")
     CRON_SECRET = os.environ.get("CRON_SECRET", "")
 
@@ -1366,7 +1305,12 @@ def register_routes(app):
 
     @app.route('/')
     def index():
-        return render_template('scraperUI.html')
+        return _precompressed_response(INDEX_HTML_BYTES, INDEX_HTML_GZIP, INDEX_HTML_BR, INDEX_HTML_ETAG)
+
+    @app.route(INDEX_CSS_URL)
+    def index_css():
+        return _precompressed_response(INDEX_CSS_BYTES, INDEX_CSS_GZIP, INDEX_CSS_BR, INDEX_CSS_ETAG,
+                                       mimetype='text/css', cache_control=IMMUTABLE_CACHE)
 
     @app.route('/saved-urls', methods=['GET'])
     def get_saved_urls():
@@ -1445,218 +1389,25 @@ def register_routes(app):
 
         save_url(url, source_name, use_playwright)
 
-        try:
+        def _extract(emit):
             if use_playwright:
                 html = asyncio.run(fetch_with_playwright(url))
             else:
                 html = asyncio.run(fetch_with_httpx(url))
+            emit({"type": "fetched", "html_size": len(html)})
 
             methods = []
             events = []
 
-            eca_events, eca_detected = asyncio.run(extract_eventcalendarapp(html, source_name, url, future_only))
-            if eca_detected and eca_events:
-                events = eca_events
-                methods.append(f"EventCalendarApp API ({len(events)})")
-                print(f"[EventCalendarApp] SUCCESS: {len(events)} events via direct API")
-
-            if not events:
-                timely_events, timely_detected = asyncio.run(extract_timely(html, source_name, url, future_only))
-                if timely_detected and timely_events:
-                    events = timely_events
-                    methods.append(f"Timely API ({len(events)})")
-                    print(f"[Timely] SUCCESS: {len(events)} events via direct API")
-
-            if not events:
-                bok_events, bok_detected = asyncio.run(extract_bok_center(html, source_name, url, future_only))
-                if bok_detected and bok_events:
-                    events = bok_events
-                    methods.append(f"BOK Center API ({len(events)})")
-                    print(f"[BOK Center] SUCCESS: {len(events)} events via API")
-
-            if not events:
-                cc_events, cc_detected = asyncio.run(extract_circle_cinema_events(html, source_name, url, future_only))
-                if cc_detected and cc_events:
-                    events = cc_events
-                    methods.append(f"Circle Cinema ({len(events)})")
-                    print(f"[CircleCinema] SUCCESS: {len(events)} events")
-
-            if not events:
-                expo_events, expo_detected = asyncio.run(extract_expo_square_events(html, source_name, url, future_only))
-                if expo_detected and expo_events:
-                    events = expo_events
-                    methods.append(f"Expo Square API ({len(events)})")
-                    print(f"[Expo Square] SUCCESS: {len(events)} events via API")
-
-            if not events:
-                eb_events, eb_detected = asyncio.run(extract_eventbrite_api_events(html, source_name, url, future_only))
-                if eb_detected and eb_events:
-                    events = eb_events
-                    methods.append(f"Eventbrite API ({len(events)})")
-                    print(f"[Eventbrite] SUCCESS: {len(events)} events via API")
-
-            if not events:
-                sv_events, sv_detected = asyncio.run(extract_simpleview_events(html, source_name, url, future_only))
-                if sv_detected and sv_events:
-                    events = sv_events
-                    methods.append(f"Simpleview API ({len(events)})")
-                    print(f"[Simpleview] SUCCESS: {len(events)} events via API")
-
-            if not events:
-                sw_events, sw_detected = asyncio.run(extract_sitewrench_events(html, source_name, url, future_only))
-                if sw_detected and sw_events:
-                    events = sw_events
-                    methods.append(f"SiteWrench API ({len(events)})")
-                    print(f"[SiteWrench] SUCCESS: {len(events)} events via API")
-
-            if not events:
-                rd_events, rd_detected = asyncio.run(extract_recdesk_events(html, source_name, url, future_only))
-                if rd_detected and rd_events:
-                    events = rd_events
-                    methods.append(f"RecDesk API ({len(events)})")
-                    print(f"[RecDesk] SUCCESS: {len(events)} events via API")
-
-            if not events:
-                tl_events, tl_detected = asyncio.run(extract_ticketleap_events(html, source_name, url, future_only))
-                if tl_detected and tl_events:
-                    events = tl_events
-                    methods.append(f"TicketLeap ({len(events)})")
-                    print(f"[TicketLeap] SUCCESS: {len(events)} events")
-
-            if not events:
-                ln_events, ln_detected = asyncio.run(extract_libnet_events(html, source_name, url, future_only))
-                if ln_detected and ln_events:
-                    events = ln_events
-                    methods.append(f"LibNet API ({len(events)})")
-                    print(f"[LibNet] SUCCESS: {len(events)} events via API")
-
-            if not events:
-                pb_events, pb_detected = asyncio.run(extract_philbrook_events(html, source_name, url, future_only))
-                if pb_detected and pb_events:
-                    events = pb_events
-                    methods.append(f"Philbrook AJAX ({len(events)})")
-                    print(f"[Philbrook] SUCCESS: {len(events)} events via admin-ajax")
-
-            if not events:
-                tpac_events, tpac_detected = asyncio.run(extract_tulsapac_events(html, source_name, url, future_only))
-                if tpac_detected and tpac_events:
-                    events = tpac_events
-                    methods.append(f"TulsaPAC API ({len(events)})")
-                    print(f"[TulsaPAC] SUCCESS: {len(events)} productions via TM API")
-
-            if not events:
-                rd_ev, rd_detected = asyncio.run(extract_roosterdays_events(html, source_name, url, future_only))
-                if rd_detected and rd_ev:
-                    events = rd_ev
-                    methods.append(f"RoosterDays ({len(events)})")
-                    print(f"[RoosterDays] SUCCESS: {len(events)} event")
-
-            if not events:
-                tbf_ev, tbf_detected = asyncio.run(extract_tulsabrunchfest_events(html, source_name, url, future_only))
-                if tbf_detected and tbf_ev:
-                    events = tbf_ev
-                    methods.append(f"TulsaBrunchFest ({len(events)})")
-                    print(f"[TulsaBrunchFest] SUCCESS: {len(events)} event")
-
-            if not events:
-                okeq_ev, okeq_detected = asyncio.run(extract_okeq_events(html, source_name, url, future_only))
-                if okeq_detected and okeq_ev:
-                    events = okeq_ev
-                    methods.append(f"OKEQ ({len(events)})")
-                    print(f"[OKEQ] SUCCESS: {len(events)} events")
-
-            if not events:
-                flywheel_ev, flywheel_detected = asyncio.run(extract_flywheel_events(html, source_name, url, future_only))
-                if flywheel_detected and flywheel_ev:
-                    events = flywheel_ev
-                    methods.append(f"Flywheel ({len(events)})")
-                    print(f"[Flywheel] SUCCESS: {len(events)} events")
-
-            if not events:
-                arvest_ev, arvest_detected = asyncio.run(extract_arvest_events(html, source_name, url, future_only))
-                if arvest_detected and arvest_ev:
-                    events = arvest_ev
-                    methods.append(f"Arvest ({len(events)})")
-                    print(f"[Arvest] SUCCESS: {len(events)} events")
-
-            if not events:
-                tt_ev, tt_detected = asyncio.run(extract_tulsatough_events(html, source_name, url, future_only))
-                if tt_detected and tt_ev:
-                    events = tt_ev
-                    methods.append(f"TulsaTough ({len(events)})")
-                    print(f"[TulsaTough] SUCCESS: {len(events)} events")
-
-            if not events:
-                gradient_ev, gradient_detected = asyncio.run(extract_gradient_events(html, source_name, url, future_only))
-                if gradient_detected and gradient_ev:
-                    events = gradient_ev
-                    methods.append(f"Gradient ({len(events)})")
-                    print(f"[Gradient] SUCCESS: {len(events)} events")
-
-            if not events:
-                tfm_ev, tfm_detected = asyncio.run(extract_tulsafarmersmarket_events(html, source_name, url, future_only))
-                if tfm_detected and tfm_ev:
-                    events = tfm_ev
-                    methods.append(f"TFM ({len(events)})")
-                    print(f"[TFM] SUCCESS: {len(events)} events")
-
-            if not events:
-                okcastle_ev, okcastle_detected = asyncio.run(extract_okcastle_events(html, source_name, url, future_only))
-                if okcastle_detected and okcastle_ev:
-                    events = okcastle_ev
-                    methods.append(f"OKCastle ({len(events)})")
-                    print(f"[OKCastle] SUCCESS: {len(events)} events")
-
-            if not events:
-                ba_ev, ba_detected = asyncio.run(extract_broken_arrow_events(html, source_name, url, future_only))
-                if ba_detected and ba_ev:
-                    events = ba_ev
-                    methods.append(f"BrokenArrow ({len(events)})")
-                    print(f"[BrokenArrow] SUCCESS: {len(events)} events")
-
-            if not events:
-                zoo_ev, zoo_detected = asyncio.run(extract_tulsazoo_events(html, source_name, url, future_only))
-                if zoo_detected and zoo_ev:
-                    events = zoo_ev
-                    methods.append(f"TulsaZoo ({len(events)})")
-                    print(f"[TulsaZoo] SUCCESS: {len(events)} events")
-
-            if not events:
-                hr_ev, hr_detected = asyncio.run(extract_hardrock_tulsa_events(html, source_name, url, future_only))
-                if hr_detected and hr_ev:
-                    events = hr_ev
-                    methods.append(f"HardRockTulsa ({len(events)})")
-                    print(f"[HardRockTulsa] SUCCESS: {len(events)} events")
-
-            if not events:
-                gypsy_ev, gypsy_detected = asyncio.run(extract_gypsy_events(html, source_name, url, future_only))
-                if gypsy_detected and gypsy_ev:
-                    events = gypsy_ev
-                    methods.append(f"Gypsy ({len(events)})")
-                    print(f"[Gypsy] SUCCESS: {len(events)} events")
-
-            if not events:
-                bar_ev, bar_detected = asyncio.run(extract_badass_renees_events(html, source_name, url, future_only))
-                if bar_detected and bar_ev:
-                    events = bar_ev
-                    methods.append(f"BadAssRenees ({len(events)})")
-                    print(f"[BadAssRenees] SUCCESS: {len(events)} events")
-
-            if not events:
-                rl_ev, rl_detected = asyncio.run(extract_rocklahoma_events(html, source_name, url, future_only))
-                if rl_detected and rl_ev:
-                    events = rl_ev
-                    methods.append(f"Rocklahoma ({len(events)})")
-                    print(f"[Rocklahoma] SUCCESS: {len(events)} events")
-
-            if not events:
-                ok_ev, ok_detected = asyncio.run(extract_tulsa_oktoberfest_events(html, source_name, url, future_only))
-                if ok_detected and ok_ev:
-                    events = ok_ev
-                    methods.append(f"TulsaOktoberfest ({len(events)})")
-                    print(f"[TulsaOktoberfest] SUCCESS: {len(events)} events")
+            # Probe every site-specific extractor concurrently under one event
+            # loop; the first hit in registry priority order wins.
+            events, api_label = asyncio.run(run_site_extractors(html, source_name, url, future_only))
+            if events:
+                methods.append(f"{api_label} ({len(events)})")
+                print(f"[{api_label}] SUCCESS: {len(events)} events")
 
             if not events:
+                emit({"type": "progress", "message": "No platform API matched, running universal extraction"})
                 events = extract_events_universal(html, url, source_name)
 
                 if events and '_extraction_methods' in events[0]:
@@ -1664,10 +1415,10 @@ def register_routes(app):
                     for e in events:
                         e.pop('_extraction_methods', None)
 
+            emit({"type": "extracted", "count": len(events), "methods": methods})
+
             # ── FIX: Apply future date filter to universal extraction results ──
             if future_only and events:
-                from dateutil import parser as date_parser
-                from datetime import timedelta
                 now = datetime.now()
                 cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0)
                 filtered = []
@@ -1716,16 +1467,37 @@ def register_routes(app):
                 events = filtered
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = re.sub(r'[^\w\-]', '_', source_name)
-            filename = f"{safe_name}_{timestamp}.html"
-            (OUTPUT_DIR / filename).write_text(html, encoding='utf-8')
+            safe_name = safe_filename(source_name)
+            filename = save_html_snapshot(html, safe_name, timestamp)
 
-            return jsonify({
+            return {
                 "events": events,
                 "html_size": len(html),
                 "filename": filename,
                 "methods": methods
-            })
+            }
+
+        if data.get('stream'):
+            # Same pipeline, but run in a worker thread and stream progress
+            # as SSE so the UI isn't stuck on one opaque round-trip.
+            import queue as _queue
+            import threading as _threading
+
+            q = _queue.Queue()
+            def _run():
+                try:
+                    q.put({"type": "done", **_extract(q.put)})
+                except Exception as e:
+                    import traceback
+                    traceback.print_exc()
+                    q.put({"type": "error", "error": str(e)})
+                finally:
+                    q.put(None)
+            _threading.Thread(target=_run, daemon=True).start()
+            return _sse_response(q)
+
+        try:
+            return jsonify(_extract(lambda item: None))
 
         except Exception as e:
             import traceback
@@ -1753,23 +1525,7 @@ def register_routes(app):
             finally:
                 loop.close()
         _threading.Thread(target=_run, daemon=True).start()
-
-        def generate():
-            while True:
-                try:
-                    item = q.get(timeout=25)
-                    if item is None:
-                        break
-                    yield f"data: {json.dumps(item)}\n\n"
-                except Exception:
-                    # Queue timed out — send SSE keepalive so proxy stays open
-                    yield ": keepalive\n\n"
-
-        return Response(generate(), mimetype='text/event-stream', headers={
-            'Cache-Control': 'no-cache',
-            'X-Accel-Buffering': 'no',
-            'Connection': 'keep-alive',
-        })
+        return _sse_response(q)
 
     @app.route('/cron-scrape', methods=['GET', 'POST'])
     def cron_scrape():
@@ -1900,320 +1656,6 @@ def register_routes(app):
             data = {}
         return jsonify(data)
 
-    # ── old sequential generate() was here — replaced by asyncScraper ──
-
-    def _dead_generate():
-        total = len(saved)
-        yield f"data: {json.dumps({'type': 'start', 'total_sources': total})}\n\n"
-
-        total_events = 0
-        total_saved = 0
-        sources_scraped = 0
-
-        for i, entry in enumerate(saved):
-            url = entry.get('url', '')
-            name = entry.get('name', 'unknown')
-            use_pw = entry.get('use_playwright', True)
-
-            # Resolve canonical venue name from URL
-            name = resolve_source_name(url, name)
-
-            yield f"data: {json.dumps({'type': 'source_start', 'name': name, 'index': i})}\n\n"
-
-            try:
-                # Check robots.txt
-                robots_result = check_robots_txt(url)
-                if not robots_result['allowed']:
-                    yield f"data: {json.dumps({'type': 'source_error', 'name': name, 'index': i, 'error': f'Blocked by robots.txt'})}\n\n"
-                    continue
-
-                # Fetch
-                if use_pw:
-                    html = asyncio.run(fetch_with_playwright(url))
-                else:
-                    html = asyncio.run(fetch_with_httpx(url))
-
-                # Extract - same chain as /scrape
-                methods = []
-                events = []
-
-                eca_events, eca_detected = asyncio.run(extract_eventcalendarapp(html, name, url, True))
-                if eca_detected and eca_events:
-                    events = eca_events
-                    methods.append(f"EventCalendarApp API ({len(events)})")
-
-                if not events:
-                    timely_events, timely_detected = asyncio.run(extract_timely(html, name, url, True))
-                    if timely_detected and timely_events:
-                        events = timely_events
-                        methods.append(f"Timely API ({len(events)})")
-
-                if not events:
-                    bok_events, bok_detected = asyncio.run(extract_bok_center(html, name, url, True))
-                    if bok_detected and bok_events:
-                        events = bok_events
-                        methods.append(f"BOK Center API ({len(events)})")
-
-                if not events:
-                    cc_events, cc_detected = asyncio.run(extract_circle_cinema_events(html, name, url, True))
-                    if cc_detected and cc_events:
-                        events = cc_events
-                        methods.append(f"Circle Cinema ({len(events)})")
-
-                if not events:
-                    expo_events, expo_detected = asyncio.run(extract_expo_square_events(html, name, url, True))
-                    if expo_detected and expo_events:
-                        events = expo_events
-                        methods.append(f"Expo Square API ({len(events)})")
-
-                if not events:
-                    eb_events, eb_detected = asyncio.run(extract_eventbrite_api_events(html, name, url, True))
-                    if eb_detected and eb_events:
-                        events = eb_events
-                        methods.append(f"Eventbrite API ({len(events)})")
-
-                if not events:
-                    sv_events, sv_detected = asyncio.run(extract_simpleview_events(html, name, url, True))
-                    if sv_detected and sv_events:
-                        events = sv_events
-                        methods.append(f"Simpleview API ({len(events)})")
-
-                if not events:
-                    sw_events, sw_detected = asyncio.run(extract_sitewrench_events(html, name, url, True))
-                    if sw_detected and sw_events:
-                        events = sw_events
-                        methods.append(f"SiteWrench API ({len(events)})")
-
-                if not events:
-                    rd_events, rd_detected = asyncio.run(extract_recdesk_events(html, name, url, True))
-                    if rd_detected and rd_events:
-                        events = rd_events
-                        methods.append(f"RecDesk API ({len(events)})")
-
-                if not events:
-                    tl_events, tl_detected = asyncio.run(extract_ticketleap_events(html, name, url, True))
-                    if tl_detected and tl_events:
-                        events = tl_events
-                        methods.append(f"TicketLeap ({len(events)})")
-
-                if not events:
-                    ln_events, ln_detected = asyncio.run(extract_libnet_events(html, name, url, True))
-                    if ln_detected and ln_events:
-                        events = ln_events
-                        methods.append(f"LibNet API ({len(events)})")
-                        print(f"[LibNet] SUCCESS: {len(events)} events via API")
-
-                if not events:
-                    pb_events, pb_detected = asyncio.run(extract_philbrook_events(html, name, url, True))
-                    if pb_detected and pb_events:
-                        events = pb_events
-                        methods.append(f"Philbrook AJAX ({len(events)})")
-                        print(f"[Philbrook] SUCCESS: {len(events)} events via admin-ajax")
-
-                if not events:
-                    tpac_events, tpac_detected = asyncio.run(extract_tulsapac_events(html, name, url, True))
-                    if tpac_detected and tpac_events:
-                        events = tpac_events
-                        methods.append(f"TulsaPAC API ({len(events)})")
-                        print(f"[TulsaPAC] SUCCESS: {len(events)} productions via TM API")
-
-                if not events:
-                    rd_ev, rd_detected = asyncio.run(extract_roosterdays_events(html, name, url, True))
-                    if rd_detected and rd_ev:
-                        events = rd_ev
-                        methods.append(f"RoosterDays ({len(events)})")
-                        print(f"[RoosterDays] SUCCESS: {len(events)} event")
-
-                if not events:
-                    tbf_ev, tbf_detected = asyncio.run(extract_tulsabrunchfest_events(html, name, url, True))
-                    if tbf_detected and tbf_ev:
-                        events = tbf_ev
-                        methods.append(f"TulsaBrunchFest ({len(events)})")
-                        print(f"[TulsaBrunchFest] SUCCESS: {len(events)} event")
-
-                if not events:
-                    okeq_ev, okeq_detected = asyncio.run(extract_okeq_events(html, name, url, True))
-                    if okeq_detected and okeq_ev:
-                        events = okeq_ev
-                        methods.append(f"OKEQ ({len(events)})")
-                        print(f"[OKEQ] SUCCESS: {len(events)} events")
-
-                if not events:
-                    flywheel_ev, flywheel_detected = asyncio.run(extract_flywheel_events(html, name, url, True))
-                    if flywheel_detected and flywheel_ev:
-                        events = flywheel_ev
-                        methods.append(f"Flywheel ({len(events)})")
-                        print(f"[Flywheel] SUCCESS: {len(events)} events")
-
-                if not events:
-                    arvest_ev, arvest_detected = asyncio.run(extract_arvest_events(html, name, url, True))
-                    if arvest_detected and arvest_ev:
-                        events = arvest_ev
-                        methods.append(f"Arvest ({len(events)})")
-                        print(f"[Arvest] SUCCESS: {len(events)} events")
-
-                if not events:
-                    tt_ev, tt_detected = asyncio.run(extract_tulsatough_events(html, name, url, True))
-                    if tt_detected and tt_ev:
-                        events = tt_ev
-                        methods.append(f"TulsaTough ({len(events)})")
-                        print(f"[TulsaTough] SUCCESS: {len(events)} events")
-
-                if not events:
-                    gradient_ev, gradient_detected = asyncio.run(extract_gradient_events(html, name, url, True))
-                    if gradient_detected and gradient_ev:
-                        events = gradient_ev
-                        methods.append(f"Gradient ({len(events)})")
-                        print(f"[Gradient] SUCCESS: {len(events)} events")
-
-                if not events:
-                    tfm_ev, tfm_detected = asyncio.run(extract_tulsafarmersmarket_events(html, name, url, True))
-                    if tfm_detected and tfm_ev:
-                        events = tfm_ev
-                        methods.append(f"TFM ({len(events)})")
-                        print(f"[TFM] SUCCESS: {len(events)} events")
-
-                if not events:
-                    okcastle_ev, okcastle_detected = asyncio.run(extract_okcastle_events(html, name, url, True))
-                    if okcastle_detected and okcastle_ev:
-                        events = okcastle_ev
-                        methods.append(f"OKCastle ({len(events)})")
-                        print(f"[OKCastle] SUCCESS: {len(events)} events")
-
-                if not events:
-                    ba_ev, ba_detected = asyncio.run(extract_broken_arrow_events(html, name, url, True))
-                    if ba_detected and ba_ev:
-                        events = ba_ev
-                        methods.append(f"BrokenArrow ({len(events)})")
-                        print(f"[BrokenArrow] SUCCESS: {len(events)} events")
-
-                if not events:
-                    zoo_ev, zoo_detected = asyncio.run(extract_tulsazoo_events(html, name, url, True))
-                    if zoo_detected and zoo_ev:
-                        events = zoo_ev
-                        methods.append(f"TulsaZoo ({len(events)})")
-                        print(f"[TulsaZoo] SUCCESS: {len(events)} events")
-
-                if not events:
-                    hr_ev, hr_detected = asyncio.run(extract_hardrock_tulsa_events(html, name, url, True))
-                    if hr_detected and hr_ev:
-                        events = hr_ev
-                        methods.append(f"HardRockTulsa ({len(events)})")
-                        print(f"[HardRockTulsa] SUCCESS: {len(events)} events")
-
-                if not events:
-                    gypsy_ev, gypsy_detected = asyncio.run(extract_gypsy_events(html, name, url, True))
-                    if gypsy_detected and gypsy_ev:
-                        events = gypsy_ev
-                        methods.append(f"Gypsy ({len(events)})")
-                        print(f"[Gypsy] SUCCESS: {len(events)} events")
-
-                if not events:
-                    bar_ev, bar_detected = asyncio.run(extract_badass_renees_events(html, name, url, True))
-                    if bar_detected and bar_ev:
-                        events = bar_ev
-                        methods.append(f"BadAssRenees ({len(events)})")
-                        print(f"[BadAssRenees] SUCCESS: {len(events)} events")
-
-                if not events:
-                    rl_ev, rl_detected = asyncio.run(extract_rocklahoma_events(html, name, url, True))
-                    if rl_detected and rl_ev:
-                        events = rl_ev
-                        methods.append(f"Rocklahoma ({len(events)})")
-                        print(f"[Rocklahoma] SUCCESS: {len(events)} events")
-
-                if not events:
-                    ok_ev, ok_detected = asyncio.run(extract_tulsa_oktoberfest_events(html, name, url, True))
-                    if ok_detected and ok_ev:
-                        events = ok_ev
-                        methods.append(f"TulsaOktoberfest ({len(events)})")
-                        print(f"[TulsaOktoberfest] SUCCESS: {len(events)} events")
-
-                if not events:
-                    events = extract_events_universal(html, url, name)
-                    if events and '_extraction_methods' in events[0]:
-                        methods = events[0]['_extraction_methods']
-                        for e in events:
-                            e.pop('_extraction_methods', None)
-
-                # Future filter
-                if events:
-                    from dateutil import parser as date_parser
-                    now = datetime.now()
-                    cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                    filtered = []
-                    for ev in events:
-                        date_str = ev.get('date', '') or ev.get('date_start', '') or ev.get('start_time', '')
-                        if not date_str:
-                            filtered.append(ev)
-                            continue
-                        try:
-                            dt = date_parser.parse(str(date_str), fuzzy=True)
-                            dt = dt.replace(tzinfo=None)
-                            if dt < cutoff:
-                                days_past = (cutoff - dt).days
-                                if days_past > 270:
-                                    dt = dt.replace(year=dt.year + 1)
-                                    ev['date'] = dt.strftime('%b %d, %Y')
-                                    if dt >= cutoff:
-                                        filtered.append(ev)
-                            else:
-                                filtered.append(ev)
-                        except:
-                            filtered.append(ev)
-                    events = filtered
-
-                yield f"data: {json.dumps({'type': 'source_scraped', 'name': name, 'index': i, 'count': len(events), 'methods': methods})}\n\n"
-
-                # Save JSON to disk (backup)
-                saved_count = 0
-                if events:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    safe_name = re.sub(r'[^\w\-]', '_', name)
-                    filename = f"{safe_name}_{timestamp}.json"
-                    (OUTPUT_DIR / filename).write_text(json.dumps(events, indent=2), encoding='utf-8')
-
-                    # --- Normalize via LLM service then POST to backend ---
-                    normalized = normalize_batch(events, source_url=url, source_name=name)
-                    events_to_post = normalized if normalized else events
-
-                    db_saved = 0
-                    for ev in events_to_post:
-                        try:
-                            transformed = transform_event_for_backend(ev, source_priority=source.get('priority'))
-                            # Ensure source fields are set
-                            if not transformed.get('source_url'):
-                                transformed['source_url'] = url
-                            if not transformed.get('source_name'):
-                                transformed['source_name'] = name
-                            resp = httpx.post(f"{BACKEND_URL}/api/events", json=transformed, timeout=5)
-                            if resp.status_code in [200, 201]:
-                                db_saved += 1
-                            else:
-                                print(f"[ScrapeAll DB] Rejected: {resp.status_code} - {resp.text[:100]}")
-                        except Exception as db_err:
-                            print(f"[ScrapeAll DB] Error: {db_err}")
-
-                    saved_count = db_saved
-                    norm_tag = "normalized" if normalized else "fallback"
-                    print(f"[ScrapeAll DB] {name}: {db_saved}/{len(events_to_post)} saved ({norm_tag})")
-
-                total_events += len(events)
-                total_saved += saved_count
-                sources_scraped += 1
-
-                yield f"data: {json.dumps({'type': 'source_done', 'name': name, 'index': i, 'saved': saved_count, 'count': len(events)})}\n\n"
-
-                print(f"[ScrapeAll] {i+1}/{total} {name}: {len(events)} events {methods}")
-
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
-                yield f"data: {json.dumps({'type': 'source_error', 'name': name, 'index': i, 'error': str(e)})}\n\n"
-
-        yield f"data: {json.dumps({'type': 'complete', 'total_events': total_events, 'total_saved': total_saved, 'sources_scraped': sources_scraped, 'total_sources': total})}\n\n"
-
-
     @app.route('/save', methods=['POST'])
     def save():
         data = request.json
@@ -2221,10 +1663,10 @@ def register_routes(app):
         source = data.get('source', 'unknown')
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = re.sub(r'[^\w\-]', '_', source)
+        safe_name = safe_filename(source)
         filename = f"{safe_name}_{timestamp}.json"
 
-        (OUTPUT_DIR / filename).write_text(json.dumps(events, indent=2), encoding='utf-8')
+        write_events_file(OUTPUT_DIR / filename, events)
 
         return jsonify({"filename": filename, "count": len(events)})
 
@@ -2239,8 +1681,6 @@ def register_routes(app):
           3. POST each event to Rust backend on :3000
           4. Falls back to basic transform if LLM service is unavailable
         """
-        import concurrent.futures
-
         data = request.json
         events = data.get('events', [])
 
@@ -2290,92 +1730,20 @@ def register_routes(app):
                         venues_to_save[venue_key]['_venue_website'] = event.get('_venue_website')
 
         # Register and auto-enrich venues via Google Places
-        venues_with_websites = 0
+        venue_payloads = [{
+            'name': v['name'],
+            'address': v.get('address', '') or None,
+            'city': v.get('city', 'Tulsa'),
+            'website': v.get('_venue_website') or None,
+        } for v in venues_to_save.values()]
+        venues_with_websites = sum(1 for v in venue_payloads if v['website'])
         venues_enriched = 0
-        if venues_to_save:
-            print(f"[DB] Registering {len(venues_to_save)} venues...")
-            for venue_key, venue_data in venues_to_save.items():
-                website = venue_data.pop('_venue_website', '')
-                venue_payload = {
-                    'name': venue_data['name'],
-                    'address': venue_data.get('address', '') or None,
-                    'city': venue_data.get('city', 'Tulsa'),
-                    'website': website or None,
-                }
-
-                if website:
-                    venues_with_websites += 1
-
-                # POST to backend (creates or returns existing)
-                try:
-                    resp = httpx.post(f"{BACKEND_URL}/api/venues", json=venue_payload, timeout=5)
-                    if resp.status_code in [200, 201]:
-                        existing = resp.json()
-                        # Check if venue is missing data we can fill via Google Places
-                        missing_address = not existing.get('address')
-                        missing_website = not existing.get('website')
-                        missing_coords = existing.get('latitude') is None
-
-                        if (missing_address or missing_website or missing_coords) and GOOGLE_PLACES_API_KEY:
-                            try:
-                                result = asyncio.run(lookup_venue_google_places(venue_data['name'], 'Tulsa, OK'))
-                                if 'error' not in result:
-                                    patch_data = {}
-                                    if missing_address and result.get('address'):
-                                        patch_data['address'] = result['address']
-                                    if missing_website and result.get('website'):
-                                        patch_data['website'] = result['website']
-                                    if missing_coords and result.get('latitude') and result.get('longitude'):
-                                        patch_data['latitude'] = result['latitude']
-                                        patch_data['longitude'] = result['longitude']
-
-                                    if patch_data:
-                                        venue_id = existing.get('id')
-                                        httpx.patch(
-                                            f"{BACKEND_URL}/api/venues/{venue_id}",
-                                            json=patch_data,
-                                            timeout=5
-                                        )
-                                        venues_enriched += 1
-                                        print(f"[DB] Enriched '{venue_data['name']}': {', '.join(patch_data.keys())}")
-                            except Exception as e:
-                                print(f"[DB] Enrichment failed for '{venue_data['name']}': {e}")
-                except Exception:
-                    pass
-
-            print(f"[DB] Venues: {len(venues_to_save)} registered, {venues_with_websites} with websites, {venues_enriched} enriched via Google")
+        if venue_payloads:
+            venues_enriched = register_venues(venue_payloads)
+            print(f"[DB] Venues: {len(venue_payloads)} registered, {venues_with_websites} with websites, {venues_enriched} enriched via Google")
 
         # --- Step 3: Transform and send to Rust backend ---
-        def post_event(event):
-            try:
-                transformed = transform_event_for_backend(event)
-                # Synthetic unique source_url so events from venues without
-                # per-event permalinks don't all collapse onto one DB row.
-                if not transformed.get('source_url'):
-                    slug = (
-                        f"{source_url}|"
-                        f"{transformed.get('title','').lower().strip()}|"
-                        f"{transformed.get('start_time','')}"
-                    )
-                    uid = hashlib.md5(slug.encode()).hexdigest()[:8]
-                    transformed['source_url'] = f"{source_url.rstrip('/')}#event-{uid}"
-                if not transformed.get('source_name'):
-                    transformed['source_name'] = source_name
-                # Canonical venue name from the scrape source
-                if source_name:
-                    transformed['venue'] = source_name
-                resp = httpx.post(f"{BACKEND_URL}/api/events", json=transformed, timeout=5)
-                if resp.status_code not in [200, 201]:
-                    print(f"[DB] Rejected: {resp.status_code} - {resp.text[:100]}")
-                return resp.status_code in [200, 201]
-            except Exception as e:
-                print(f"[DB] Error: {e}")
-                return False
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(post_event, events_to_save))
-
-        saved = sum(results)
+        saved = post_events_to_backend(events_to_save, source_url, source_name, tag="DB")
         print(f"[DB] Complete: {saved}/{len(events_to_save)} saved (normalized: {use_normalized})")
 
         return jsonify({
@@ -2390,30 +1758,27 @@ def register_routes(app):
     @app.route('/upload-all-to-database', methods=['POST'])
     def upload_all_to_database():
         """Read all saved JSON files and send events to database concurrently."""
-        import concurrent.futures
-
         total_events = 0
         total_saved = 0
         files_processed = 0
-        errors = []
 
-        json_files = sorted(OUTPUT_DIR.glob("*.json"), reverse=True)
-        skip_files = {'venues.json', 'saved_urls.json'}
+        json_files = [f for f in sorted(OUTPUT_DIR.glob("*.json"), reverse=True)
+                      if f.name not in EVENT_FILE_SKIP]
+        loaded, errors = load_event_files(json_files)
 
         all_events = []
-        for f in json_files:
-            if f.name in skip_files:
-                continue
-            try:
-                file_events = json.loads(f.read_text())
-                if isinstance(file_events, list) and len(file_events) > 0:
-                    files_processed += 1
-                    all_events.extend(file_events)
-            except Exception as e:
-                errors.append(f"{f.name}: {str(e)}")
+        for _name, file_events in loaded:
+            if isinstance(file_events, list) and len(file_events) > 0:
+                files_processed += 1
+                all_events.extend(file_events)
 
         total_events = len(all_events)
-        print(f"[Upload] {total_events} events from {files_processed} files")
+
+        # Re-running the same scrapes leaves several files with the same
+        # events; drop repeats before paying for normalization and POSTs.
+        all_events = dedupe_saved_events(all_events)
+        deduped = total_events - len(all_events)
+        print(f"[Upload] {total_events} events from {files_processed} files ({deduped} duplicates skipped)")
 
         # Normalize through Gemini before sending to database
         source_url = all_events[0].get('source_url', '') if all_events else ''
@@ -2422,42 +1787,19 @@ def register_routes(app):
 
         use_normalized = len(normalized) > 0
         if use_normalized:
-            print(f"[Upload] ✓ Normalized {total_events} → {len(normalized)} events via Gemini")
+            print(f"[Upload] ✓ Normalized {len(all_events)} → {len(normalized)} events via Gemini")
             events_to_post = normalized
         else:
             print(f"[Upload] ⚠ Normalization unavailable, using basic transform fallback")
             events_to_post = all_events
 
-        def post_event(event):
-            try:
-                transformed = transform_event_for_backend(event)
-                if not transformed.get('source_url'):
-                    slug = (
-                        f"{source_url}|"
-                        f"{transformed.get('title','').lower().strip()}|"
-                        f"{transformed.get('start_time','')}"
-                    )
-                    uid = hashlib.md5(slug.encode()).hexdigest()[:8]
-                    transformed['source_url'] = f"{source_url.rstrip('/')}#event-{uid}"
-                if not transformed.get('source_name'):
-                    transformed['source_name'] = source_name
-                if source_name:
-                    transformed['venue'] = source_name
-                resp = httpx.post(f"{BACKEND_URL}/api/events", json=transformed, timeout=5)
-                return resp.status_code in [200, 201]
-            except Exception as e:
-                print(f"[Upload] Error: {e}")
-                return False
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(post_event, events_to_post))
-
-        total_saved = sum(results)
+        total_saved = post_events_to_backend(events_to_post, source_url, source_name, tag="Upload")
         print(f"[Upload] Complete: {total_saved}/{len(events_to_post)} saved (normalized: {use_normalized})")
 
         return jsonify({
             "files_processed": files_processed,
             "total_events": total_events,
+            "deduped": deduped,
             "saved": total_saved,
             "normalized": use_normalized,
             "errors": errors
@@ -2467,31 +1809,29 @@ def register_routes(app):
     def clear_files():
         """Delete all saved JSON files."""
         deleted = 0
-        for f in OUTPUT_DIR.glob("*.json"):
-            if f.name == 'venues.json':
-                continue
-            try:
-                f.unlink()
-                deleted += 1
-            except:
-                pass
-
-        for f in OUTPUT_DIR.glob("*.html"):
-            try:
-                f.unlink()
-                deleted += 1
-            except:
-                pass
+        with os.scandir(OUTPUT_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if name == 'venues.json' or not name.endswith(('.json', '.html', '.html.gz')):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                    deleted += 1
+                except:
+                    pass
 
         return jsonify({"deleted": deleted})
 
     @app.route('/files')
     def list_files():
-        files = []
-        for f in sorted(OUTPUT_DIR.glob("*.json"), reverse=True):
-            if f.name != 'saved_urls.json':
-                files.append({"name": f.name, "size": f.stat().st_size})
-        return jsonify(files)
+        # DirEntry caches the stat from the directory read on Linux, so this
+        # is one scandir instead of a glob plus a stat() per file.
+        with os.scandir(OUTPUT_DIR) as it:
+            entries = [e for e in it
+                       if e.name.endswith('.json') and e.name not in EVENT_FILE_SKIP
+                       and e.is_file()]
+        entries.sort(key=lambda e: e.name, reverse=True)
+        return jsonify([{"name": e.name, "size": e.stat().st_size} for e in entries])
 
     @app.route('/download/<filename>')
     def download(filename):
@@ -2524,7 +1864,7 @@ def register_routes(app):
     @app.route('/venue-priority')
     def venue_priority_page():
         """Admin panel for manually setting venue display priority."""
-        return render_template_string(VENUE_PRIORITY_HTML)
+        return _precompressed_response(VENUE_PRIORITY_BYTES, VENUE_PRIORITY_GZIP, VENUE_PRIORITY_BR, VENUE_PRIORITY_ETAG)
 
     @app.route('/api/venues/all', methods=['GET'])
     def get_all_venues_for_admin():
@@ -367,6 +367,15 @@ def make_content_hash(title: str, start_time: str, venue: str = '') -> str:
     return hashlib.md5(key.encode()).hexdigest()
 
 
+# lxml's C parser builds the tree several times faster than the pure-Python
+# 'html.parser' on long listing pages. It's in requirements.txt, but fall back
+# so a bare local install still works.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # Check if Playwright is available
 try:
     from playwright.async_api import async_playwright
@@ -390,8 +399,19 @@ LLM_SERVICE_URL = os.getenv("LLM_SERVICE_URL", "http://localhost:8001")
 HEADERS = {"User-Agent": "Locate918 Event Aggregator (educational project)"}
 GOOGLE_PLACES_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY", "")
 
-# Cache for robots.txt parsers (avoid re-fetching)
+_SAFE_NAME_RE = re.compile(r'[^\w\-]+')
+
+
+def safe_filename(name: str) -> str:
+    """Filesystem-safe stem for per-source output files ("Cain's Ballroom" -> "Cain_s_Ballroom")."""
+    return _SAFE_NAME_RE.sub('_', name)
+
+# Cache for robots.txt parsers (avoid re-fetching): base_url -> (parser or None, expires_at).
+# Entries expire so long-running workers pick up robots.txt changes; a failed
+# fetch is retried sooner than a successful one.
 _robots_cache = {}
+ROBOTS_TTL = 6 * 3600
+ROBOTS_ERROR_TTL = 10 * 60
 
 # Cache for venue websites (avoid re-fetching listing pages)
 _venue_website_cache = {}
@@ -437,7 +457,7 @@ def fetch_venue_website_from_listing(listing_url: str, base_url: str = "https://
             return ''
 
         # Parse HTML
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        soup = BeautifulSoup(resp.text, HTML_PARSER)
 
         # Look for "Visit Website" link - common patterns
         # 1. Link with text "Visit Website"
@@ -489,8 +509,10 @@ def check_robots_txt(url: str) -> dict:
         robots_url = f"{base_url}/robots.txt"
 
         # Check cache first
-        if base_url in _robots_cache:
-            rp = _robots_cache[base_url]
+        now = time.monotonic()
+        cached = _robots_cache.get(base_url)
+        if cached and cached[1] > now:
+            rp = cached[0]
         else:
             rp = RobotFileParser()
             rp.set_url(robots_url)
@@ -502,14 +524,14 @@ def check_robots_txt(url: str) -> dict:
                     rp.parse(response.text.splitlines())
                 else:
                     # No robots.txt or error - assume allowed
-                    _robots_cache[base_url] = None
+                    _robots_cache[base_url] = (None, now + ROBOTS_TTL)
                     return {'allowed': True, 'message': 'No robots.txt found - proceeding'}
             except Exception as e:
                 # Can't fetch robots.txt - assume allowed
-                _robots_cache[base_url] = None
+                _robots_cache[base_url] = (None, now + ROBOTS_ERROR_TTL)
                 return {'allowed': True, 'message': f'Could not fetch robots.txt - proceeding'}
 
-            _robots_cache[base_url] = rp
+            _robots_cache[base_url] = (rp, now + ROBOTS_TTL)
 
         if rp is None:
             return {'allowed': True, 'message': 'No robots.txt'}
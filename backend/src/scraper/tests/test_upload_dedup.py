@@ -0,0 +1,19 @@
+from scraperRoutes import dedupe_saved_events
+
+
+def test_events_sharing_a_listing_url_are_kept():
+    listing = "https://www.maggiesmusicbox.com/events"
+    events = [
+        {"title": "Open Mic", "start_time": "2026-11-20T19:00:00", "source_url": listing},
+        {"title": "Blues Night", "start_time": "2026-11-20T19:00:00", "source_url": listing},
+        {"title": "Open Mic", "start_time": "2026-11-27T19:00:00", "source_url": listing},
+    ]
+
+    assert dedupe_saved_events(events) == events
+
+
+def test_same_event_from_two_files_is_dropped():
+    event = {"title": "Jazz Night", "date": "Nov 20, 2026", "source_url": "https://www.cainsballroom.com/e/1"}
+    repeat = {**event, "title": " jazz night"}
+
+    assert dedupe_saved_events([event, repeat]) == [event]
@@ -1,12 +1,39 @@
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from app.routes import chat, search, normalize, interactions
+from app.services.gemini import close_http_client, warm_up
+from app.services.backend import close_backend_client, get_backend_client
 
-app = FastAPI()
+# Request-level detail is logged at DEBUG; set LOG_LEVEL=DEBUG to see it
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(levelname)s %(name)s: %(message)s",
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the pooled Rust backend client up front, on the serving loop,
+    # rather than inside the first request that needs it
+    app.state.backend_client = get_backend_client()
+    # Warm Gemini and the venue list in the background so a slow or missing
+    # upstream never holds up startup or health checks
+    warm_task = asyncio.create_task(warm_up())
+    yield
+    warm_task.cancel()
+    # Drop the pooled keep-alive connections to the Rust backend
+    await close_backend_client()
+    await close_http_client()
+
+
+app = FastAPI(lifespan=lifespan)
 SERVICE_VERSION = os.getenv("APP_VERSION", "0.1.0")
 SERVICE_GIT_SHA = os.getenv("GITHUB_SHA", "dev")
 
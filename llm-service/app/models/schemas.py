@@ -62,6 +62,20 @@ class NormalizeRequest(BaseModel):
 class NormalizeResponse(BaseModel):
     events: List[NormalizedEvent]
 
+class SearchParams(BaseModel):
+    """
+    Search filters extracted from a natural language query.
+    Used as the Gemini response schema in app.services.gemini.parse_user_intent
+    """
+    q: Optional[str] = None
+    category: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    price_max: Optional[float] = None
+    location: Optional[str] = None
+    family_friendly: Optional[bool] = None
+    outdoor: Optional[bool] = None
+
 class SearchRequest(BaseModel):
     query: str
     user_id: Optional[str] = Field(default=None, alias="userId")
@@ -1,5 +1,8 @@
+import asyncio
+import logging
 import os
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import date, datetime, timedelta, timezone
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import httpx
@@ -8,9 +11,16 @@ from fastapi.responses import StreamingResponse
 
 from app.models.schemas import ChatRequest
 from app.services import gemini, ranking
-
+from app.services.backend import (
+    BACKEND_URL,
+    EVENTS_SEARCH_PATH,
+    PROFILE_PATH,
+    backend_slots,
+    get_backend_client,
+)
+
+log = logging.getLogger(__name__)
 router = APIRouter()
-BACKEND_URL = os.getenv("BACKEND_URL", "http://127.0.0.1:3000")
 try:
     CENTRAL = ZoneInfo("America/Chicago")
 except ZoneInfoNotFoundError:
@@ -19,9 +29,60 @@ except ZoneInfoNotFoundError:
     CENTRAL = timezone.utc
 
 
+# ── Profile Cache ─────────────────────────────────────────────────────────────
+# A chatting user sends many turns a minute; their profile only needs to be
+# fetched from the backend once per PROFILE_CACHE_TTL.
+
+PROFILE_CACHE_TTL = 60  # seconds
+PROFILE_CACHE_MAX = 10_000
+
+_profile_cache: dict = {}   # (user_id, auth_header) -> (expires_at, profile)
+_profile_locks: dict = {}   # (user_id, auth_header) -> asyncio.Lock
+
+
+def _cached_profile(key):
+    entry = _profile_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        _profile_cache.pop(key, None)
+        return None
+    return entry[1]
+
+
+def _store_profile(key, profile):
+    if len(_profile_cache) >= PROFILE_CACHE_MAX:
+        now = time.monotonic()
+        for k in [k for k, (expires_at, _) in _profile_cache.items() if expires_at < now]:
+            del _profile_cache[k]
+        # Still full: drop the oldest entries (dicts keep insertion order)
+        while len(_profile_cache) >= PROFILE_CACHE_MAX:
+            del _profile_cache[next(iter(_profile_cache))]
+    _profile_cache[key] = (time.monotonic() + PROFILE_CACHE_TTL, profile)
+
+
+async def _fetch_user_profile(user_id: str, auth_header: str):
+    """Load the profile from the backend. Returns None if it can't be loaded."""
+    client = get_backend_client()
+    try:
+        headers = {"Authorization": auth_header}
+        async with backend_slots():
+            response = await client.get(PROFILE_PATH, headers=headers)
+        if response.status_code == 200:
+            profile_data = response.json()
+            log.debug("Loaded profile for user %s (%s)",
+                      user_id, profile_data.get('user', {}).get('email', 'unknown'))
+            return profile_data
+        else:
+            log.warning("Backend returned %s for user %s profile", response.status_code, user_id)
+    except (httpx.HTTPError, ValueError) as e:
+        log.warning("Failed to load profile for %s: %s", user_id, e)
+    return None
+
+
 async def get_user_profile(user_id: str, auth_header: str):
     if not auth_header:
-        print(f"DEBUG: No auth header for user {user_id}, using fallback profile.")
+        log.debug("No auth header for user %s, using fallback profile.", user_id)
         # Fallback default profile
         return {
             "user": {
@@ -33,23 +94,31 @@ async def get_user_profile(user_id: str, auth_header: str):
             "preferences": [],
             "recent_interactions": []
         }
-    async with httpx.AsyncClient() as client:
-        try:
-            headers = {"Authorization": auth_header}
-            response = await client.get(f"{BACKEND_URL}/api/users/me/profile", headers=headers)
-            if response.status_code == 200:
-                profile_data = response.json()
-                print(
-                    f"DEBUG: Loaded profile for user {user_id} ({profile_data.get('user', {}).get('email', 'unknown')})")
-                return profile_data
-            else:
-                print(f"DEBUG: Backend returned {response.status_code} for user {user_id} profile")
-        except Exception as e:
-            print(f"DEBUG: Failed to load profile for {user_id}: {e}")
-            pass
+    # Keyed by the auth header too, so a request can't be served another
+    # user's cached profile just by sending their userId
+    key = (user_id, auth_header)
+    profile_data = _cached_profile(key)
+    if profile_data is not None:
+        return profile_data
+
+    # One fetch per key at a time: concurrent turns from the same user wait
+    # for the first request and then read its cached result
+    lock = _profile_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            profile_data = _cached_profile(key)
+            if profile_data is None:
+                profile_data = await _fetch_user_profile(user_id, auth_header)
+                if profile_data is not None:
+                    _store_profile(key, profile_data)
+    finally:
+        if not lock.locked():
+            _profile_locks.pop(key, None)
+    if profile_data is not None:
+        return profile_data
 
     # Fallback default profile
-    print(f"DEBUG: Using fallback profile for user {user_id}")
+    log.debug("Using fallback profile for user %s", user_id)
     return {
         "user": {
             "id": user_id,
@@ -94,7 +163,7 @@ async def execute_search_places(args: dict):
         "Content-Type": "application/json",
     }
 
-    print(f"DEBUG: Calling places_nearby({lat}, {lng}, {radius_miles}mi) type={place_type}")
+    log.debug("Calling places_nearby(%s, %s, %smi) type=%s", lat, lng, radius_miles, place_type)
 
     try:
         async with httpx.AsyncClient() as client:
@@ -133,21 +202,29 @@ async def execute_search_places(args: dict):
         return {"places": simplified, "count": len(simplified)}
 
     except Exception as e:
-        print(f"DEBUG: places_nearby error: {e}")
+        log.warning("places_nearby error: %s", e)
         return {"error": str(e)}
 
 
+# Pad bare dates (YYYY-MM-DD) to full ISO 8601 with Central Time offset.
+# Tulsa is UTC-6 (CST), so "Feb 27" in Central = Feb 27 06:00 UTC to Feb 28 06:00 UTC.
+# Without this shift, evening events stored in UTC get missed.
+CENTRAL_DAY_START_UTC = "T06:00:00Z"
+
+
+def _is_bare_date(value) -> bool:
+    return isinstance(value, str) and len(value) == 10
+
+
 async def execute_search_events(args: dict, user_profile=None):
     """Executes the search_events tool by calling the backend API."""
-    # Pad bare dates (YYYY-MM-DD) to full ISO 8601 with Central Time offset.
-    # Tulsa is UTC-6 (CST), so "Feb 27" in Central = Feb 27 06:00 UTC to Feb 28 06:00 UTC.
-    # Without this shift, evening events stored in UTC get missed.
-    if args.get("start_date") and len(str(args["start_date"])) == 10:
-        args["start_date"] = f"{args['start_date']}T06:00:00Z"
-    if args.get("end_date") and len(str(args["end_date"])) == 10:
-        end_dt = datetime.fromisoformat(f"{args['end_date']}T06:00:00+00:00")
-        end_dt += timedelta(days=1)
-        args["end_date"] = end_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    start_date = args.get("start_date")
+    if _is_bare_date(start_date):
+        args["start_date"] = start_date + CENTRAL_DAY_START_UTC
+    end_date = args.get("end_date")
+    if _is_bare_date(end_date):
+        next_day = date.fromisoformat(end_date) + timedelta(days=1)
+        args["end_date"] = next_day.isoformat() + CENTRAL_DAY_START_UTC
 
     # Remap Gemini tool param names to match Rust backend query params
     if "start_date" in args:
@@ -158,75 +235,86 @@ async def execute_search_events(args: dict, user_profile=None):
     # Filter out null values to keep the query clean
     params = {k: v for k, v in args.items() if v is not None}
 
-    print(f"DEBUG: Connecting to Backend at {BACKEND_URL}/api/events/search with params: {params}")
+    log.debug("Connecting to Backend at %s%s with params: %s", BACKEND_URL, EVENTS_SEARCH_PATH, params)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(f"{BACKEND_URL}/api/events/search", params=params)
-            if response.status_code == 200:
-                events = response.json()
-
-                # Rank events based on user profile if available
-                if user_profile:
-                    events = ranking.rank_events(events, user_profile)
-
-                # Simplify event data to save tokens and avoid 429 errors
-                simplified_events = []
-                for e in events[:5]:  # Limit to 5 events
-                    # Convert UTC start_time to Central Time for display
-                    # so Gemini doesn't have to do timezone math
-                    raw_time = e.get("start_time")
-                    display_time = raw_time
-                    if raw_time:
-                        try:
-                            dt = datetime.fromisoformat(raw_time.replace("Z", "+00:00"))
-                            local_dt = dt.astimezone(CENTRAL)
-                            display_time = local_dt.strftime("%A, %B %d, %Y at %I:%M %p %Z")
-                        except Exception:
-                            pass
-
-                    simplified_events.append({
-                        "id": e.get("id"),
-                        "title": e.get("title"),
-                        "start_time": display_time,
-                        "venue": e.get("venue"),
-                        "venue_website": e.get("venue_website"),
-                        "price": f"{e.get('price_min')} - {e.get('price_max')}",
-                        "description": (e.get("description") or "")[:500] + (
-                            "..." if len(e.get("description") or "") > 500 else ""),
-                        "categories": e.get("categories"),
-                        "source_url": e.get("source_url")
-                    })
-
-                return {"events": simplified_events, "count": len(events)}
-            print(f"DEBUG: Backend Error {response.status_code}: {response.text}")
-            return {"error": f"Backend returned status {response.status_code}"}
-        except Exception as e:
-            print(f"DEBUG: Connection Exception: {e}")
-            return {"error": str(e)}
+    client = get_backend_client()
+    try:
+        async with backend_slots():
+            response = await client.get(EVENTS_SEARCH_PATH, params=params)
+        if response.status_code == 200:
+            events = response.json()
+
+            # Rank events based on user profile if available
+            if user_profile:
+                events = ranking.rank_events(events, user_profile)
+
+            # Simplify event data to save tokens and avoid 429 errors
+            simplified_events = []
+            for e in events[:5]:  # Limit to 5 events
+                # Convert UTC start_time to Central Time for display
+                # so Gemini doesn't have to do timezone math
+                raw_time = e.get("start_time")
+                display_time = raw_time
+                if raw_time:
+                    try:
+                        dt = datetime.fromisoformat(raw_time.replace("Z", "+00:00"))
+                        local_dt = dt.astimezone(CENTRAL)
+                        display_time = local_dt.strftime("%A, %B %d, %Y at %I:%M %p %Z")
+                    except Exception:
+                        pass
+
+                simplified_events.append({
+                    "id": e.get("id"),
+                    "title": e.get("title"),
+                    "start_time": display_time,
+                    "venue": e.get("venue"),
+                    "venue_website": e.get("venue_website"),
+                    "price": f"{e.get('price_min')} - {e.get('price_max')}",
+                    "description": (e.get("description") or "")[:500] + (
+                        "..." if len(e.get("description") or "") > 500 else ""),
+                    "categories": e.get("categories"),
+                    "source_url": e.get("source_url")
+                })
+
+            return {"events": simplified_events, "count": len(events)}
+        log.warning("Backend Error %s: %s", response.status_code, response.text)
+        return {"error": f"Backend returned status {response.status_code}"}
+    except (httpx.HTTPError, ValueError) as e:
+        log.warning("Connection Exception: %s", e)
+        return {"error": str(e)}
 
 
-def sanitize_history(history: list) -> list:
+# Limit history to the last 15 turns to prevent context exhaustion
+MAX_HISTORY_TURNS = 15
+_ROLE_ALIASES = {"assistant": "model"}
+
+
+def sanitize_history(history: list, limit: int = MAX_HISTORY_TURNS) -> list:
     """
     Ensures history is in the format expected by Google GenAI SDK.
-    Converts 'assistant' -> 'model' and 'content' -> 'parts'.
+    Converts 'assistant' -> 'model' and 'content' -> 'parts', and keeps only
+    the last `limit` usable turns. Walks from the newest message back, so
+    long histories aren't converted just to be trimmed. The window always
+    opens on a user turn so it keeps whole user/model exchanges.
     """
-    if history is None:
+    if not history:
         return []
     sanitized = []
-    for msg in history:
+    for msg in reversed(history):
         role = msg.get("role")
-        if role == "assistant":
-            role = "model"
+        role = _ROLE_ALIASES.get(role, role)
 
-        parts = msg.get("parts", [])
         content = msg.get("content")
-
-        if not parts and content:
-            parts = [{"text": content}]
+        parts = msg.get("parts") or ([{"text": content}] if content else None)
 
         if role and parts:
             sanitized.append({"role": role, "parts": parts})
+            if len(sanitized) == limit:
+                break
+    # Cut back to the oldest user turn still inside the window
+    while sanitized and sanitized[-1]["role"] != "user":
+        sanitized.pop()
+    sanitized.reverse()
     return sanitized
 
 
@@ -236,9 +324,14 @@ async def chat_with_tully(request: ChatRequest, authorization: str = Header(None
     Handles conversation with Tully using streaming for progress updates.
     """
 
+    # Start the profile fetch now so the backend round trip overlaps with
+    # sending the stream headers and preparing the history
+    profile_task = asyncio.create_task(get_user_profile(request.user_id, authorization))
+
     async def event_generator():
         try:
-            user_profile = await get_user_profile(request.user_id, authorization)
+            history = sanitize_history(request.conversation_history)
+            user_profile = await profile_task
 
             # Define tools available to Gemini with user profile context for ranking
             async def search_with_profile(args: dict):
@@ -250,11 +343,6 @@ async def chat_with_tully(request: ChatRequest, authorization: str = Header(None
                 "search_places": execute_search_places,
             }
 
-            # Limit history to last 15 turns to prevent context exhaustion
-            history = sanitize_history(request.conversation_history)
-            if len(history) > 15:
-                history = history[-15:]
-
             async for chunk in gemini.generate_chat_response(
                     message=request.message,
                     history=history,
@@ -265,5 +353,9 @@ async def chat_with_tully(request: ChatRequest, authorization: str = Header(None
         except Exception as e:
             print(f"Error in chat_with_tully stream: {e}")
             yield f"data: {{\"error\": \"{str(e)}\"}}\n\n"
+        finally:
+            # Client went away before the profile arrived
+            if not profile_task.done():
+                profile_task.cancel()
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
@@ -0,0 +1,70 @@
+"""
+Shared HTTP client for calls to the Rust backend.
+
+Routes used to open a fresh httpx.AsyncClient per call, paying a new TCP
+(and, in production, TLS) handshake every time. One pooled client keeps
+connections to the backend alive across requests.
+"""
+
+import asyncio
+import importlib.util
+import os
+
+import httpx
+
+BACKEND_URL = os.getenv("BACKEND_URL", "http://127.0.0.1:3000")
+
+# Backend paths, resolved against the client's base_url
+EVENTS_SEARCH_PATH = "/api/events/search"
+EVENT_PATH = "/api/events/{}"
+PROFILE_PATH = "/api/users/me/profile"
+PREFERENCES_PATH = "/api/users/me/preferences"
+INTERACTIONS_PATH = "/api/users/me/interactions"
+
+# Fail fast when the backend is down instead of holding a chat turn for the
+# full read timeout
+BACKEND_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+BACKEND_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30,
+)
+
+# Multiplex concurrent tool-call searches over one connection when the
+# backend is reached over TLS and negotiates h2 (needs httpx[http2]). Plain
+# http:// URLs stay on HTTP/1.1 keep-alive either way.
+BACKEND_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Cap in-flight backend requests so a slow backend queues work here instead
+# of piling up unbounded connections and tasks
+BACKEND_CONCURRENCY = 32
+
+_client: httpx.AsyncClient | None = None
+_slots: asyncio.Semaphore | None = None
+
+
+def get_backend_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=BACKEND_URL,
+            timeout=BACKEND_TIMEOUT,
+            limits=BACKEND_LIMITS,
+            http2=BACKEND_HTTP2,
+        )
+    return _client
+
+
+def backend_slots() -> asyncio.Semaphore:
+    """Semaphore every backend request holds while in flight."""
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(BACKEND_CONCURRENCY)
+    return _slots
+
+
+async def close_backend_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
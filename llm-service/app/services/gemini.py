@@ -19,23 +19,58 @@ See backend/src/services/llm.rs for the Rust client that calls these.
 """
 
 import asyncio
-import json
+import hashlib
+import logging
 import os
+import re
 import time
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from typing import List, Dict, Any, AsyncGenerator
 
 import httpx
+import orjson
+from bs4 import BeautifulSoup, Comment
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
+from pydantic import TypeAdapter, ValidationError
 
-from app.models.schemas import NormalizedEvent, GeminiChatResponse
+from app.models.schemas import NormalizedEvent, GeminiChatResponse, SearchParams
 from app.tools.definitions import gemini_tools
 
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+# Bound every Gemini call; the SDK's own default is minutes, which would pin
+# a chat turn and its pooled connections on a stuck request. Normalization
+# streams far longer outputs, so it gets its own (still below the scraper's
+# 120s request timeout).
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT_S", "30"))
+NORMALIZE_LLM_TIMEOUT = float(os.getenv("NORMALIZE_LLM_TIMEOUT_S", "90"))
+
 _client = None
+_http_client: httpx.AsyncClient | None = None
+
+# Prompts embed today's date; format it once per day rather than per request
+@lru_cache(maxsize=2)
+def _date_strings(day: date) -> tuple:
+    return day.strftime("%Y-%m-%d"), day.strftime("%A, %B %d, %Y")
+
+
+def today_iso() -> str:
+    """Today's date as YYYY-MM-DD."""
+    return _date_strings(date.today())[0]
+
+
+def today_long() -> str:
+    """Today's date as e.g. 'Thursday, October 15, 2026'."""
+    return _date_strings(date.today())[1]
+
+
+# Validates a whole Gemini batch in one pydantic-core call
+_NORMALIZED_EVENTS = TypeAdapter(List[NormalizedEvent])
 
 # ── Venue Name Cache ──────────────────────────────────────────────────────────
 # Fetches canonical venue names from Supabase so Gemini can match against them.
@@ -61,25 +96,46 @@ async def get_venue_names() -> List[str]:
         return _venue_cache
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{supabase_url}/rest/v1/venues?select=name&order=name",
-                headers={
-                    "apikey": supabase_key,
-                    "Authorization": f"Bearer {supabase_key}",
-                },
-                timeout=10,
-            )
-            resp.raise_for_status()
-            _venue_cache = [v["name"] for v in resp.json() if v.get("name")]
-            _venue_cache_time = time.time()
-            print(f"[VenueCache] Loaded {len(_venue_cache)} venue names")
+        resp = await get_http_client().get(
+            f"{supabase_url}/rest/v1/venues?select=name&order=name",
+            headers={
+                "apikey": supabase_key,
+                "Authorization": f"Bearer {supabase_key}",
+            },
+        )
+        resp.raise_for_status()
+        _venue_cache = [v["name"] for v in resp.json() if v.get("name")]
+        _venue_cache_time = time.time()
+        print(f"[VenueCache] Loaded {len(_venue_cache)} venue names")
     except Exception as e:
         print(f"[VenueCache] Failed to fetch venues: {e}")
 
     return _venue_cache
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Pooled client for outbound fetches (source pages, Supabase venue list),
+    so repeat hosts reuse kept-alive connections instead of a new handshake.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=10.0,
+            headers={"User-Agent": "Locate918-Bot/1.0"},
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=128, keepalive_expiry=30.0),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 def get_client():
     global _client
     if _client is not None:
@@ -93,12 +149,90 @@ def get_client():
     return _client
 
 
+async def warm_up():
+    """
+    Pay the first request's setup before traffic arrives: build the Gemini
+    client, open its connection with a metadata-only lookup (no tokens
+    billed), and load the venue list normalize matches against.
+    """
+    try:
+        await get_client().aio.models.get(model="gemini-2.0-flash")
+    except Exception as e:
+        log.warning("Gemini warm-up failed: %s", e)
+    await get_venue_names()
+
+
+# Words that mean a short query carries a date, price, category or audience
+# filter and is worth sending to Gemini. Anything else that short is a plain
+# keyword search (a band, a venue) the LLM would just echo back as 'q'.
+INTENT_KEYWORDS = frozenset({
+    "today", "tonight", "tomorrow", "weekend", "week", "month", "next", "this",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "free", "cheap", "under", "family", "kids", "outdoor", "outdoors",
+    "music", "concert", "concerts", "comedy", "art", "arts", "theater", "theatre",
+    "festival", "festivals", "film", "films", "movie", "movies", "food", "drink",
+    "drinks", "nightlife", "sports", "fitness", "educational", "nature", "community",
+})
+KEYWORD_QUERY_MAX_WORDS = 2
+
+
+def _is_plain_keyword_query(message: str) -> bool:
+    words = message.lower().split()
+    if not words or len(words) > KEYWORD_QUERY_MAX_WORDS:
+        return False
+    if any(ch.isdigit() or ch == "$" for ch in message):
+        return False
+    return not any(w.strip("?!.,") in INTENT_KEYWORDS for w in words)
+
+
+# Parsed intents for repeated queries ("concerts tonight"). Keyed on today's
+# date too, since relative dates resolve differently tomorrow; that makes a
+# long TTL safe. Evicts least recently used first.
+INTENT_CACHE_TTL = 3600  # seconds
+INTENT_CACHE_MAX = 2048
+
+_intent_cache: dict = {}   # (date, query) -> (expires_at, params)
+
+
+def _cached_intent(key):
+    entry = _intent_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        _intent_cache.pop(key, None)
+        return None
+    # Move to the end so popular queries survive eviction
+    del _intent_cache[key]
+    _intent_cache[key] = entry
+    return entry[1]
+
+
+def _store_intent(key, params):
+    if len(_intent_cache) >= INTENT_CACHE_MAX:
+        now = time.monotonic()
+        for k in [k for k, (expires_at, _) in _intent_cache.items() if expires_at < now]:
+            del _intent_cache[k]
+        # Still full: drop the least recently used (dicts keep insertion order)
+        while len(_intent_cache) >= INTENT_CACHE_MAX:
+            del _intent_cache[next(iter(_intent_cache))]
+    _intent_cache[key] = (time.monotonic() + INTENT_CACHE_TTL, params)
+
+
 async def parse_user_intent(message: str) -> Dict[str, Any]:
     """
     Uses Gemini 2.0 Flash to extract search parameters from natural language.
     Returns a JSON object compatible with the backend search API.
     """
-    current_date = datetime.now().strftime("%Y-%m-%d")
+    if _is_plain_keyword_query(message):
+        return {"q": message.strip()}
+
+    current_date = today_iso()
+    cache_key = (current_date, " ".join(message.lower().split()))
+    cached = _cached_intent(cache_key)
+    if cached is not None:
+        # Callers edit the params in place, so hand out a copy
+        return dict(cached)
+
     base_prompt = f"""
     Extract search parameters from the user query provided below.
     Current Date: {current_date}
@@ -119,42 +253,36 @@ async def parse_user_intent(message: str) -> Dict[str, Any]:
     """
 
     client = get_client()
-    response = await client.aio.models.generate_content(
-        model='gemini-2.0-flash',
-        contents=[base_prompt, message],
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json"
-        )
-    )
     try:
-        return json.loads(response.text)
-    except json.JSONDecodeError:
+        async with asyncio.timeout(LLM_TIMEOUT):
+            response = await client.aio.models.generate_content(
+                model='gemini-2.0-flash',
+                contents=[base_prompt, message],
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=SearchParams,
+                )
+            )
+    except TimeoutError:
+        log.warning("Intent parse timed out after %ss, using keyword search", LLM_TIMEOUT)
         return {"q": message}
+    # The schema constrains decoding, so the SDK hands back a SearchParams
+    if not isinstance(response.parsed, SearchParams):
+        return {"q": message}
+    params = response.parsed.model_dump()
+    _store_intent(cache_key, params)
+    return dict(params)
 
 
-async def generate_chat_response(
-        message: str,
-        history: List[Dict],
-        user_profile: Dict,
-        tool_functions: Dict[str, Any] = None
-) -> AsyncGenerator[str, None]:
-    """
-    Uses Gemini 2.0 Flash for conversation. Handles tool calling.
-    Yields progress updates and finally the full response as JSON strings.
-    """
-
-    current_time = datetime.now().strftime("%A, %B %d, %Y")
-
-    # Construct system prompt with user context
-    system_instruction = f"""
+# Tully's system prompt. Everything that varies per turn (date, user profile)
+# goes in CHAT_CONTEXT_TEMPLATE at the very end, so the instructions form a
+# byte-identical prefix across users and days that Gemini's implicit prompt
+# caching can reuse.
+CHAT_SYSTEM_PROMPT = """
     You are Tully, the ultimate insider and event concierge for Tulsa, OK (918).
     You know every corner of the city, from the Blue Dome District to the Gathering Place.
     Your goal is to curate the perfect local experience for the user.
     
-    Current Context:
-    - Today's Date: {current_time}
-    - User Profile: {json.dumps(user_profile)}
-    
     CRITICAL - YOUR DATA SOURCE:
     You have access to a REAL PostgreSQL database containing events scraped from 60+ Tulsa venues
     and event sources. When you call search_events, it queries this live database via the Rust 
@@ -223,6 +351,68 @@ async def generate_chat_response(
     - **Closing**: End with a helpful follow-up question (e.g., "Want me to find bars nearby?", "Need a dinner spot close to the venue?", or "Want to see what's happening tomorrow instead?").
     """
 
+CHAT_CONTEXT_TEMPLATE = """
+    Current Context:
+    - Today's Date: {current_time}
+    - User Profile: {user_profile}
+    """
+
+# The tool list never changes between turns; validate it into a config once
+# and only swap the system instruction per turn
+CHAT_TOOLS = [gemini_tools]
+CHAT_BASE_CONFIG = types.GenerateContentConfig(tools=CHAT_TOOLS)
+
+def _frame(payload: dict) -> str:
+    """Serialize one streamed chat frame."""
+    return orjson.dumps(payload).decode()
+
+
+@lru_cache(maxsize=1024)
+def _chat_system_instruction(profile_json: str, current_time: str) -> str:
+    """Full system prompt for a profile; reused across a session's turns."""
+    return CHAT_SYSTEM_PROMPT + CHAT_CONTEXT_TEMPLATE.format(
+        current_time=current_time,
+        user_profile=profile_json,
+    )
+
+
+# Gemini sometimes keeps asking for tools on ambiguous prompts; cap the
+# rounds per chat turn so latency and spend stay bounded
+MAX_TOOL_ROUNDS = 8
+
+# A bare hello would otherwise cost a chat turn plus the structured final
+# call just to say hello back. Anything past the greeting ("hi, what's on
+# tonight?") still goes to the model.
+GREETING_RE = re.compile(r"^\s*(?:hi|hey|hello|howdy|hiya|yo|sup)(?:\s+(?:there|tully))?[\s!.?]*$", re.I)
+GREETING_REPLY = (
+    "Hey! I'm Tully, your guide to what's happening around Tulsa. Ask me about "
+    "concerts, comedy, festivals, or where to grab a drink near a show."
+)
+
+
+async def generate_chat_response(
+        message: str,
+        history: List[Dict],
+        user_profile: Dict,
+        tool_functions: Dict[str, Any] = None
+) -> AsyncGenerator[str, None]:
+    """
+    Uses Gemini 2.0 Flash for conversation. Handles tool calling.
+    Yields progress updates and finally the full response as JSON strings.
+    """
+    if GREETING_RE.match(message):
+        yield _frame({"message": GREETING_REPLY, "status": "Complete"})
+        return
+
+
+    # Construct system prompt with user context
+    system_instruction = _chat_system_instruction(
+        orjson.dumps(user_profile, option=orjson.OPT_SORT_KEYS).decode(),
+        today_long(),
+    )
+
+    chat_config = CHAT_BASE_CONFIG.model_copy(update={"system_instruction": system_instruction})
+
     client = get_client()
     models_to_try = ['gemini-2.0-flash', 'gemini-2.5-flash-lite']
     response = None
@@ -233,30 +423,28 @@ async def generate_chat_response(
             # Initialize the chat session
             chat = client.aio.chats.create(
                 model=model_name,
-                config=types.GenerateContentConfig(
-                    tools=[gemini_tools],
-                    system_instruction=system_instruction,
-                ),
+                config=chat_config,
                 history=history
             )
-            yield json.dumps({"status": "Thinking..."})
-            response = await chat.send_message(message)
+            yield _frame({"status": "Thinking..."})
+            async with asyncio.timeout(LLM_TIMEOUT):
+                response = await chat.send_message(message)
             break  # Success
         except Exception as e:
             print(f"[Chat] Gemini model '{model_name}' failed: {e}")
             if model_name == models_to_try[-1]:
-                yield json.dumps(
+                yield _frame(
                     {"message": "I'm having a lot of requests right now. Please try again later.", "status": "Error"})
                 return
-            yield json.dumps({"status": "Thinking..."})
+            yield _frame({"status": "Thinking..."})
             await asyncio.sleep(1)
 
     # Handle multi-turn tool execution loop
-    max_turns = 10
-    turns = 0
-    while response.function_calls and turns < max_turns:
-        turns += 1
-        tool_outputs = []
+    tool_calls_truncated = False
+    for _ in range(MAX_TOOL_ROUNDS):
+        if not response.function_calls:
+            break
+        calls = []
 
         for fc in response.function_calls:
             func_name = fc.name
@@ -267,26 +455,15 @@ async def generate_chat_response(
                 q = func_args.get("q", "")
                 cat = func_args.get("category", "")
                 msg = f"Searching for {q or cat or 'events'} in Tulsa..."
-                yield json.dumps({"status": msg})
+                yield _frame({"status": msg})
             elif func_name == "search_places":
-                yield json.dumps({"status": "Looking for nearby spots..."})
+                yield _frame({"status": "Looking for nearby spots..."})
             else:
-                yield json.dumps({"status": f"Running {func_name}..."})
-
-            if tool_functions and func_name in tool_functions:
-                # Execute the tool
-                tool_result = await tool_functions[func_name](func_args)
+                yield _frame({"status": f"Running {func_name}..."})
 
-                # Add the result to the list of outputs
-                tool_outputs.append(
-                    types.Part.from_function_response(
-                        name=func_name,
-                        response={"result": tool_result}
-                    )
-                )
-            else:
+            if not (tool_functions and func_name in tool_functions):
                 # If no handler is provided, return the tool call to the client
-                yield json.dumps({
+                yield _frame({
                     "message": "I tried to perform an action that isn't supported. Please ask something else.",
                     "tool_call": {
                         "name": func_name,
@@ -294,27 +471,57 @@ async def generate_chat_response(
                     }
                 })
                 return
+            calls.append((func_name, func_args))
+
+        # Gemini may ask for several tools in one turn; run them concurrently.
+        # It occasionally repeats an identical call, which only needs to run once.
+        keys = [(func_name, orjson.dumps(func_args, option=orjson.OPT_SORT_KEYS))
+                for func_name, func_args in calls]
+        unique = dict(zip(keys, calls))
+        results = await asyncio.gather(
+            *(tool_functions[func_name](func_args) for func_name, func_args in unique.values())
+        )
+        result_by_key = dict(zip(unique, results))
+        tool_outputs = [
+            types.Part.from_function_response(
+                name=func_name,
+                response={"result": result_by_key[key]}
+            )
+            for (func_name, _), key in zip(calls, keys)
+        ]
 
         # Send all tool outputs back to Gemini
         if tool_outputs:
-            response = await chat.send_message(tool_outputs)
+            try:
+                async with asyncio.timeout(LLM_TIMEOUT):
+                    response = await chat.send_message(tool_outputs)
+            except TimeoutError:
+                log.warning("Gemini timed out after %ss on tool results", LLM_TIMEOUT)
+                yield _frame(
+                    {"message": "That took longer than expected. Please try again.", "status": "Error"})
+                return
         else:
             break
+    else:
+        if response.function_calls:
+            log.warning("Gemini still calling tools after %s rounds, stopping", MAX_TOOL_ROUNDS)
+            tool_calls_truncated = True
 
     # After all tools are finished, request the FINAL response in structured format
-    yield json.dumps({"status": "Finishing up..."})
+    yield _frame({"status": "Finishing up..."})
     if not response.function_calls:
         try:
             final_history = chat.get_history()
-            response = await client.aio.models.generate_content(
-                model='gemini-2.0-flash',  # Use flash for structured output
-                contents=final_history,
-                config=types.GenerateContentConfig(
-                    system_instruction=system_instruction,
-                    response_mime_type="application/json",
-                    response_schema=GeminiChatResponse
+            async with asyncio.timeout(LLM_TIMEOUT):
+                response = await client.aio.models.generate_content(
+                    model='gemini-2.0-flash',  # Use flash for structured output
+                    contents=final_history,
+                    config=types.GenerateContentConfig(
+                        system_instruction=system_instruction,
+                        response_mime_type="application/json",
+                        response_schema=GeminiChatResponse
+                    )
                 )
-            )
         except Exception as e:
             print(f"Error requesting structured response: {e}")
             pass
@@ -350,72 +557,160 @@ async def generate_chat_response(
         print(f"Gemini Response Error: {e}")
         text_response = "I'm having trouble formulating a response right now."
 
-    yield json.dumps({"message": text_response, "status": "Complete"})
+    final = {"message": text_response, "status": "Complete"}
+    if tool_calls_truncated:
+        final["tool_call_truncated"] = True
+    yield _frame(final)
 
 
-async def normalize_events(raw_content: str, source_url: str, content_type: str = "html") -> List[Dict]:
-    """
-    Uses Gemini 2.0 Flash to extract structured event data from raw HTML or JSON.
-    All times are normalized to America/Chicago (Central Time).
-    """
-    current_date = datetime.now().strftime("%Y-%m-%d")
-    original_data = {}
+# Source pages fetched to fill in missing descriptions. Scrapers often send
+# many records pointing at the same listing page, so successful fetches are
+# kept briefly and the number of concurrent outbound fetches is capped.
+SOURCE_FETCH_CONCURRENCY = 8
+SOURCE_PAGE_TTL = 600  # seconds
+SOURCE_PAGE_CACHE_MAX = 256
 
-    # Fetch canonical venue names for matching
-    venue_names = await get_venue_names()
-    venue_block = ""
-    if venue_names:
-        venue_list = "\n".join(f"  - {name}" for name in venue_names)
-        venue_block = f"""
-    VENUE NAME MATCHING (CRITICAL):
-    Below is the list of canonical venue names in our database. When you encounter a venue
-    in the raw data, you MUST match it to one of these names if it refers to the same place.
-    Use case-insensitive matching. Handle common variations:
-    - "The Shrine" → "shrine" (drop "The", match case of canonical)
-    - "The Vanguard Tulsa" → "The Vanguard" (drop city suffix)
-    - "Hard Rock Casino Tulsa" → "Hard Rock Hotel & Casino Tulsa" (match closest)
-    - "Loony Bin Comedy Club" → "Loony Bin" (match shorter canonical form)
-    If the venue does NOT match any name below, output it as-is — do not force a bad match.
-    
-    Known venues:
-{venue_list}
-    """
+_source_pages: dict = {}   # url -> (expires_at, html)
+_source_fetch_slots: asyncio.Semaphore | None = None
 
-    # 1. Parse JSON input to preserve IDs and metadata
-    if content_type.lower() == "json":
-        try:
-            parsed = json.loads(raw_content)
-            if isinstance(parsed, dict):
-                original_data = parsed
 
-                # 2. If description is missing, try to fetch the source URL
-                if not original_data.get("description"):
-                    target_url = original_data.get("source_url") or source_url
-                    if target_url and target_url.startswith("http"):
-                        print(f"DEBUG: Fetching missing description from {target_url}...")
-                        async with httpx.AsyncClient() as client:
-                            try:
-                                response = await client.get(target_url, follow_redirects=True, timeout=10.0,
-                                                            headers={"User-Agent": "Locate918-Bot/1.0"})
-                                if response.status_code == 200:
-                                    raw_content = response.text
-                                    content_type = "html"  # Switch to HTML extraction mode
-                            except Exception as e:
-                                print(f"DEBUG: Failed to fetch source URL: {e}")
-        except Exception:
-            pass
+async def _fetch_source_page(url: str) -> str | None:
+    """GET an event's source page for extraction. None if it can't be loaded."""
+    global _source_fetch_slots
+    entry = _source_pages.get(url)
+    if entry is not None and entry[0] >= time.monotonic():
+        return entry[1]
+    if _source_fetch_slots is None:
+        _source_fetch_slots = asyncio.Semaphore(SOURCE_FETCH_CONCURRENCY)
 
-    if content_type.lower() == "json":
-        instruction = "Map the following raw JSON data into the standardized event format below. Handle nested structures and different field names intelligently."
-    else:
-        instruction = "Extract distinct events from the following HTML content. Ignore navigation, footers, and unrelated text."
+    log.debug("Fetching missing description from %s...", url)
+    try:
+        async with _source_fetch_slots:
+            response = await get_http_client().get(url)
+    except httpx.HTTPError as e:
+        log.warning("Failed to fetch source URL: %s", e)
+        return None
+    if response.status_code != 200:
+        return None
 
-    base_prompt = f"""
-    {instruction}
-    Source URL: {source_url}
-    Current Date: {current_date}
-    {venue_block}
-    
+    if len(_source_pages) >= SOURCE_PAGE_CACHE_MAX:
+        now = time.monotonic()
+        for k in [k for k, (expires_at, _) in _source_pages.items() if expires_at < now]:
+            del _source_pages[k]
+        while len(_source_pages) >= SOURCE_PAGE_CACHE_MAX:
+            del _source_pages[next(iter(_source_pages))]
+    _source_pages[url] = (time.monotonic() + SOURCE_PAGE_TTL, response.text)
+    return response.text
+
+
+# Upper bound on the raw page/JSON text sent to Gemini for normalization
+MAX_NORMALIZE_INPUT_CHARS = 150_000
+
+
+# Page chrome that never holds event data but costs input tokens
+STRIP_TAGS = ["script", "style", "noscript", "svg", "iframe", "template", "nav", "footer", "link"]
+# Attributes worth keeping: links and images feed source_url / image_url,
+# datetime carries machine-readable event times
+KEEP_ATTRS = {"href", "src", "datetime", "content", "property", "alt"}
+
+
+# Where the events live on a page too big to send whole, most specific first
+EVENT_BLOCK_SELECTORS = ('[itemtype*="Event"]', "main", "article")
+
+
+def _event_blocks(soup) -> list:
+    for selector in EVENT_BLOCK_SELECTORS:
+        blocks = soup.select(selector)
+        if blocks:
+            # Nested matches are already inside an outer block
+            ids = {id(b) for b in blocks}
+            return [b for b in blocks if not any(id(p) in ids for p in b.parents)]
+    return []
+
+
+def _jsonld_events(soup) -> list:
+    """Schema.org Event objects from the page's JSON-LD blocks."""
+    events = []
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = orjson.loads(script.get_text())
+        except orjson.JSONDecodeError:
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            if "@graph" in item and isinstance(item["@graph"], list):
+                items.extend(item["@graph"])
+                continue
+            types_ = item.get("@type")
+            types_ = types_ if isinstance(types_, list) else [types_]
+            if any(isinstance(t, str) and t.endswith("Event") for t in types_):
+                events.append(item)
+    return events
+
+
+def _clean_html(html: str) -> str:
+    """
+    Drop scripts, styles, navigation and most attributes before Gemini sees
+    the page. If that still leaves more than the input cap, keep just the
+    head and the event/main content blocks so the cap doesn't cut the events.
+
+    Schema.org JSON-LD events are kept as one compact block. When every one
+    of them already has a description, that block and the head are all that
+    is sent, but only if the page is over the cap anyway or has no more
+    event cards than JSON-LD events, so a partial listing can't hide the rest.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    ld_events = _jsonld_events(soup)
+    ld_block = ""
+    if ld_events:
+        ld_json = orjson.dumps(ld_events).decode().replace("</", "<\\/")
+        ld_block = f'<script type="application/ld+json">{ld_json}</script>'
+    for tag in soup(STRIP_TAGS):
+        tag.decompose()
+    for comment in soup.find_all(string=lambda s: isinstance(s, Comment)):
+        comment.extract()
+    # Matched before attributes are stripped; itemtype/class go below
+    blocks = _event_blocks(soup)
+    for tag in soup.find_all(True):
+        if tag.name == "meta" and not tag.get("property", "").startswith("og:"):
+            tag.decompose()
+            continue
+        tag.attrs = {k: v for k, v in tag.attrs.items() if k in KEEP_ATTRS}
+
+    head = " ".join(str(soup.head).split()) if soup.head else ""
+    cleaned = " ".join(str(soup).split())
+    over_cap = len(cleaned) + len(ld_block) > MAX_NORMALIZE_INPUT_CHARS
+    if ld_events and all(e.get("description") for e in ld_events):
+        # A lone <main> says nothing about how many events the page lists
+        cards = [b for b in blocks if b.name != "main"]
+        if over_cap or (cards and len(ld_events) >= len(cards)):
+            return head + ld_block
+    if over_cap and blocks:
+        cleaned = head + " ".join(" ".join(str(b) for b in blocks).split())
+    return ld_block + cleaned
+
+
+def _truncate_input(raw_content: str, content_type: str) -> str:
+    """
+    Trim oversized normalize input. HTML is cut just after the last complete
+    tag so Gemini doesn't spend tokens on a half-written attribute.
+    """
+    if len(raw_content) <= MAX_NORMALIZE_INPUT_CHARS:
+        return raw_content
+    if content_type.lower() == "html":
+        # Only look back a little way; a long text run keeps its plain cut
+        cut = raw_content.rfind(">", MAX_NORMALIZE_INPUT_CHARS - 2000, MAX_NORMALIZE_INPUT_CHARS)
+        if cut != -1:
+            return raw_content[:cut + 1]
+    return raw_content[:MAX_NORMALIZE_INPUT_CHARS]
+
+
+# Normalization rules. Per-call values (source URL, date) go in the request
+# contents instead, so this plus the hourly venue list is a stable system
+# prefix that Gemini's implicit prompt caching can reuse across pages.
+NORMALIZE_SYSTEM_PROMPT = """
     TIMEZONE RULES (CRITICAL):
     - All events are in the Tulsa area, Oklahoma which is America/Chicago timezone (Central Time).
     - Output ALL start_time and end_time values with the Central Time UTC offset.
@@ -440,7 +735,7 @@ async def normalize_events(raw_content: str, source_url: str, content_type: str
     - Set time_estimated = false when the source explicitly provides a time.
 
     RELATIVE DATE RULES:
-    - "This Saturday" means the upcoming Saturday relative to Current Date ({current_date}).
+    - "This Saturday" means the upcoming Saturday relative to the Current Date given with the input.
     - "Next week" means 7 days from Current Date.
     - Always resolve relative dates to actual ISO 8601 dates.
     
@@ -482,7 +777,7 @@ async def normalize_events(raw_content: str, source_url: str, content_type: str
 
     Output Format: A JSON list of objects with these exact keys:
     - title (string)
-    - venue (string — MUST match a known venue name from the list above if the place is the same, otherwise use the name as-is)
+    - venue (string — MUST match a known venue name from the list below if the place is the same, otherwise use the name as-is)
     - venue_address (string, full address if available)
     - source_url (string, the URL for this specific event page — use the input Source URL if no per-event URL exists)
     - source_name (string, human-readable name of the source website, e.g. "Cain's Ballroom", "Eventbrite")
@@ -498,25 +793,171 @@ async def normalize_events(raw_content: str, source_url: str, content_type: str
     - outdoor (boolean or null)
     - family_friendly (boolean or null)
     - image_url (string or null)
+"""
+
+
+NORMALIZE_VENUE_TEMPLATE = """
+    VENUE NAME MATCHING (CRITICAL):
+    Below is the list of canonical venue names in our database. When you encounter a venue
+    in the raw data, you MUST match it to one of these names if it refers to the same place.
+    Use case-insensitive matching. Handle common variations:
+    - "The Shrine" → "shrine" (drop "The", match case of canonical)
+    - "The Vanguard Tulsa" → "The Vanguard" (drop city suffix)
+    - "Hard Rock Casino Tulsa" → "Hard Rock Hotel & Casino Tulsa" (match closest)
+    - "Loony Bin Comedy Club" → "Loony Bin" (match shorter canonical form)
+    If the venue does NOT match any name below, output it as-is — do not force a bad match.
     
+    Known venues:
+{venue_list}
+    """
+
+
+@lru_cache(maxsize=4)
+def _normalize_system_instruction(venue_names: tuple) -> str:
+    """
+    Rules plus the known-venue list, built once per venue list so every
+    normalize call in the hour sends a byte-identical system prefix.
+    """
+    if not venue_names:
+        return NORMALIZE_SYSTEM_PROMPT
+    venue_list = "\n".join(f"  - {name}" for name in venue_names)
+    return NORMALIZE_SYSTEM_PROMPT + NORMALIZE_VENUE_TEMPLATE.format(venue_list=venue_list)
+
+
+# JSON mode keeps replies bare almost always, but a model that still wraps
+# the array in a ```json fence or a line of prose would otherwise lose the
+# whole batch
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```|(\[.*\]|\{.*\})", re.DOTALL)
+
+
+def _load_model_json(text: str):
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        match = _JSON_BLOCK_RE.search(text)
+        if not match:
+            raise
+        return orjson.loads(match.group(1) or match.group(2))
+
+
+# Scrape All and the cron run can each keep several normalize chunks in
+# flight. Cap the Gemini streams this process has open at once so a burst
+# queues here instead of tripping the per-minute quota. Backoff on 429/5xx
+# stays with the scraper; retrying here too would multiply every failure.
+NORMALIZE_GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "8"))
+
+_normalize_slots: asyncio.Semaphore | None = None
+
+
+# Validated results for inputs seen recently. Scrapers resubmit the same
+# records every run; the key includes today's date because relative dates
+# ("this Saturday") resolve against it.
+NORMALIZE_CACHE_TTL = 3600  # seconds
+NORMALIZE_CACHE_MAX = 2048
+
+_normalize_cache: dict = {}   # sha256 digest -> (expires_at, events)
+
+
+def _normalize_cache_key(raw_content: str, source_url: str, content_type: str) -> bytes:
+    h = hashlib.sha256()
+    for part in (today_iso(), content_type.lower(), source_url):
+        h.update(part.encode())
+        h.update(b"\0")
+    # Whitespace-only differences between scrapes shouldn't miss
+    h.update(" ".join(raw_content.split()).encode())
+    return h.digest()
+
+
+async def normalize_events(raw_content: str, source_url: str, content_type: str = "html") -> List[NormalizedEvent]:
+    """
+    Uses Gemini 2.0 Flash to extract structured event data from raw HTML or JSON.
+    All times are normalized to America/Chicago (Central Time).
+    """
+    key = _normalize_cache_key(raw_content, source_url, content_type)
+    entry = _normalize_cache.get(key)
+    if entry is not None and entry[0] >= time.monotonic():
+        return list(entry[1])
+
+    events = await _normalize_events(raw_content, source_url, content_type)
+    if events:
+        if len(_normalize_cache) >= NORMALIZE_CACHE_MAX:
+            now = time.monotonic()
+            for k in [k for k, (expires_at, _) in _normalize_cache.items() if expires_at < now]:
+                del _normalize_cache[k]
+            while len(_normalize_cache) >= NORMALIZE_CACHE_MAX:
+                del _normalize_cache[next(iter(_normalize_cache))]
+        _normalize_cache[key] = (time.monotonic() + NORMALIZE_CACHE_TTL, events)
+    return list(events)
+
+
+async def _normalize_events(raw_content: str, source_url: str, content_type: str) -> List[NormalizedEvent]:
+    global _normalize_slots
+    current_date = today_iso()
+    original_data = {}
+
+    # Fetch canonical venue names for matching
+    system_instruction = _normalize_system_instruction(tuple(await get_venue_names()))
+
+    # 1. Parse JSON input to preserve IDs and metadata
+    if content_type.lower() == "json":
+        try:
+            parsed = orjson.loads(raw_content)
+            if isinstance(parsed, dict):
+                original_data = parsed
+
+                # 2. If description is missing, try to fetch the source URL
+                if not original_data.get("description"):
+                    target_url = original_data.get("source_url") or source_url
+                    if target_url and target_url.startswith("http"):
+                        page = await _fetch_source_page(target_url)
+                        if page is not None:
+                            raw_content = page
+                            content_type = "html"  # Switch to HTML extraction mode
+        except Exception:
+            pass
+
+    if content_type.lower() == "json":
+        instruction = "Map the following raw JSON data into the standardized event format. Handle nested structures and different field names intelligently."
+    else:
+        instruction = "Extract distinct events from the following HTML content. Ignore navigation, footers, and unrelated text."
+
+    prompt_header = f"""
+    {instruction}
+    Source URL: {source_url}
+    Current Date: {current_date}
+
     Input Data:
     """
 
     client = get_client()
+    if content_type.lower() == "html":
+        # Parsing a large page takes a while; keep it off the event loop
+        raw_content = await asyncio.to_thread(_clean_html, raw_content)
+    model_input = _truncate_input(raw_content, content_type)
 
     # Try multiple models — gemini-2.0-flash is most reliable for structured JSON,
     # fall back to others if unavailable or overloaded
     models_to_try = ['gemini-2.0-flash', 'gemini-2.5-flash-lite']
-    response = None
+    response_text = None
+    if _normalize_slots is None:
+        _normalize_slots = asyncio.Semaphore(NORMALIZE_GEMINI_CONCURRENCY)
     for model_name in models_to_try:
         try:
-            response = await client.aio.models.generate_content(
-                model=model_name,
-                contents=[base_prompt, raw_content[:150000]],
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json"
-                )
-            )
+            # Stream the (often 100 KB+) JSON array and join once at the end,
+            # so a model that dies mid-output still falls through to the next.
+            chunks = []
+            async with _normalize_slots, asyncio.timeout(NORMALIZE_LLM_TIMEOUT):
+                async for chunk in await client.aio.models.generate_content_stream(
+                    model=model_name,
+                    contents=[prompt_header, model_input],
+                    config=types.GenerateContentConfig(
+                        system_instruction=system_instruction,
+                        response_mime_type="application/json"
+                    )
+                ):
+                    if chunk.text:
+                        chunks.append(chunk.text)
+            response_text = "".join(chunks)
             break  # Success — stop trying models
         except Exception as e:
             print(f"[Normalize] Gemini model '{model_name}' failed: {e}")
@@ -524,29 +965,35 @@ async def normalize_events(raw_content: str, source_url: str, content_type: str
                 raise  # Re-raise if ALL models failed
             await asyncio.sleep(2)
 
-    if response is None:
+    if response_text is None:
         print("[Normalize] All Gemini models failed, returning empty")
         return []
 
     try:
-        raw_data = json.loads(response.text)
+        raw_data = _load_model_json(response_text)
         valid_events = []
 
         if isinstance(raw_data, list):
-            for item in raw_data:
-                try:
-                    # Merge original data with LLM data (LLM data takes precedence for normalized fields)
-                    if original_data:
-                        # Create a merged dictionary: original fields + normalized fields
-                        item = {**original_data, **item}
-
-                    # Validate against the Pydantic schema. This drops invalid items
-                    valid_events.append(NormalizedEvent(**item).model_dump())
-                except Exception as e:
-                    print(f"DEBUG: Normalization validation error: {e}")
-                    continue
+            # Merge original data with LLM data (LLM data takes precedence for normalized fields)
+            if original_data:
+                items = [{**original_data, **item} if isinstance(item, dict) else item for item in raw_data]
+            else:
+                items = raw_data
+
+            # Validate against the Pydantic schema. Instances are kept as-is so
+            # NormalizeResponse doesn't validate every event a second time.
+            try:
+                valid_events = _NORMALIZED_EVENTS.validate_python(items)
+            except ValidationError:
+                # Some item is invalid: validate one by one and drop the bad ones
+                for item in items:
+                    try:
+                        valid_events.append(NormalizedEvent.model_validate(item))
+                    except Exception as e:
+                        log.warning("Normalization validation error: %s", e)
+                        continue
 
         return valid_events
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # If the model output is not valid JSON, return an empty list.
         return []
\ No newline at end of file
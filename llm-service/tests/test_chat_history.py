@@ -0,0 +1,64 @@
+import asyncio
+
+from app.routes.chat import MAX_HISTORY_TURNS, sanitize_history
+from app.services import gemini
+
+
+def test_sanitize_history_converts_roles_and_content():
+    history = [
+        {"role": "user", "content": "Any concerts tonight?"},
+        {"role": "assistant", "content": "Here are a few."},
+        {"role": "model", "parts": [{"text": "Anything else?"}]},
+        {"role": "user", "content": ""},
+        {"content": "no role"},
+    ]
+
+    assert sanitize_history(history) == [
+        {"role": "user", "parts": [{"text": "Any concerts tonight?"}]},
+        {"role": "model", "parts": [{"text": "Here are a few."}]},
+        {"role": "model", "parts": [{"text": "Anything else?"}]},
+    ]
+
+
+def test_sanitize_history_keeps_most_recent_turns():
+    history = [{"role": "user", "content": str(i)} for i in range(40)]
+    history.append({"role": "user", "content": ""})
+
+    sanitized = sanitize_history(history)
+
+    assert len(sanitized) == MAX_HISTORY_TURNS
+    assert sanitized[0]["parts"] == [{"text": "25"}]
+    assert sanitized[-1]["parts"] == [{"text": "39"}]
+
+
+def test_sanitize_history_handles_missing_history():
+    assert sanitize_history(None) == []
+    assert sanitize_history([]) == []
+
+
+def test_sanitize_history_window_starts_on_a_user_turn():
+    history = []
+    for i in range(10):
+        history.append({"role": "user", "content": f"q{i}"})
+        history.append({"role": "assistant", "content": f"a{i}"})
+
+    sanitized = sanitize_history(history)
+
+    assert sanitized[0] == {"role": "user", "parts": [{"text": "q3"}]}
+    assert sanitized[-1] == {"role": "model", "parts": [{"text": "a9"}]}
+    assert len(sanitized) == MAX_HISTORY_TURNS - 1
+
+
+def test_bare_greeting_is_answered_without_gemini(monkeypatch):
+    def no_gemini():
+        raise AssertionError("Gemini should not be called for a bare greeting")
+
+    async def collect(message):
+        return [frame async for frame in gemini.generate_chat_response(message, [], {})]
+
+    monkeypatch.setattr(gemini, "get_client", no_gemini)
+
+    frames = asyncio.run(collect("Hey there!"))
+
+    assert frames == [gemini._frame({"message": gemini.GREETING_REPLY, "status": "Complete"})]
+    assert not gemini.GREETING_RE.match("hi, any concerts tonight?")
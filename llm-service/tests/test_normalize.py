@@ -0,0 +1,128 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.schemas import NormalizedEvent
+from app.services import gemini
+
+
+def test_normalize_endpoint_returns_validated_events(monkeypatch):
+    async def fake_normalize_events(raw_content, source_url, content_type="html"):
+        return [NormalizedEvent.model_validate({
+            "title": "Jazz Night",
+            "venue": "Cain's Ballroom",
+            "start_time": "2026-11-20T20:00:00",
+            "_venue_website": "https://www.cainsballroom.com",
+        })]
+
+    monkeypatch.setattr(gemini, "normalize_events", fake_normalize_events)
+    client = TestClient(app)
+    response = client.post("/api/normalize", json={
+        "raw_content": "[]",
+        "source_url": "https://www.cainsballroom.com",
+        "content_type": "json",
+    })
+
+    assert response.status_code == 200
+    events = response.json()["events"]
+    assert len(events) == 1
+    assert events[0]["title"] == "Jazz Night"
+    assert events[0]["start_time"] == "2026-11-20T20:00:00"
+    # Extra fields merged from the scraped input pass through untouched
+    assert events[0]["_venue_website"] == "https://www.cainsballroom.com"
+
+
+def test_clean_html_keeps_event_markup_and_drops_page_chrome():
+    html = (
+        '<html><head><script>track()</script><meta property="og:image" content="https://x/og.jpg"></head>'
+        '<body><nav><a href="/">Home</a></nav>'
+        '<div class="card" style="color:red"><h2>Jazz Night</h2>'
+        '<img src="/jazz.jpg" class="hero"><a href="/events/1" onclick="go()">Tickets</a></div>'
+        '<footer>Copyright</footer></body></html>'
+    )
+
+    cleaned = gemini._clean_html(html)
+
+    assert "track()" not in cleaned and "Home" not in cleaned and "Copyright" not in cleaned
+    assert 'property="og:image"' in cleaned
+    assert '<div><h2>Jazz Night</h2><img src="/jazz.jpg"/><a href="/events/1">Tickets</a></div>' in cleaned
+
+
+def test_clean_html_sends_only_jsonld_when_it_covers_the_event_cards():
+    html = (
+        '<html><head><title>Cain\'s</title><script type="application/ld+json">'
+        '{"@graph": [{"@type": "Organization", "name": "Cain\'s"},'
+        ' {"@type": "MusicEvent", "name": "Jazz Night", "startDate": "2026-11-20T20:00",'
+        ' "description": "A night of jazz."}]}'
+        '</script></head><body><p>Lots of other page text</p>'
+        '<article><h2>Jazz Night</h2></article></body></html>'
+    )
+
+    cleaned = gemini._clean_html(html)
+
+    assert '"name":"Jazz Night"' in cleaned
+    assert "Organization" not in cleaned
+    assert "other page text" not in cleaned
+
+
+def test_clean_html_keeps_cards_the_jsonld_does_not_cover():
+    cards = "".join(f'<div class="card"><h3>Show {i}</h3><p>Dec {i + 1}</p></div>' for i in range(20))
+    html = (
+        '<html><head><script type="application/ld+json">'
+        '{"@type": "Event", "name": "Featured", "startDate": "2026-11-20T20:00",'
+        ' "description": "Our featured show."}'
+        f'</script></head><body><main>{cards}</main></body></html>'
+    )
+
+    cleaned = gemini._clean_html(html)
+
+    assert '"name":"Featured"' in cleaned
+    assert all(f"<h3>Show {i}</h3>" in cleaned for i in range(20))
+
+
+def test_load_model_json_unwraps_fenced_or_prose_replies():
+    assert gemini._load_model_json('[{"title": "A"}]') == [{"title": "A"}]
+    assert gemini._load_model_json('```json\n[{"title": "A"}]\n```') == [{"title": "A"}]
+    assert gemini._load_model_json('Here are the events:\n[{"title": "A"}]') == [{"title": "A"}]
+
+
+def test_normalize_caps_concurrent_gemini_streams(monkeypatch):
+    active = []
+    peak = []
+
+    class FakeChunk:
+        text = '[{"title": "Jazz Night", "venue": "Cain\'s Ballroom", "start_time": "2026-11-20T20:00:00"}]'
+
+    class FakeModels:
+        async def generate_content_stream(self, **kwargs):
+            async def stream():
+                active.append(1)
+                peak.append(len(active))
+                await asyncio.sleep(0.01)
+                active.pop()
+                yield FakeChunk()
+            return stream()
+
+    class FakeClient:
+        class aio:
+            models = FakeModels()
+
+    async def no_venues():
+        return []
+
+    async def run():
+        gemini._normalize_slots = asyncio.Semaphore(2)
+        return await asyncio.gather(*(
+            gemini._normalize_events(f'[{{"title": "Show {i}"}}]', "https://example.com", "json")
+            for i in range(6)
+        ))
+
+    monkeypatch.setattr(gemini, "get_client", lambda: FakeClient())
+    monkeypatch.setattr(gemini, "get_venue_names", no_venues)
+    monkeypatch.setattr(gemini, "_normalize_slots", None)
+
+    results = asyncio.run(run())
+
+    assert all(len(events) == 1 for events in results)
+    assert max(peak) == 2
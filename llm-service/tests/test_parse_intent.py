@@ -0,0 +1,46 @@
+import asyncio
+
+from app.models.schemas import SearchParams
+from app.services import gemini
+
+
+def _no_gemini():
+    raise AssertionError("Gemini should not be called for a plain keyword query")
+
+
+def test_short_keyword_query_skips_gemini(monkeypatch):
+    monkeypatch.setattr(gemini, "get_client", _no_gemini)
+
+    assert asyncio.run(gemini.parse_user_intent(" Cain's Ballroom ")) == {"q": "Cain's Ballroom"}
+
+
+def test_filter_words_still_go_to_gemini():
+    assert not gemini._is_plain_keyword_query("concerts tonight")
+    assert not gemini._is_plain_keyword_query("music")
+    assert not gemini._is_plain_keyword_query("under $10")
+
+
+def test_repeated_query_is_parsed_once(monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        parsed = SearchParams(category="Music")
+
+    class FakeModels:
+        async def generate_content(self, **kwargs):
+            calls.append(kwargs)
+            return FakeResponse()
+
+    class FakeClient:
+        class aio:
+            models = FakeModels()
+
+    monkeypatch.setattr(gemini, "get_client", lambda: FakeClient())
+    monkeypatch.setattr(gemini, "_intent_cache", {})
+
+    first = asyncio.run(gemini.parse_user_intent("concerts tonight"))
+    first["q"] = "concerts tonight"  # the search route edits params in place
+    second = asyncio.run(gemini.parse_user_intent("Concerts  tonight"))
+
+    assert len(calls) == 1
+    assert second == SearchParams(category="Music").model_dump()
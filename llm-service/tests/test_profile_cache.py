@@ -0,0 +1,50 @@
+import asyncio
+
+from app.routes import chat
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, user_id):
+        self._user_id = user_id
+
+    def json(self):
+        return {"user": {"id": self._user_id, "email": "tully@locate918.com"}, "preferences": []}
+
+
+class FakeBackend:
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, url, headers=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return FakeResponse(headers["Authorization"])
+
+
+def test_profile_is_fetched_once_for_concurrent_turns(monkeypatch):
+    backend = FakeBackend()
+    monkeypatch.setattr(chat, "get_backend_client", lambda: backend)
+    monkeypatch.setattr(chat, "_profile_cache", {})
+
+    async def run():
+        return await asyncio.gather(*(chat.get_user_profile("u1", "Bearer a") for _ in range(5)))
+
+    profiles = asyncio.run(run())
+
+    assert backend.calls == 1
+    assert all(p["user"]["id"] == "Bearer a" for p in profiles)
+    assert chat._profile_locks == {}
+
+
+def test_profile_cache_is_keyed_by_auth_header(monkeypatch):
+    backend = FakeBackend()
+    monkeypatch.setattr(chat, "get_backend_client", lambda: backend)
+    monkeypatch.setattr(chat, "_profile_cache", {})
+
+    asyncio.run(chat.get_user_profile("u1", "Bearer a"))
+    other = asyncio.run(chat.get_user_profile("u1", "Bearer b"))
+
+    assert backend.calls == 2
+    assert other["user"]["id"] == "Bearer b"
@@ -0,0 +1,49 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routes import search
+from app.services import gemini
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, events):
+        self._events = events
+
+    def json(self):
+        return self._events
+
+
+class FakeBackend:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    async def get(self, path, params=None):
+        self.calls.append(params)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        # Only the bare keyword search finds anything
+        return FakeResponse([{"title": "Hanson"}] if params == {"q": "hanson"} else [])
+
+
+def test_keyword_fallback_runs_alongside_smart_search(monkeypatch):
+    async def fake_parse(query):
+        return {"q": "hanson", "category": None, "start_date": "2026-11-20", "end_date": None}
+
+    backend = FakeBackend()
+    monkeypatch.setattr(gemini, "parse_user_intent", fake_parse)
+    monkeypatch.setattr(search, "get_backend_client", lambda: backend)
+
+    response = TestClient(app).post("/api/search", json={"query": "hanson on nov 20", "useSmartSearch": True})
+
+    assert response.status_code == 200
+    assert response.json()["events"] == [{"title": "Hanson"}]
+    assert backend.max_in_flight == 2
+    assert len(backend.calls) == 2